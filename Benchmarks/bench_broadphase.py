@@ -0,0 +1,79 @@
+"""
+Compares the broadphases of PhysicsSystem at 100, 1k and 5k box colliders.
+Colliders are spread with constant density and jitter a little every tick,
+which is the case sweep and prune is built for.
+Running GJK on every all-pairs candidate at 5k colliders would take minutes per tick,
+so the narrow phase cost is estimated from the average cost of GJK on a sample of pairs.
+
+Run with: python -m MiniGames.Benchmarks.bench_broadphase
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import time
+import MiniGames as MG
+from MiniGames import App
+from MiniGames.Physics.gjk_implementation import are_colliding
+
+TICKS = 5
+COUNTS = (100, 1000, 5000)
+BROADPHASES = ("all_pairs", "spatial_hash", "sweep_and_prune")
+
+
+def make_scene(count: int):
+    half = (count ** 0.5) * 2.5
+    gos = []
+    for i in range(count):
+        go = MG.GameObject(f"bench_{i}")
+        go.transform.position = MG.Vector2(random.uniform(-half, half), random.uniform(-half, half))
+        go.add_component(MG.BoxCollider)
+        gos.append(go)
+    return gos
+
+
+def jitter(gos):
+    for go in gos:
+        pos = go.transform.position
+        go.transform.position = MG.Vector2(pos.x + random.uniform(-0.05, 0.05), pos.y + random.uniform(-0.05, 0.05))
+
+
+def gjk_cost(cols, samples: int = 2000) -> float:
+    pairs = [random.sample(cols, 2) for _ in range(samples)]
+    now = time.perf_counter()
+    for col1, col2 in pairs:
+        are_colliding(col1, col2)
+    return (time.perf_counter() - now) / samples
+
+
+def bench(physics, gos, broadphase: str):
+    MG.Settings.broadphase = broadphase
+    for _ in physics.loop_colliders(): pass  # warm up, lets persistent broadphases build their state
+
+    total, pairs = 0.0, 0
+    for _ in range(TICKS):
+        jitter(gos)
+        now = time.perf_counter()
+        for _ in physics.loop_colliders():
+            pairs += 1
+        total += time.perf_counter() - now
+    return total / TICKS, pairs // TICKS
+
+
+def main():
+    random.seed(0)
+    app = App.init()
+    physics = app._Application__phy_sym
+    print(f"{'colliders':>10} {'broadphase':>16} {'ms/tick':>10} {'pairs/tick':>12} {'est. with GJK ms':>17}")
+    for count in COUNTS:
+        gos = make_scene(count)
+        per_pair = gjk_cost(physics._cols)
+        for broadphase in BROADPHASES:
+            secs, pairs = bench(physics, gos, broadphase)
+            print(f"{count:>10} {broadphase:>16} {secs * 1000:>10.2f} {pairs:>12} {(secs + pairs * per_pair) * 1000:>17.2f}")
+        for col in list(physics._cols):
+            physics.rem_col(col)
+
+
+if __name__ == "__main__":
+    main()
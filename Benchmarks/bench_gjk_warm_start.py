@@ -0,0 +1,98 @@
+"""
+Average support points and time per candidate pair, with and without warm starting.
+1000 thin rotated box and circle colliders jitter a little every tick (their AABBs often overlap while the shapes don't),
+spatial hash candidates are tested with GJK starting from the center to center direction (cold), and the way
+PhysicsSystem does it (warm): pairs that were apart in the previous tick are first tested along the axis that
+separated them, with a single support point, and only go through GJK if that axis doesn't separate them anymore.
+Separated pairs are where it saves time, touching pairs pay for a lookup in the cache of axes.
+
+Run with: python -m MiniGames.Benchmarks.bench_gjk_warm_start
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import time
+import MiniGames as MG
+from MiniGames import App
+from MiniGames.Physics.gjk_implementation import gjk, separated_along
+from MiniGames.Physics.contacts import pair_key
+
+COUNT = 1000
+TICKS = 50
+
+
+def main():
+    random.seed(0)
+    App.init()
+    physics = MG.Info.physics
+    half = COUNT ** 0.5
+    gos = []
+    for i in range(COUNT):
+        go = MG.GameObject(f"bench_{i}")
+        go.transform.position = MG.Vector2(random.uniform(-half, half), random.uniform(-half, half))
+        go.transform.rotation = random.uniform(0, 180)
+        if i % 2:
+            go.add_component(MG.BoxCollider).size = MG.Vector2(3, 0.3)
+        else:
+            go.add_component(MG.CircleCollider)
+        gos.append(go)
+
+    axes = {}
+    cold_iterations, warm_iterations, tests, hits, mismatches = 0, 0, 0, 0, 0
+    cold_apart, warm_apart = 0, 0  # Support points computed for pairs that turned out to be separated
+    cold_time, warm_time = [0.0, 0.0], [0.0, 0.0]  # Spent on (separated, touching) pairs
+    for tick in range(TICKS + 1):
+        for go in gos:
+            pos = go.transform.position
+            go.transform.position = MG.Vector2(pos.x + random.uniform(-0.02, 0.02), pos.y + random.uniform(-0.02, 0.02))
+        pairs = list(physics.loop_colliders())
+
+        cold, cold_times = [], []
+        for col1, col2 in pairs:
+            now = time.perf_counter()
+            cold.append(gjk(col1, col2))
+            cold_times.append(time.perf_counter() - now)
+
+        warm, warm_times, tested_axes = [], [], {}
+        for col1, col2 in pairs:
+            now = time.perf_counter()
+            key = pair_key(col1, col2)
+            sign = -1 if col1._col_id > col2._col_id else 1
+            axis = axes.get(key)
+            if axis is not None and separated_along(col1, col2, axis[0] * sign, axis[1] * sign):
+                tested_axes[key] = axis
+                warm.append((False, None, 1, None))
+            else:
+                result = gjk(col1, col2)
+                if not result[0]: tested_axes[key] = (result[1].x * sign, result[1].y * sign)
+                warm.append(result)
+            warm_times.append(time.perf_counter() - now)
+        axes = tested_axes  # Like ContactTable, only the pairs tested in the tick are remembered
+
+        if tick == 0: continue  # Nothing to warm start from yet
+        for (cold_hit, *_), cold_spent, warm_spent in zip(cold, cold_times, warm_times):
+            cold_time[cold_hit] += cold_spent
+            warm_time[cold_hit] += warm_spent
+        tests += len(pairs)
+        for (cold_hit, _, cold_its, _), (warm_hit, _, warm_its, _) in zip(cold, warm):
+            cold_iterations += cold_its
+            warm_iterations += warm_its
+            hits += cold_hit
+            if not cold_hit:
+                cold_apart += cold_its
+                warm_apart += warm_its
+            mismatches += cold_hit != warm_hit
+
+    print(f"{COUNT} colliders, {tests // TICKS} candidate pairs per tick, {hits / tests:.0%} of them touching")
+    apart = tests - hits
+    print(f"{'':>6} {'supports / pair':>16} {'/ separated':>12} {'/ touching':>11} {'us / pair':>10} {'/ separated':>12} {'/ touching':>11}")
+    for name, iterations, apart_iterations, spent in (("cold", cold_iterations, cold_apart, cold_time),
+                                                      ("warm", warm_iterations, warm_apart, warm_time)):
+        print(f"{name:>6} {iterations / tests:>16.2f} {apart_iterations / apart:>12.2f} {(iterations - apart_iterations) / hits:>11.2f} "
+              f"{sum(spent) / tests * 1e6:>10.2f} {spent[0] / apart * 1e6:>12.2f} {spent[1] / hits * 1e6:>11.2f}")
+    print(f"results that differ: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
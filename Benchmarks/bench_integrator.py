@@ -0,0 +1,45 @@
+"""
+Integrates 10k free falling rigid bodies and reports the cost of one physics step,
+split between the vectorized integration and writing positions back to the transforms.
+
+Run with: python -m MiniGames.Benchmarks.bench_integrator
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import time
+import MiniGames as MG
+from MiniGames import App
+from MiniGames.Utils import settings_and_info as others
+
+BODIES = 10_000
+TICKS = 60
+
+
+def main():
+    App.init()
+    physics = MG.Info.physics
+    for i in range(BODIES):
+        go = MG.GameObject(f"body {i}")
+        go.transform.position = MG.Vector2((i % 100) * 0.5, (i // 100) * 0.5)
+        go.add_component(MG.RigidBody)
+    others.__fixedDeltaTime__ = 1 / 60
+
+    gravity = MG.Settings.gravity
+    integrate_time, write_time = 0.0, 0.0
+    for _ in range(TICKS):
+        now = time.perf_counter()
+        moved = physics.bodies.integrate(MG.Info.fixedDeltaTime, gravity.x, gravity.y)
+        integrate_time += time.perf_counter() - now
+        now = time.perf_counter()
+        physics.bodies.write_back(moved)
+        write_time += time.perf_counter() - now
+
+    print(f"{BODIES} bodies, {TICKS} ticks")
+    print(f"integrate:  {integrate_time / TICKS * 1000:8.3f} ms/tick")
+    print(f"write back: {write_time / TICKS * 1000:8.3f} ms/tick")
+    print(f"total:      {(integrate_time + write_time) / TICKS * 1000:8.3f} ms/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Cost of one narrow phase test between random pairs of overlapping or nearby rotated box and circle colliders:
+GJK (are_colliding), and the closed form tests of the dispatch table (narrowphase.collide), which also give the normal.
+Colliders cache their world geometry until their transform changes, "cold" rebuilds it for every pair,
+as if every collider had moved since it was last tested.
+
+Run with: python -m MiniGames.Benchmarks.bench_narrowphase
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import time
+import MiniGames as MG
+from MiniGames import App
+from MiniGames.Physics.gjk_implementation import are_colliding
+from MiniGames.Physics.narrowphase import collide
+
+COLLIDERS = 200
+PAIRS = 20_000
+
+
+def main():
+    random.seed(0)
+    App.init()
+    cols = []
+    for i in range(COLLIDERS):
+        go = MG.GameObject(f"bench_{i}")
+        go.transform.position = MG.Vector2(random.uniform(-3, 3), random.uniform(-3, 3))
+        go.transform.rotation = random.uniform(0, 360)
+        cols.append(go.add_component(MG.BoxCollider if i % 2 else MG.CircleCollider))
+    pairs = [tuple(random.sample(cols, 2)) for _ in range(PAIRS)]
+
+    for kinds in (("BoxCollider", "BoxCollider"), ("BoxCollider", "CircleCollider"), ("CircleCollider", "CircleCollider")):
+        subset = [p for p in pairs if sorted(type(c).__name__ for c in p) == list(kinds)]
+        now = time.perf_counter()
+        hits = sum(are_colliding(col1, col2) for col1, col2 in subset)
+        elapsed = time.perf_counter() - now
+        now = time.perf_counter()
+        for col1, col2 in subset:
+            collide(col1, col2)
+        closed_form = time.perf_counter() - now
+        print(f"{kinds[0]:>14} vs {kinds[1]:<14} {elapsed / len(subset) * 1e6:8.2f} us / pair, "
+              f"closed form {closed_form / len(subset) * 1e6:8.2f}  ({hits} of {len(subset)} colliding)")
+
+    now = time.perf_counter()
+    for col1, col2 in pairs:
+        are_colliding(col1, col2)
+    print(f"{'all':>32} {(time.perf_counter() - now) / PAIRS * 1e6:8.2f} us / pair")
+
+    now = time.perf_counter()
+    for col1, col2 in pairs:
+        col1._invalidate_bounds()
+        col2._invalidate_bounds()
+        are_colliding(col1, col2)
+    print(f"{'all, cold':>32} {(time.perf_counter() - now) / PAIRS * 1e6:8.2f} us / pair")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Support point of a PolygonCollider: hill climbing from the last support point against scanning every vertex,
+for directions that turn a little between calls (like GJK's) and for random ones.
+
+Run with: python -m MiniGames.Benchmarks.bench_polygon_support
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import math
+import random
+import time
+import MiniGames as MG
+from MiniGames import App
+
+CALLS = 100_000
+
+
+def scan(verts: list[tuple[float, float]], dx: float, dy: float) -> tuple[float, float]:
+    return max(verts, key=lambda p: p[0] * dx + p[1] * dy)
+
+
+def main():
+    random.seed(0)
+    App.init()
+    coherent = [(math.cos(k * 0.05), math.sin(k * 0.05)) for k in range(CALLS)]
+    scattered = [(random.uniform(-1, 1), random.uniform(-1, 1)) for _ in range(CALLS)]
+
+    print(f"{'vertices':>8} {'directions':>10} {'hill climbing':>14} {'scan':>8}  us / call")
+    for sides in (8, 32, 128):
+        go = MG.GameObject(f"polygon_{sides}")
+        col = go.add_component(MG.PolygonCollider)
+        col.vertices = [MG.Vector2(math.cos(2 * math.pi * k / sides), math.sin(2 * math.pi * k / sides)) for k in range(sides)]
+        verts = col._packed_geometry()[0]
+
+        for name, dirs in (("coherent", coherent), ("random", scattered)):
+            now = time.perf_counter()
+            for dx, dy in dirs:
+                col._support(dx, dy)
+            climb = time.perf_counter() - now
+            now = time.perf_counter()
+            for dx, dy in dirs:
+                scan(verts, dx, dy)
+            full = time.perf_counter() - now
+            print(f"{sides:>8} {name:>10} {climb / CALLS * 1e6:>14.3f} {full / CALLS * 1e6:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Calls update on 10k gameobjects that each have one MonoBehaviour with update,
+next to 10k gameobjects with nothing to call, and reports the cost of a frame.
+Only the gameobjects with something to call should cost anything.
+
+Run with: python -m MiniGames.Benchmarks.bench_update_dispatch
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import time
+import MiniGames as MG
+from MiniGames import App
+
+GAME_OBJECTS = 10_000
+FRAMES = 60
+
+
+class Counter(MG.MonoBehaviour):
+    def update(self):
+        self.frames = 0
+
+
+def frame_time(app) -> float:
+    app._update_game_objects()  # Applies the gameobjects scheduled since the last frame
+    now = time.perf_counter()
+    for _ in range(FRAMES):
+        app._update_game_objects()
+    return (time.perf_counter() - now) / FRAMES
+
+
+def main():
+    app = App.init()
+    gos = []
+    for i in range(GAME_OBJECTS):
+        go = MG.GameObject(f"updating {i}")
+        go.add_component(Counter)
+        gos.append(go)
+    for go in gos: go._on_go_start()
+    updating = frame_time(app)
+
+    for i in range(GAME_OBJECTS):
+        MG.GameObject(f"idle {i}")._on_go_start()
+    with_idle = frame_time(app)
+
+    print(f"{GAME_OBJECTS} gameobjects with update, {FRAMES} frames")
+    print(f"alone:                     {updating * 1000:8.3f} ms/frame")
+    print(f"next to {GAME_OBJECTS} idle ones: {with_idle * 1000:8.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Spawns and removes 100k colliders, one per tick, resting on a static ground collider.
+SLOTS gameobjects stand on the ground, each cycle removes the collider of one of them and gives it a new one,
+so the contact table always holds about SLOTS live contacts, and every spawned collider enters and exits a contact.
+Memory in use and the cost of a tick should stay flat, because collider ids are recycled, the contact table
+only holds live contacts and nothing queues changes for removed colliders. Exits with an error if memory grows
+by more than MAX_BYTES_PER_CYCLE per cycle after the first report.
+Colliders aren't drawn, the scheduler still has to apply the changes of their hidden renderers.
+
+Run with: python -m MiniGames.Benchmarks.soak_colliders
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import gc
+import sys
+import time
+import tracemalloc
+import MiniGames as MG
+from MiniGames import App
+
+CYCLES = 100_000
+REPORT_EVERY = 10_000
+SLOTS = 8
+MAX_BYTES_PER_CYCLE = 16
+
+
+def traced_memory() -> int:
+    gc.collect()  # Colliders and their renderers reference each other, only cycles that could be collected are left out
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main():
+    app = App.init()
+    MG.Settings.draw_colliders = False  # Renderers of undrawn colliders still go through the scheduler
+    physics = app._Application__phy_sym
+    ground = MG.GameObject("ground").add_component(MG.BoxCollider)
+    ground.size = MG.Vector2(2 * SLOTS + 2, 1)
+    slots, cols = [], []
+    for i in range(SLOTS):
+        go = MG.GameObject(f"slot {i}")
+        go.transform.position = MG.Vector2(2 * i - SLOTS + 1, 0.9)  # Overlaps the ground, not the other slots
+        slots.append(go)
+        cols.append(go.add_component(MG.BoxCollider))
+        go._on_go_start()  # Active, so its colliders go through the scheduler (renderers) like in a running game
+
+    tracemalloc.start()
+    print(f"{'cycles':>8} {'memory KB':>10} {'us/tick':>8} {'contacts':>9} {'max col id':>11}")
+    tick_time, max_id, first = 0.0, 0, None
+    for i in range(1, CYCLES + 1):
+        slot = i % SLOTS
+        cols[slot].remove()
+        cols[slot] = slots[slot].add_component(MG.BoxCollider)
+        max_id = max(max_id, cols[slot]._col_id)
+
+        now = time.perf_counter()
+        physics._detect_collisions()
+        app._update_game_objects()
+        tick_time += time.perf_counter() - now
+
+        if i % REPORT_EVERY == 0:
+            current = traced_memory()
+            if first is None: first = (i, current)
+            print(f"{i:>8} {current / 1024:>10.1f} {tick_time / REPORT_EVERY * 1e6:>8.1f} {len(physics.contacts):>9} {max_id:>11}")
+            tick_time = 0.0
+
+    start, memory = first
+    growth = (traced_memory() - memory) / (CYCLES - start)
+    print(f"memory growth after the first report: {growth:.1f} B/cycle (at most {MAX_BYTES_PER_CYCLE})")
+    if growth > MAX_BYTES_PER_CYCLE: sys.exit("Memory isn't flat, something keeps removed colliders alive")
+
+
+if __name__ == "__main__":
+    main()
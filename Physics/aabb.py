@@ -0,0 +1,60 @@
+from __future__ import annotations
+from MiniGames.Utils.type_checker import types_check, type_check_num
+from MiniGames.Utils.vector2 import Vector2
+
+
+class AABB:
+    """
+    Axis aligned bounding box in world space (units, not pixels).
+    Plain float fields, so broadphase and culling passes can test it without creating Vector2s.
+    """
+    __slots__ = ("min_x", "min_y", "max_x", "max_y")
+
+    def __init__(self, min_x: float, min_y: float, max_x: float, max_y: float):
+        self.min_x = min_x
+        self.min_y = min_y
+        self.max_x = max_x
+        self.max_y = max_y
+
+    def __repr__(self):
+        return f"AABB(({self.min_x}, {self.min_y}), ({self.max_x}, {self.max_y}))"
+
+    @property
+    def min(self) -> Vector2:
+        return Vector2(self.min_x, self.min_y)
+
+    @property
+    def max(self) -> Vector2:
+        return Vector2(self.max_x, self.max_y)
+
+    @property
+    def center(self) -> Vector2:
+        return Vector2((self.min_x + self.max_x) / 2, (self.min_y + self.max_y) / 2)
+
+    @property
+    def size(self) -> Vector2:
+        return Vector2(self.max_x - self.min_x, self.max_y - self.min_y)
+
+    @property
+    def perimeter(self) -> float:
+        return 2 * (self.max_x - self.min_x + self.max_y - self.min_y)
+
+    def overlaps(self, other: AABB) -> bool:
+        return self.min_x <= other.max_x and other.min_x <= self.max_x and \
+               self.min_y <= other.max_y and other.min_y <= self.max_y
+
+    def contains(self, other: AABB) -> bool:
+        return self.min_x <= other.min_x and self.min_y <= other.min_y and \
+               other.max_x <= self.max_x and other.max_y <= self.max_y
+
+    def contains_point(self, point: Vector2) -> bool:
+        types_check("point", point, Vector2)
+        return self.min_x <= point.x <= self.max_x and self.min_y <= point.y <= self.max_y
+
+    def union(self, other: AABB) -> AABB:
+        return AABB(min(self.min_x, other.min_x), min(self.min_y, other.min_y),
+                    max(self.max_x, other.max_x), max(self.max_y, other.max_y))
+
+    def expanded(self, margin: float) -> AABB:
+        type_check_num("margin", margin)
+        return AABB(self.min_x - margin, self.min_y - margin, self.max_x + margin, self.max_y + margin)
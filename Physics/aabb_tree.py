@@ -0,0 +1,266 @@
+from __future__ import annotations
+from MiniGames.Physics.aabb import AABB
+import heapq
+import itertools
+import typing
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+
+
+class _TreeNode:
+    __slots__ = ("aabb", "parent", "left", "right", "height", "col")
+
+    def __init__(self, aabb: AABB, col: ColliderBaseAnot = None):
+        self.aabb = aabb
+        self.parent: _TreeNode | None = None
+        self.left: _TreeNode | None = None
+        self.right: _TreeNode | None = None
+        self.height = 0
+        self.col = col
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.left is None
+
+
+def _slab(aabb: AABB, ox: float, oy: float, inv_dx: float, inv_dy: float, max_t: float) -> float | None:
+    """
+    :return: distance along the ray at which it enters :param aabb:, None if it misses it
+    """
+    t_min, t_max = 0.0, max_t
+    if inv_dx is None:
+        if ox < aabb.min_x or ox > aabb.max_x: return None
+    else:
+        t1, t2 = (aabb.min_x - ox) * inv_dx, (aabb.max_x - ox) * inv_dx
+        if t1 > t2: t1, t2 = t2, t1
+        t_min, t_max = max(t_min, t1), min(t_max, t2)
+        if t_min > t_max: return None
+
+    if inv_dy is None:
+        if oy < aabb.min_y or oy > aabb.max_y: return None
+    else:
+        t1, t2 = (aabb.min_y - oy) * inv_dy, (aabb.max_y - oy) * inv_dy
+        if t1 > t2: t1, t2 = t2, t1
+        t_min, t_max = max(t_min, t1), min(t_max, t2)
+        if t_min > t_max: return None
+    return t_min
+
+
+def _sqr_dist_to(aabb: AABB, px: float, py: float) -> float:
+    dx = max(aabb.min_x - px, 0.0, px - aabb.max_x)
+    dy = max(aabb.min_y - py, 0.0, py - aabb.max_y)
+    return dx * dx + dy * dy
+
+
+class AABBTree:
+    """
+    Dynamic bounding volume tree (same idea as Box2D's b2DynamicTree).
+    Leaves store fattened AABBs, so colliders that move a little don't have to be reinserted.
+    Insertion picks the sibling with the smallest perimeter increase, and every insert / remove
+    is followed by AVL style rotations, so the height of the tree stays O(log n).
+    """
+
+    def __init__(self, margin: float = 0.1):
+        self.__margin = margin
+        self.__root: _TreeNode | None = None
+
+    @property
+    def height(self) -> int:
+        return 0 if self.__root is None else self.__root.height
+
+    def insert(self, col: ColliderBaseAnot, aabb: AABB) -> _TreeNode:
+        leaf = _TreeNode(aabb.expanded(self.__margin), col)
+        self.__insert_leaf(leaf)
+        return leaf
+
+    def remove(self, leaf: _TreeNode):
+        self.__remove_leaf(leaf)
+
+    def move(self, leaf: _TreeNode, aabb: AABB) -> bool:
+        """
+        :return: True if the leaf had to be reinserted, False if :param aabb: still fits inside the fat AABB
+        """
+        if leaf.aabb.contains(aabb): return False
+        self.__remove_leaf(leaf)
+        leaf.aabb = aabb.expanded(self.__margin)
+        self.__insert_leaf(leaf)
+        return True
+
+    def query(self, aabb: AABB) -> typing.Iterable[ColliderBaseAnot]:
+        if self.__root is None: return
+        stack = [self.__root]
+        while stack:
+            node = stack.pop()
+            if not node.aabb.overlaps(aabb): continue
+            if node.is_leaf:
+                yield node.col
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+
+    def raycast(self, ox: float, oy: float, dx: float, dy: float, max_t: float) -> typing.Iterable[tuple[float, ColliderBaseAnot]]:
+        """
+        :return: (t_enter, collider) for every leaf the ray passes through, ordered by t_enter.
+        The caller can stop iterating as soon as t_enter is further than the best exact hit
+        """
+        if self.__root is None: return
+        inv_dx = None if dx == 0 else 1 / dx
+        inv_dy = None if dy == 0 else 1 / dy
+        t = _slab(self.__root.aabb, ox, oy, inv_dx, inv_dy, max_t)
+        if t is None: return
+
+        counter = itertools.count()
+        heap = [(t, next(counter), self.__root)]
+        while heap:
+            t, _, node = heapq.heappop(heap)
+            if node.is_leaf:
+                yield t, node.col
+                continue
+            for child in (node.left, node.right):
+                ct = _slab(child.aabb, ox, oy, inv_dx, inv_dy, max_t)
+                if ct is not None:
+                    heapq.heappush(heap, (ct, next(counter), child))
+
+    def nearest(self, px: float, py: float, max_distance: float,
+                distance_func: typing.Callable[[ColliderBaseAnot], float]) -> tuple[ColliderBaseAnot | None, float]:
+        """
+        Best first search. Nodes are visited in order of the distance to their AABB,
+        and exact distances (:param distance_func:) are only computed for leaves that could still beat the best one.
+        """
+        best, best_dist = None, max_distance
+        if self.__root is None: return best, best_dist
+
+        counter = itertools.count()
+        heap = [(_sqr_dist_to(self.__root.aabb, px, py), next(counter), self.__root)]
+        while heap:
+            sqr_dist, _, node = heapq.heappop(heap)
+            if sqr_dist > best_dist * best_dist: break
+            if node.is_leaf:
+                dist = distance_func(node.col)
+                if dist < best_dist:
+                    best, best_dist = node.col, dist
+                continue
+            for child in (node.left, node.right):
+                heapq.heappush(heap, (_sqr_dist_to(child.aabb, px, py), next(counter), child))
+        return best, best_dist
+
+    def __insert_leaf(self, leaf: _TreeNode):
+        if self.__root is None:
+            self.__root = leaf
+            leaf.parent = None
+            return
+
+        leaf_aabb = leaf.aabb
+        node = self.__root
+        while not node.is_leaf:
+            perimeter = node.aabb.perimeter
+            combined = node.aabb.union(leaf_aabb).perimeter
+            cost = 2 * combined
+            inheritance = 2 * (combined - perimeter)
+
+            left, right = node.left, node.right
+            cost_left = left.aabb.union(leaf_aabb).perimeter + inheritance
+            if not left.is_leaf: cost_left -= left.aabb.perimeter
+            cost_right = right.aabb.union(leaf_aabb).perimeter + inheritance
+            if not right.is_leaf: cost_right -= right.aabb.perimeter
+
+            if cost < cost_left and cost < cost_right: break
+            node = left if cost_left < cost_right else right
+
+        sibling = node
+        old_parent = sibling.parent
+        new_parent = _TreeNode(sibling.aabb.union(leaf_aabb))
+        new_parent.parent = old_parent
+        new_parent.height = sibling.height + 1
+        if old_parent is None:
+            self.__root = new_parent
+        elif old_parent.left is sibling:
+            old_parent.left = new_parent
+        else:
+            old_parent.right = new_parent
+
+        new_parent.left, new_parent.right = sibling, leaf
+        sibling.parent = leaf.parent = new_parent
+        self.__fix_upwards(new_parent)
+
+    def __remove_leaf(self, leaf: _TreeNode):
+        if leaf is self.__root:
+            self.__root = None
+            return
+
+        parent = leaf.parent
+        grand_parent = parent.parent
+        sibling = parent.left if parent.right is leaf else parent.right
+        leaf.parent = None
+
+        if grand_parent is None:
+            self.__root = sibling
+            sibling.parent = None
+            return
+
+        if grand_parent.left is parent:
+            grand_parent.left = sibling
+        else:
+            grand_parent.right = sibling
+        sibling.parent = grand_parent
+        self.__fix_upwards(grand_parent)
+
+    def __fix_upwards(self, node: _TreeNode | None):
+        while node is not None:
+            node = self.__balance(node)
+            left, right = node.left, node.right
+            node.height = 1 + max(left.height, right.height)
+            node.aabb = left.aabb.union(right.aabb)
+            node = node.parent
+
+    def __replace_child(self, parent: _TreeNode | None, old: _TreeNode, new: _TreeNode):
+        if parent is None:
+            self.__root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def __balance(self, a: _TreeNode) -> _TreeNode:
+        """
+        If one subtree of :param a: is more than one level higher than the other, rotates it up.
+        :return: the node that took the place of :param a:
+        """
+        if a.is_leaf or a.height < 2: return a
+        b, c = a.left, a.right
+        balance = c.height - b.height
+
+        if balance > 1:
+            f, g = c.left, c.right
+            c.left = a
+            c.parent = a.parent
+            a.parent = c
+            self.__replace_child(c.parent, a, c)
+            if f.height > g.height:
+                c.right, a.right, g.parent = f, g, a
+                a.aabb, a.height = b.aabb.union(g.aabb), 1 + max(b.height, g.height)
+                c.aabb, c.height = a.aabb.union(f.aabb), 1 + max(a.height, f.height)
+            else:
+                c.right, a.right, f.parent = g, f, a
+                a.aabb, a.height = b.aabb.union(f.aabb), 1 + max(b.height, f.height)
+                c.aabb, c.height = a.aabb.union(g.aabb), 1 + max(a.height, g.height)
+            return c
+
+        if balance < -1:
+            d, e = b.left, b.right
+            b.left = a
+            b.parent = a.parent
+            a.parent = b
+            self.__replace_child(b.parent, a, b)
+            if d.height > e.height:
+                b.right, a.left, e.parent = d, e, a
+                a.aabb, a.height = c.aabb.union(e.aabb), 1 + max(c.height, e.height)
+                b.aabb, b.height = a.aabb.union(d.aabb), 1 + max(a.height, d.height)
+            else:
+                b.right, a.left, d.parent = e, d, a
+                a.aabb, a.height = c.aabb.union(d.aabb), 1 + max(c.height, d.height)
+                b.aabb, b.height = a.aabb.union(e.aabb), 1 + max(a.height, e.height)
+            return b
+        return a
@@ -0,0 +1,209 @@
+from __future__ import annotations
+import numpy as np
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Physics.rigidbody import RigidBody as RigidBodyAnot
+
+DEFAULT_FRICTION = 0.4
+
+
+class BodyStore:
+    """
+    Structure of arrays holding the simulation state of every RigidBody.
+    Each RigidBody owns one row for its whole life (rows of removed bodies are recycled),
+    so the whole world can be integrated with a handful of NumPy operations per tick.
+    Growing replaces every array, so it happens under self.lock, which PhysicsSystem.step holds for the whole step.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.pos = np.zeros((capacity, 2))
+        self.synced = np.zeros((capacity, 2))  # Positions as of the last write back, transforms of bodies read them from here
+        self.vel = np.zeros((capacity, 2))
+        self.force = np.zeros((capacity, 2))
+        self.mass = np.ones(capacity)
+        self.inv_mass = np.ones(capacity)
+        self.gravity_scale = np.ones(capacity)
+        self.restitution = np.zeros(capacity)
+        self.friction = np.full(capacity, DEFAULT_FRICTION)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.awake = np.ones(capacity, dtype=bool)
+        self.can_sleep = np.ones(capacity, dtype=bool)
+        self.continuous = np.zeros(capacity, dtype=bool)  # Swept for collisions along the way, see PhysicsSystem
+        self.sleep_time = np.zeros(capacity)  # How long the body has been slower than Settings.sleep_velocity
+        self.displaced = np.zeros(capacity, dtype=bool)  # Moved outside of integration, must be written back
+        self.notify = np.zeros(capacity, dtype=bool)  # The transform must be told when the body moves (colliders, children...)
+        self.bodies: list[RigidBodyAnot | None] = [None] * capacity
+        self.__free: list[int] = list(range(capacity - 1, -1, -1))
+        self.lock = threading.RLock()  # Reentrant, bodies can be added by code the step calls (fixed_update, collision events)
+
+    def __len__(self):
+        return len(self.bodies) - len(self.__free)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.bodies)
+
+    def __grow(self):
+        old = self.capacity
+        new = old * 2
+        for name in ("pos", "synced", "vel", "force"):
+            arr = np.zeros((new, 2))
+            arr[:old] = getattr(self, name)
+            setattr(self, name, arr)
+        for name, fill in (("mass", 1.0), ("inv_mass", 1.0), ("gravity_scale", 1.0), ("restitution", 0.0), ("friction", DEFAULT_FRICTION)):
+            arr = np.full(new, fill)
+            arr[:old] = getattr(self, name)
+            setattr(self, name, arr)
+        for name, fill in (("active", False), ("awake", True), ("can_sleep", True), ("continuous", False), ("displaced", False), ("notify", False)):
+            arr = np.full(new, fill, dtype=bool)
+            arr[:old] = getattr(self, name)
+            setattr(self, name, arr)
+        sleep_time = np.zeros(new)
+        sleep_time[:old] = self.sleep_time
+        self.sleep_time = sleep_time
+        self.bodies.extend([None] * old)
+        self.__free.extend(range(new - 1, old - 1, -1))
+
+    def add(self, body: RigidBodyAnot, x: float, y: float) -> int:
+        if not self.__free:
+            with self.lock:
+                self.__grow()
+        index = self.__free.pop()
+        self.bodies[index] = body
+        self.pos[index] = self.synced[index] = (x, y)
+        self.vel[index] = 0
+        self.force[index] = 0
+        self.mass[index] = self.inv_mass[index] = self.gravity_scale[index] = 1
+        self.restitution[index] = 0
+        self.friction[index] = DEFAULT_FRICTION
+        self.active[index] = False
+        self.awake[index] = self.can_sleep[index] = True
+        self.continuous[index] = self.displaced[index] = self.notify[index] = False
+        self.sleep_time[index] = 0
+        return index
+
+    def remove(self, index: int):
+        self.bodies[index] = None
+        self.active[index] = False
+        self.__free.append(index)
+
+    def set_mass(self, index: int, mass: float):
+        self.mass[index] = mass
+        self.inv_mass[index] = 1 / mass
+
+    def displace(self, index: int, dx: float, dy: float):
+        """
+        Moves the body by (:param dx:, :param dy:), its transform is updated with the next write back
+        """
+        self.pos[index, 0] += dx
+        self.pos[index, 1] += dy
+        self.displaced[index] = True
+
+    def wake(self, index: int):
+        self.awake[index] = True
+        self.sleep_time[index] = 0
+
+    def sleep(self, index: int):
+        self.awake[index] = False
+        self.vel[index] = 0
+        self.force[index] = 0
+        self.sleep_time[index] = np.inf  # Stays asleep until something wakes its island
+
+    @property
+    def awake_count(self) -> int:
+        return int(np.count_nonzero(self.active & self.awake))
+
+    @property
+    def sleeping_count(self) -> int:
+        return int(np.count_nonzero(self.active & ~self.awake))
+
+    def integrate_velocities(self, dt: float, gx: float, gy: float):
+        """
+        Applies forces and gravity to the velocity of every active body that is awake. Forces are cleared afterwards.
+        """
+        active = self.active & self.awake
+        acc = self.force * self.inv_mass[:, None]
+        acc[:, 0] += self.gravity_scale * gx
+        acc[:, 1] += self.gravity_scale * gy
+        acc[~active] = 0
+        self.vel += acc * dt
+        self.force[:] = 0
+
+    def integrate_positions(self, dt: float) -> np.ndarray:
+        """
+        :return: indices of the bodies that moved (in this step, or by displace since the last one)
+        """
+        n = self.capacity
+        active = self.active & self.awake
+        stepped = np.flatnonzero(active & np.any(self.vel[:n] != 0, axis=1))
+        self.pos[stepped] += self.vel[stepped] * dt
+
+        self.displaced[stepped] = True
+        moved = np.flatnonzero(self.displaced & self.active)
+        self.displaced[:] = False
+        return moved
+
+    def integrate(self, dt: float, gx: float, gy: float) -> np.ndarray:
+        """
+        Semi-implicit Euler step for every active body that is awake (without contacts, see PhysicsSystem.step).
+        :return: indices of the bodies that moved
+        """
+        self.integrate_velocities(dt, gx, gy)
+        return self.integrate_positions(dt)
+
+    def update_sleeping(self, dt: float, sleep_velocity: float, time_to_sleep: float, touching: list[tuple[int, int]]):
+        """
+        Bodies touching each other (:param touching: pairs of rows) form an island, which sleeps and wakes as a whole:
+        it falls asleep once every body in it has been slower than :param sleep_velocity: for :param time_to_sleep:,
+        and a single awake body that is still moving wakes every sleeping body in its island.
+        """
+        n = self.capacity
+        moving = self.active & self.awake
+        speed = np.einsum("ij,ij->i", self.vel, self.vel)
+        slow = (speed <= sleep_velocity * sleep_velocity) & self.can_sleep
+        self.sleep_time[moving] = np.where(slow[moving], self.sleep_time[moving] + dt, 0)
+
+        labels = np.arange(n)
+        if touching:
+            parent: dict[int, int] = {}
+
+            def find(i: int) -> int:
+                root = i
+                while parent.get(root, root) != root:
+                    root = parent[root]
+                while i != root:
+                    parent[i], i = root, parent[i]
+                return root
+
+            for i, j in touching:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[ri] = rj
+            members = list(parent)
+            labels[members] = [find(i) for i in members]
+
+        island_time = np.full(n, np.inf)
+        rows = np.flatnonzero(self.active)
+        np.minimum.at(island_time, labels[rows], self.sleep_time[rows])
+        resting = self.active & (island_time[labels] >= time_to_sleep)
+
+        falling_asleep = resting & self.awake
+        self.awake[falling_asleep] = False
+        self.vel[falling_asleep] = 0
+        self.force[falling_asleep] = 0
+
+        waking = self.active & ~resting & ~self.awake
+        self.awake[waking] = True
+        self.sleep_time[waking] = 0
+
+    def write_back(self, moved: np.ndarray):
+        """
+        Publishes the positions of :param moved: bodies to their transforms, which read them from self.synced.
+        Only the transforms that are listened to (see notify) are called, one by one.
+        """
+        self.synced[moved] = self.pos[moved]
+        bodies = self.bodies
+        for index in moved[self.notify[moved]].tolist():
+            bodies[index].transform._body_moved()
@@ -2,10 +2,12 @@ from __future__ import annotations
 from MiniGames.Utils.type_checker import types_check
 from typing import TYPE_CHECKING
 from MiniGames.Physics.collider_base import ColliderBase
+from MiniGames.Physics.aabb import AABB
 from MiniGames.Utils.vector2 import Vector2
 from MiniGames.Utils.settings_and_info import Settings
 from MiniGames.Renderers.collider_renderer import ColliderRenderer
 from MiniGames.Renderers.shapes import ShapeBox
+import math
 
 if TYPE_CHECKING:
     from MiniGames.Pipeline.gameobject import GameObject
@@ -18,6 +20,7 @@ class BoxCollider(ColliderBase):
         self.__shape = ShapeBox(Vector2.one(), Settings.colliders_thickness)
         self.__renderer = ColliderRenderer(self, self.__shape, self.transform)
         go._set_to("hidden_rend", self.__renderer)
+        self.__world: tuple | None = None  # (center x, center y, corners, cos, sin, half width, half height), cached until the transform or the shape changes
 
     @property
     def center_offset(self) -> Vector2:
@@ -28,6 +31,7 @@ class BoxCollider(ColliderBase):
         types_check("center_offset", value, Vector2)
         self.__center_off = value
         self.__shape._recalculate_scale()
+        self._invalidate_bounds()
 
     @property
     def size(self) -> Vector2:
@@ -37,39 +41,69 @@ class BoxCollider(ColliderBase):
     def size(self, value: Vector2):
         types_check("size", value, Vector2)
         self.__shape.size = value
+        self._invalidate_bounds()
+
+    def remove(self) -> None:
+        self.__renderer._detach()
+        self.gameobject._remove_from("hidden_rend", self.__renderer)
+        super(BoxCollider, self).remove()
+
+    def _invalidate_bounds(self):
+        self.__world = None
+        super(BoxCollider, self)._invalidate_bounds()
+
+    def __world_geometry(self) -> tuple:
+        world = self.__world
+        if world is not None: return world
+
+        trans = self.transform
+        theta = math.radians(trans.rotation)
+        cos, sin = math.cos(theta), math.sin(theta)
+        scale, pos, off, size = trans.lossy_scale, trans.position, self.__center_off, self.__shape.size
+        cx = (cos * off.x - sin * off.y) * scale.x + pos.x
+        cy = (sin * off.x + cos * off.y) * scale.y + pos.y
+        hx, hy = size.x * scale.x / 2, size.y * scale.y / 2
+        corners = tuple((cx + cos * x - sin * y, cy + sin * x + cos * y) for x, y in ((hx, hy), (-hx, hy), (-hx, -hy), (hx, -hy)))
+        world = self.__world = (cx, cy, corners, cos, sin, abs(hx), abs(hy))
+        return world
 
     def get_center_offset(self) -> Vector2:
         return self.__center_off
 
     def get_center(self) -> Vector2:
-        trans = self.transform
-        off = self.__center_off.rotate(trans.rotation) * trans.lossy_scale
-        return off + trans.position
+        cx, cy = self.__world_geometry()[:2]
+        return Vector2._unchecked(cx, cy)
+
+    def _center(self) -> tuple[float, float]:
+        cx, cy = self.__world_geometry()[:2]
+        return cx, cy
+
+    def _oriented_box(self) -> tuple[float, float, float, float, float, float]:
+        """
+        :return: (center x, center y, cos, sin, half width, half height) of the box in world space,
+        its axes are (cos, sin) and (-sin, cos)
+        """
+        cx, cy, _, cos, sin, hx, hy = self.__world_geometry()
+        return cx, cy, cos, sin, hx, hy
+
+    def _compute_bounds(self) -> AABB:
+        xs, ys = zip(*self.__world_geometry()[2])
+        return AABB(min(xs), min(ys), max(xs), max(ys))
+
+    def _packed_geometry(self) -> tuple[list[tuple[float, float]], float]:
+        return list(self.__world_geometry()[2]), 0.0
+
+    def _support(self, dx: float, dy: float) -> tuple[float, float]:
+        (x1, y1), (x2, y2), (x3, y3), (x4, y4) = self.__world_geometry()[2]
+        best, d = (x1, y1), x1 * dx + y1 * dy
+        dot = x2 * dx + y2 * dy
+        if dot > d: best, d = (x2, y2), dot
+        dot = x3 * dx + y3 * dy
+        if dot > d: best, d = (x3, y3), dot
+        if x4 * dx + y4 * dy > d: best = (x4, y4)
+        return best
 
     def furthest_point(self, direction: Vector2) -> Vector2:
         types_check("direction", direction, Vector2)
-        trans = self.transform
-        rot = trans.rotation
-        scale = trans.lossy_scale
-        dire = direction.rotate(-rot)
-
-        size = self.size / 2
-        cent = self.get_center()
-        p2 = (cent + size) * scale
-        p1 = (cent - size) * scale
-        size.y = -size.y
-        p3 = (cent + size) * scale
-        p4 = (cent - size) * scale
-        p1d = p1.dot(dire)
-        p2d = p2.dot(dire)
-        p3d = p3.dot(dire)
-        p4d = p4.dot(dire)
-        mx = max(p1d, p2d, p3d, p4d)
-        if mx == p1d:
-            return p1.rotate(rot)
-        if mx == p2d:
-            return p2.rotate(rot)
-        if mx == p3d:
-            return p3.rotate(rot)
-        if mx == p4d:
-            return p4.rotate(rot)
+        x, y = self._support(direction.x, direction.y)
+        return Vector2._unchecked(x, y)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+from MiniGames.Utils import settings_and_info as others
+import math
+import typing
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+
+
+class BroadPhaseBase:
+    """
+    Decides which collider pairs are worth sending to the narrow phase (GJK).
+    Pairs on layers that can't collide (see Settings.set_layers_collision) are dropped before their bounds are tested.
+    PhysicsSystem calls add / remove whenever its collider list changes,
+    pairs once per tick, and pairs_with for colliders that are added while the tick is running.
+    """
+
+    def add(self, col: ColliderBaseAnot):
+        pass
+
+    def remove(self, col: ColliderBaseAnot):
+        pass
+
+    def pairs(self, cols: list[ColliderBaseAnot]) -> typing.Iterable[tuple[ColliderBaseAnot, ColliderBaseAnot]]:
+        raise NotImplementedError()
+
+    def pairs_with(self, col: ColliderBaseAnot, cols: list[ColliderBaseAnot]) -> typing.Iterable[tuple[ColliderBaseAnot, ColliderBaseAnot]]:
+        """
+        :return: candidate pairs between :param col: and the colliders already looped in this tick (:param cols:)
+        """
+        raise NotImplementedError()
+
+
+class AllPairsBroadPhase(BroadPhaseBase):
+    def pairs(self, cols):
+        masks = others.__layer_masks__
+        col_len = len(cols)
+        for i in range(col_len - 1):
+            coli = cols[i]
+            mask = masks[coli.layer]
+            for j in range(i + 1, col_len):
+                colj = cols[j]
+                if mask & colj._layer_bit:
+                    yield coli, colj
+
+    def pairs_with(self, col, cols):
+        mask = others.__layer_masks__[col.layer]
+        for other in cols:
+            if mask & other._layer_bit:
+                yield other, col
+
+
+class SpatialHashBroadPhase(BroadPhaseBase):
+    """
+    Uniform grid, rebuilt every tick. Each collider is bucketed into every cell its AABB touches,
+    and only colliders that share a cell (and whose AABBs overlap) are paired.
+    """
+
+    def __init__(self, cell_size: float):
+        self.__cell_size = cell_size
+        self.__inv_cell = 1 / cell_size
+        self.__cells: dict[tuple[int, int], list[ColliderBaseAnot]] = {}
+
+    @property
+    def cell_size(self) -> float:
+        return self.__cell_size
+
+    def pairs(self, cols):
+        self.__cells = {}
+        for col in cols:
+            yield from self.pairs_with(col, cols)
+
+    def pairs_with(self, col, cols):
+        inv = self.__inv_cell
+        cells = self.__cells
+        box = col.bounds
+        mask = others.__layer_masks__[col.layer]
+        seen = set()
+
+        for cx in range(math.floor(box.min_x * inv), math.floor(box.max_x * inv) + 1):
+            for cy in range(math.floor(box.min_y * inv), math.floor(box.max_y * inv) + 1):
+                key = (cx, cy)
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [col]
+                    continue
+
+                for other in bucket:
+                    if other in seen: continue
+                    seen.add(other)
+                    if mask & other._layer_bit and box.overlaps(other.bounds):
+                        yield other, col
+                bucket.append(col)
+
+
+class _SapEndpoint:
+    __slots__ = ("value", "proxy", "is_min")
+
+    def __init__(self, proxy: _SapProxy, is_min: bool):
+        self.value = 0.0
+        self.proxy = proxy
+        self.is_min = is_min
+
+
+class _SapProxy:
+    __slots__ = ("col", "aabb", "min_ep", "max_ep")
+
+    def __init__(self, col: ColliderBaseAnot):
+        self.col = col
+        self.aabb = None
+        self.min_ep = _SapEndpoint(self, True)
+        self.max_ep = _SapEndpoint(self, False)
+
+    def refresh(self):
+        aabb = self.col.bounds
+        if aabb is self.aabb: return
+        self.aabb = aabb
+        self.min_ep.value = aabb.min_x
+        self.max_ep.value = aabb.max_x
+
+
+class SweepAndPruneBroadPhase(BroadPhaseBase):
+    """
+    Persistent sweep and prune. Endpoints of every AABB on the x axis are kept sorted across ticks,
+    so when bodies move only a little, the insertion sort at the start of every tick is close to O(n).
+    The sweep pairs colliders whose x intervals overlap, and checks the y intervals before yielding.
+    """
+
+    def __init__(self):
+        self.__proxies: dict[ColliderBaseAnot, _SapProxy] = {}
+        self.__xs: list[_SapEndpoint] = []
+
+    def add(self, col):
+        if col in self.__proxies: return
+        proxy = _SapProxy(col)
+        proxy.refresh()
+        self.__proxies[col] = proxy
+        self.__xs.append(proxy.min_ep)
+        self.__xs.append(proxy.max_ep)
+
+    def remove(self, col):
+        proxy = self.__proxies.pop(col, None)
+        if proxy is None: return
+        self.__xs.remove(proxy.min_ep)
+        self.__xs.remove(proxy.max_ep)
+
+    def __insertion_sort(self):
+        xs = self.__xs
+        for i in range(1, len(xs)):
+            ep = xs[i]
+            value = ep.value
+            j = i - 1
+            while j >= 0:
+                prev = xs[j]
+                # On ties min endpoints go first, so that touching intervals are still paired
+                if prev.value < value or (prev.value == value and (prev.is_min or not ep.is_min)): break
+                xs[j + 1] = prev
+                j -= 1
+            xs[j + 1] = ep
+
+    def pairs(self, cols):
+        for proxy in self.__proxies.values():
+            proxy.refresh()
+        self.__insertion_sort()
+
+        masks = others.__layer_masks__
+        active: dict[_SapProxy, None] = {}
+        for ep in self.__xs:
+            proxy = ep.proxy
+            if not ep.is_min:
+                del active[proxy]
+                continue
+
+            box = proxy.aabb
+            col = proxy.col
+            mask = masks[col.layer]
+            for other in active:
+                if not mask & other.col._layer_bit: continue
+                obox = other.aabb
+                if box.min_y <= obox.max_y and obox.min_y <= box.max_y:
+                    yield other.col, col
+            active[proxy] = None
+
+    def pairs_with(self, col, cols):
+        box = col.bounds
+        mask = others.__layer_masks__[col.layer]
+        for other in cols:
+            if not mask & other._layer_bit: continue
+            proxy = self.__proxies.get(other)
+            if proxy is not None and box.overlaps(proxy.aabb):
+                yield other, col
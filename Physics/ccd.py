@@ -0,0 +1,71 @@
+from __future__ import annotations
+from MiniGames.Physics.gjk_implementation import closest_distance
+from MiniGames.Physics.aabb import AABB
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+
+CCD_TOLERANCE = 1e-3  # Shapes closer than this are touching, continuous bodies are stopped about this far from what they hit
+CCD_MAX_ITERATIONS = 20
+
+
+class _Moved:
+    """
+    A collider seen moved by (dx, dy), without touching its transform. Only has what closest_distance needs.
+    """
+    __slots__ = ("col", "dx", "dy")
+
+    def __init__(self, col: ColliderBaseAnot):
+        self.col = col
+        self.dx = self.dy = 0.0
+
+    def _support(self, x: float, y: float) -> tuple[float, float]:
+        px, py = self.col._support(x, y)
+        return px + self.dx, py + self.dy
+
+    def _center(self) -> tuple[float, float]:
+        cx, cy = self.col._center()
+        return cx + self.dx, cy + self.dy
+
+
+def swept_bounds(bounds: AABB, dx: float, dy: float) -> AABB:
+    """
+    :return: AABB of everything :param bounds: covers while moving by (:param dx:, :param dy:)
+    """
+    return AABB(bounds.min_x + min(dx, 0), bounds.min_y + min(dy, 0), bounds.max_x + max(dx, 0), bounds.max_y + max(dy, 0))
+
+
+def time_of_impact(col1: ColliderBaseAnot, col2: ColliderBaseAnot, dx: float, dy: float) -> tuple[float, float, float] | None:
+    """
+    Conservative advancement: moves :param col1: towards :param col2: by the distance between them
+    divided by how fast that distance shrinks, which can never step past the first contact, since the distance
+    between two convex shapes moving in a straight line is convex in time.
+    :param dx: movement of :param col1: relative to :param col2: during the step, in x
+    :param dy: same as dx, in y
+    :return: (fraction of the step at which they touch, normal x, normal y, from col1 towards col2),
+    None if they don't touch during the step, or already overlap at its start (the narrow phase deals with those)
+    """
+    moved = _Moved(col1)
+    t = 0.0
+    nx = ny = 0.0
+    for _ in range(CCD_MAX_ITERATIONS):
+        moved.dx, moved.dy = dx * t, dy * t
+        dist, v = closest_distance(moved, col2)
+        if dist == 0:
+            if t == 0: return None
+            return t, nx, ny
+
+        # v is rounded, dividing it by the unrounded dist would give a longer than unit normal near contact
+        length = math.hypot(v.x, v.y)
+        if length == 0:
+            if t == 0: return None
+            return t, nx, ny
+        nx, ny = -v.x / length, -v.y / length
+        closing = dx * nx + dy * ny
+        if closing <= 0: return None  # Moving away
+        if dist <= CCD_TOLERANCE: return t, nx, ny
+        t += (dist - CCD_TOLERANCE / 2) / closing
+        if t >= 1: return None
+    return t, nx, ny
@@ -6,6 +6,7 @@ from MiniGames.Pipeline.gameobject import GameObject
 from MiniGames.Utils.settings_and_info import Settings
 from MiniGames.Renderers.collider_renderer import ColliderRenderer
 from MiniGames.Renderers.shapes import ShapeCircle
+import math
 
 
 class CircleCollider(ColliderBase):
@@ -15,6 +16,7 @@ class CircleCollider(ColliderBase):
         self.__shape = ShapeCircle(1, Settings.colliders_thickness)
         self.__renderer = ColliderRenderer(self, self.__shape, self.transform)
         go._set_to("hidden_rend", self.__renderer)
+        self.__world: tuple | None = None  # (center x, center y, radius, cos, sin, scale x, scale y), cached until the transform or the shape changes
 
     @property
     def center_offset(self) -> Vector2: return self.__center_off
@@ -24,6 +26,7 @@ class CircleCollider(ColliderBase):
         types_check("center_offset", value, Vector2)
         self.__center_off = value
         self.__shape._recalculate_pos()
+        self._invalidate_bounds()
 
     @property
     def radius(self) -> float: return self.__shape.radius
@@ -32,20 +35,66 @@ class CircleCollider(ColliderBase):
     def radius(self, value: float):
         type_check_num("radius", value)
         self.__shape.radius = value
+        self._invalidate_bounds()
+
+    def remove(self) -> None:
+        self.__renderer._detach()
+        self.gameobject._remove_from("hidden_rend", self.__renderer)
+        super(CircleCollider, self).remove()
+
+    def _invalidate_bounds(self):
+        self.__world = None
+        super(CircleCollider, self)._invalidate_bounds()
+
+    def __world_geometry(self) -> tuple:
+        world = self.__world
+        if world is not None: return world
+
+        trans = self.transform
+        theta = math.radians(trans.rotation)
+        cos, sin = math.cos(theta), math.sin(theta)
+        scale, pos, off = trans.lossy_scale, trans.position, self.__center_off
+        cx = (cos * off.x - sin * off.y) * scale.x + pos.x
+        cy = (sin * off.x + cos * off.y) * scale.y + pos.y
+        world = self.__world = (cx, cy, self.__shape.radius, cos, sin, scale.x, scale.y)
+        return world
 
     def get_center_offset(self) -> Vector2: return self.__center_off
 
     def get_center(self) -> Vector2:
-        trans = self.transform
-        off = self.__center_off.rotate(self.transform.rotation) * trans.lossy_scale
-        return off + trans.position
+        cx, cy = self.__world_geometry()[:2]
+        return Vector2._unchecked(cx, cy)
+
+    def _center(self) -> tuple[float, float]:
+        cx, cy = self.__world_geometry()[:2]
+        return cx, cy
+
+    def _circle(self) -> tuple[float, float, float] | None:
+        """
+        :return: (center x, center y, radius) in world space, None if the scale stretches it into an ellipse
+        """
+        cx, cy, radius, _, _, sx, sy = self.__world_geometry()
+        if sx != sy: return None
+        return cx, cy, abs(sx) * radius
+
+    def _packed_geometry(self) -> tuple[list[tuple[float, float]], float] | None:
+        circle = self._circle()
+        if circle is None: return None
+        return [circle[:2]], circle[2]
+
+    def _support(self, dx: float, dy: float) -> tuple[float, float]:
+        cx, cy, radius, cos, sin, sx, sy = self.__world_geometry()
+        length = math.hypot(dx, dy)
+        if length == 0: return cx, cy
+        dx, dy = dx / length, dy / length
+        if sx == sy:
+            r = abs(sx) * radius
+            return cx + dx * r, cy + dy * r
+        # Into local space, stretched by the scale, and back
+        lx, ly = (cos * dx + sin * dy) * sx * radius, (cos * dy - sin * dx) * sy * radius
+        return cx + cos * lx - sin * ly, cy + sin * lx + cos * ly
 
     def furthest_point(self, direction: Vector2) -> Vector2:
         types_check("direction", direction, Vector2)
-        direct = direction.normalized()
-        trans = self.transform
-        rot = trans.rotation
-        direct.rotate_self(-rot)
-        p = direct * trans.lossy_scale * self.__shape.radius
-        p.rotate_self(rot)
-        return p + self.get_center()
+        x, y = self._support(direction.x, direction.y)
+        return Vector2._unchecked(x, y)
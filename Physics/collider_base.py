@@ -2,7 +2,8 @@ from __future__ import annotations
 from MiniGames.Utils.type_checker import type_check, types_check
 from MiniGames.Utils.decorators import inner_method
 from MiniGames.Utils.vector2 import Vector2
-from MiniGames.Utils.settings_and_info import Info, Settings
+from MiniGames.Utils.settings_and_info import Info, Settings, check_layer
+from MiniGames.Physics.aabb import AABB
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,14 +12,28 @@ if TYPE_CHECKING:
 
 
 class ColliderBase:
-    __COL_ID = 1
+    __NEXT_COL_ID = 0
+    __FREE_COL_IDS: list[int] = []  # ids of removed colliders, handed out again before new ones
+
     @inner_method
     def __init__(self, go: GameObject):
         self.__go = go
         self.__is_enabled = True
         self.__is_trigger = False
-        self.__id = ColliderBase.__COL_ID
-        ColliderBase.__COL_ID += 1
+        self.__layer = 0
+        self._layer_bit = 1
+        self.__removed = False
+        if ColliderBase.__FREE_COL_IDS:
+            self.__id = ColliderBase.__FREE_COL_IDS.pop()
+        else:
+            self.__id = ColliderBase.__NEXT_COL_ID
+            ColliderBase.__NEXT_COL_ID += 1
+        self.__bounds: AABB | None = None
+
+        trans = go.transform
+        trans._add_to_on_pos_change(self._invalidate_bounds)
+        trans._add_to_on_scale_change(self._invalidate_bounds)
+        trans._add_to_on_rot_change(self._invalidate_bounds)
 
     @property
     def is_trigger(self) -> bool:
@@ -29,6 +44,17 @@ class ColliderBase:
         type_check("is_trigger", value, bool)
         self.__is_trigger = value
 
+    @property
+    def layer(self) -> int:
+        return self.__layer
+
+    @layer.setter
+    def layer(self, value: int):
+        type_check("layer", value, int)
+        check_layer("layer", value)
+        self.__layer = value
+        self._layer_bit = 1 << value
+
     @property
     def _col_id(self) -> int:
         return self.__id
@@ -55,10 +81,74 @@ class ColliderBase:
     def transform(self) -> Transform:
         return self.__go.transform
 
+    @property
+    def bounds(self) -> AABB:
+        """
+        World space AABB of the collider. Computed on first access, and cached until
+        the transform (or the shape of the collider) changes.
+        """
+        bounds = self.__bounds
+        if bounds is None:
+            bounds = self._compute_bounds()
+            self.__bounds = bounds
+        return bounds
+
+    def _invalidate_bounds(self):
+        self.__bounds = None
+        Info.instance._mark_collider_moved(self)
+
+    def _compute_bounds(self) -> AABB:
+        """
+        Note: Default implementation asks furthest_point for the 4 axis directions, which is exact for convex shapes.
+        Override it if your collider can compute its bounds faster.
+        :return: AABB of the collider in world space
+        """
+        return AABB(self.furthest_point(Vector2.left()).x, self.furthest_point(Vector2.down()).y,
+                    self.furthest_point(Vector2.right()).x, self.furthest_point(Vector2.up()).y)
+
+    def _packed_geometry(self) -> tuple[list[tuple[float, float]], float] | None:
+        """
+        Shape of the collider in world space as plain floats, so it can be tested by the parallel narrow phase:
+        (vertices of a convex polygon, radius rounding it). A circle is one vertex and its radius.
+        :return: None if the shape can't be described that way, its pairs are then tested in the physics thread
+        """
+        return None
+
+    def _support(self, dx: float, dy: float) -> tuple[float, float]:
+        """
+        furthest_point on plain floats, it's what GJK and EPA call, several times per pair per tick.
+        Note: Default implementation goes through furthest_point. Override it (without creating any Vector2)
+        if your collider can cache its world space geometry.
+        :return: (x, y) of the furthest point in direction (:param dx:, :param dy:), which doesn't have to be normalized
+        """
+        p = self.furthest_point(Vector2(dx, dy))
+        return p.x, p.y
+
+    def _center(self) -> tuple[float, float]:
+        """
+        :return: get_center as (x, y)
+        """
+        c = self.get_center()
+        return c.x, c.y
+
     def remove(self) -> None:
+        self.__removed = True
         Info.instance._rem_from_active_colliders(self)
+        self.gameobject._remove_component(self)
+        trans = self.transform
+        trans._rem_from_on_pos_change(self._invalidate_bounds)
+        trans._rem_from_on_scale_change(self._invalidate_bounds)
+        trans._rem_from_on_rot_change(self._invalidate_bounds)
         del self
 
+    def _release_col_id(self):
+        """
+        Called by the physics system once the collider can't be looped anymore, gives its id back if it was removed
+        """
+        if not self.__removed or self.__id is None: return
+        ColliderBase.__FREE_COL_IDS.append(self.__id)
+        self.__id = None
+
     def absolute_center_in_pixels(self) -> Vector2:
         trans = self.transform
         off = self.get_center_offset().rotate(trans.rotation) * Settings.space_scale * trans.lossy_scale * Vector2(1, -1)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Pipeline.gameobject import GameObject as GameObjectAnot
+    from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+
+# Collision events, each is also the bit of GameObject._collision_listeners set while the gameobject has a
+# MonoBehaviour listening to it, and indexes EVENT_CODES, the storage codes of those MonoBehaviours.
+COLLISION_ENTER, COLLISION_STAY, COLLISION_EXIT, TRIGGER_ENTER, TRIGGER_STAY, TRIGGER_EXIT = 0, 1, 2, 3, 4, 5
+EVENT_CODES = ("oci", "ocs", "oco", "oti", "ots", "oto")
+
+
+class CollisionEvents:
+    """
+    Collision and trigger events of a physics tick. The narrow phase only appends to flat buffers,
+    user callbacks run in dispatch, once it's done, grouped by gameobject.
+    Events of gameobjects nothing listens to are never buffered.
+    """
+
+    def __init__(self):
+        self.__gos: list[GameObjectAnot] = []
+        self.__events: list[int] = []
+        self.__others: list[ColliderBaseAnot] = []
+
+    def __len__(self):
+        return len(self.__gos)
+
+    def push(self, event: int, col1: ColliderBaseAnot, col2: ColliderBaseAnot):
+        """
+        Buffers :param event: for both colliders, each seeing the other one
+        :param event: one of the event constants of this module
+        """
+        bit = 1 << event
+        go = col1.gameobject
+        if go._collision_listeners & bit:
+            self.__gos.append(go)
+            self.__events.append(event)
+            self.__others.append(col2)
+        go = col2.gameobject
+        if go._collision_listeners & bit:
+            self.__gos.append(go)
+            self.__events.append(event)
+            self.__others.append(col1)
+
+    def dispatch(self):
+        """
+        Calls the buffered events on their gameobjects (in the order they were pushed for each gameobject),
+        and empties the buffers. Events pushed by the callbacks are dispatched too
+        """
+        while self.__gos:
+            gos, events, others = self.__gos, self.__events, self.__others
+            self.__gos, self.__events, self.__others = [], [], []
+
+            groups: dict[GameObjectAnot, list[int]] = {}
+            for i, go in enumerate(gos):
+                group = groups.get(go)
+                if group is None:
+                    groups[go] = [i]
+                else:
+                    group.append(i)
+
+            for go, group in groups.items():
+                go._dispatch_collision_events([(events[i], others[i]) for i in group])
@@ -0,0 +1,104 @@
+from __future__ import annotations
+import typing
+from MiniGames.Physics.manifold import Manifold
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+
+
+def pair_key(col1: ColliderBaseAnot, col2: ColliderBaseAnot) -> int:
+    """
+    Ordered pair key. Collider ids are recycled, so they stay below the number of live colliders
+    and the key stays a small int no matter how many colliders were spawned before.
+    """
+    i, j = col1._col_id, col2._col_id
+    return (i << 32) | j if i < j else (j << 32) | i
+
+
+class Contact:
+    __slots__ = ("col1", "col2", "generation", "manifold")
+
+    def __init__(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot, generation: int):
+        self.col1 = col1
+        self.col2 = col2
+        self.generation = generation
+        self.manifold: Manifold | None = None  # Normal points from col1 towards col2, None for triggers
+
+    def is_between(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot) -> bool:
+        return (self.col1 is col1 and self.col2 is col2) or (self.col1 is col2 and self.col2 is col1)
+
+
+class ContactTable:
+    """
+    Pairs of colliders that are touching, keyed by pair_key.
+    Every physics tick is a new generation, contacts refresh their generation when their pair is found colliding again,
+    and the ones left on an old generation (their pair separated or was culled by the broadphase) are swept at the end of the tick.
+    It also remembers the axis that separated every pair tested apart in the tick,
+    so the next tick can reject the pair with a single support point while it stays apart (see gjk_implementation.separated_along).
+    """
+
+    def __init__(self):
+        self.__contacts: dict[int, Contact] = {}
+        self.__axes: dict[int, tuple[float, float, int]] = {}  # key: (axis x, axis y, generation)
+        self.__generation = 0
+
+    def __len__(self):
+        return len(self.__contacts)
+
+    def __iter__(self):
+        return iter(list(self.__contacts.values()))
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    def next_generation(self):
+        self.__generation += 1
+
+    def find(self, key: int, col1: ColliderBaseAnot, col2: ColliderBaseAnot) -> Contact | None:
+        """
+        :return: contact between :param col1: and :param col2:, None if they aren't touching.
+        A contact left under :param key: by colliders whose ids were recycled since, is not returned
+        """
+        contact = self.__contacts.get(key)
+        if contact is None or not contact.is_between(col1, col2): return None
+        return contact
+
+    def add(self, key: int, col1: ColliderBaseAnot, col2: ColliderBaseAnot) -> Contact:
+        contact = Contact(col1, col2, self.__generation)
+        self.__contacts[key] = contact
+        return contact
+
+    def separating_axis(self, key: int) -> tuple[float, float] | None:
+        """
+        :return: axis that separated the pair when it was last tested, from the lower id collider towards the higher id one,
+        None if it was touching (or not tested)
+        """
+        entry = self.__axes.get(key)
+        return None if entry is None else entry[:2]
+
+    def cache_separating_axis(self, key: int, x: float, y: float):
+        self.__axes[key] = (x, y, self.__generation)
+
+    def pop(self, key: int) -> Contact | None:
+        return self.__contacts.pop(key, None)
+
+    def pop_stale(self, keep: typing.Callable[[Contact], bool] = None) -> list[Contact]:
+        """
+        Removes and returns the contacts that weren't refreshed in the current generation.
+        Stale contacts for which :param keep: returns True are refreshed instead
+        """
+        gen = self.__generation
+        stale = []
+        for key, c in self.__contacts.items():
+            if c.generation == gen: continue
+            if keep is not None and keep(c):
+                c.generation = gen
+            else:
+                stale.append((key, c))
+        for key, _ in stale:
+            self.__contacts.pop(key)
+        if self.__axes:
+            self.__axes = {key: entry for key, entry in self.__axes.items() if entry[2] == gen}
+        return [c for _, c in stale]
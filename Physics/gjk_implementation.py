@@ -1,58 +1,226 @@
-
+from __future__ import annotations
 from MiniGames.Utils.vector2 import Vector2
 from MiniGames.Physics.collider_base import ColliderBase
+import math
+import typing
+
+# Everything here runs on plain (x, y) floats through the _support and _center of the shapes,
+# a Vector2 is only created for what gets returned.
+SupportFunc = typing.Callable[[float, float], typing.Tuple[float, float]]
 
 
 def get_support_point(s1: ColliderBase, s2: ColliderBase, d: Vector2) -> Vector2:
-    d.normalize_self()
-    return s1.furthest_point(d) - s2.furthest_point(-d)
+    ax, ay = s1._support(d.x, d.y)
+    bx, by = s2._support(-d.x, -d.y)
+    return Vector2._unchecked(ax - bx, ay - by)
+
+
+def _start_direction(s1: ColliderBase, s2: ColliderBase) -> tuple[float, float]:
+    c1x, c1y = s1._center()
+    c2x, c2y = s2._center()
+    dx, dy = c2x - c1x, c2y - c1y
+    if dx == 0 and dy == 0: return 1.0, 0.0
+    return dx, dy
+
+
+def gjk_supports(support1: SupportFunc, support2: SupportFunc, dx: float, dy: float,
+                 max_iterations: int = 64) -> tuple[bool, float, float, int, list[tuple[float, float]]]:
+    """
+    gjk on two support functions (see ColliderBase._support), starting from direction (:param dx:, :param dy:)
+    :return: (whether the shapes collide, last search direction x, y, number of support points computed, last simplex)
+    """
+    ax, ay = support1(dx, dy)
+    bx, by = support2(-dx, -dy)
+    ax, ay = ax - bx, ay - by
+    if ax * dx + ay * dy < 0:
+        return False, dx, dy, 1, [(ax, ay)]
+
+    simplex = [(ax, ay)]
+    dx, dy = -ax, -ay
+    for iteration in range(2, max_iterations + 2):
+        if dx == 0 and dy == 0: return True, dx, dy, iteration, simplex  # Origin lies on the simplex
+        ax, ay = support1(dx, dy)
+        bx, by = support2(-dx, -dy)
+        ax, ay = ax - bx, ay - by
+        if ax * dx + ay * dy < 0:
+            return False, dx, dy, iteration, simplex
+        simplex.append((ax, ay))
 
+        if len(simplex) == 2:
+            bx, by = simplex[0]
+            dx, dy = ay - by, bx - ax  # Perpendicular of AB, flipped to face the origin
+            if dx * ax + dy * ay > 0: dx, dy = -dx, -dy
+            continue
 
-def line_case(simplex: list[Vector2], d: Vector2) -> bool:
-    B, A = simplex
-    AB, AO = B - A, -A
-    ABperp = Vector2.triple_product(AB, AO, AB)
-    d.set_self(ABperp)
-    d.normalize_self()
-    return False
+        (cx, cy), (bx, by) = simplex[0], simplex[1]
+        abx, aby, acx, acy = bx - ax, by - ay, cx - ax, cy - ay
+        px, py = -aby, abx
+        if px * acx + py * acy > 0: px, py = -px, -py  # Away from C
+        if px * ax + py * ay < 0:
+            simplex = [(bx, by), (ax, ay)]
+            dx, dy = px, py
+            continue
 
+        px, py = -acy, acx
+        if px * abx + py * aby > 0: px, py = -px, -py  # Away from B
+        if px * ax + py * ay < 0:
+            simplex = [(cx, cy), (ax, ay)]
+            dx, dy = px, py
+            continue
+        return True, dx, dy, iteration, simplex
+    return True, dx, dy, max_iterations + 1, simplex
 
-def triangle_case(simplex: list[Vector2], d: Vector2) -> bool:
-    C, B, A = simplex
-    AB, AC, AO = B - A, C - A, -A
-    ABperp = Vector2.triple_product(AC, AB, AB)
-    ACperp = Vector2.triple_product(AB, AC, AC)
-    if ABperp.dot(AO) > 0:
-        simplex.remove(C)
-        d.set_self(ABperp)
-        d.normalize_self()
-        return False
 
-    if ACperp.dot(AO) > 0:
-        simplex.remove(B)
-        d.set_self(ACperp)
-        d.normalize_self()
-        return False
-    return True
+def gjk(s1: ColliderBase, s2: ColliderBase, direction: Vector2 = None,
+        max_iterations: int = 64) -> tuple[bool, Vector2, int, list[Vector2]]:
+    """
+    :param direction: where to start searching from, defaults to the direction between the centers.
+    When the shapes don't collide, the returned direction separates them (see separated_along).
+    :return: (whether the shapes collide, last search direction, number of support points computed,
+    last simplex, which encloses the origin when the shapes collide and can be passed to epa)
+    """
+    if direction is None or (direction.x == 0 and direction.y == 0):
+        dx, dy = _start_direction(s1, s2)
+    else:
+        dx, dy = direction.x, direction.y
+    hit, dx, dy, iterations, simplex = gjk_supports(s1._support, s2._support, dx, dy, max_iterations)
+    length = math.hypot(dx, dy) or 1
+    return hit, Vector2._unchecked(dx / length, dy / length), iterations, [Vector2._unchecked(x, y) for x, y in simplex]
 
 
-def handle_simplex(simplex: list[Vector2], d: Vector2) -> bool:
-    if len(simplex) == 2:
-        return line_case(simplex, d)
-    return triangle_case(simplex, d)
+def separated_along(s1: ColliderBase, s2: ColliderBase, dx: float, dy: float) -> bool:
+    """
+    Whether (:param dx:, :param dy:) still separates the shapes, with a single support point of their difference.
+    Pairs that were apart on the previous tick are usually still apart along the axis that separated them,
+    testing it first rejects them without running gjk.
+    """
+    ax, ay = s1._support(dx, dy)
+    bx, by = s2._support(-dx, -dy)
+    return (ax - bx) * dx + (ay - by) * dy < 0
 
 
 def are_colliding(s1: ColliderBase, s2: ColliderBase) -> bool:
-    d = s2.get_center() - s1.get_center()
-    d.normalize_self()
-    simplex = [get_support_point(s1, s2, d)]
-    d = -simplex[0]
-
-    while True:
-        A = get_support_point(s1, s2, d)
-        if A.dot(d) < 0:
-            return False
-
-        simplex.append(A)
-        if handle_simplex(simplex, d):
-            return True
\ No newline at end of file
+    dx, dy = _start_direction(s1, s2)
+    return gjk_supports(s1._support, s2._support, dx, dy)[0]
+
+
+def closest_on_segment(simplex: list[tuple[float, float]]) -> tuple[float, float]:
+    (bx, by), (ax, ay) = simplex
+    abx, aby = bx - ax, by - ay
+    sqr_len = abx * abx + aby * aby
+    t = 0 if sqr_len == 0 else -(ax * abx + ay * aby) / sqr_len
+    if t <= 0:
+        simplex[:] = [(ax, ay)]
+        return ax, ay
+    if t >= 1:
+        simplex[:] = [(bx, by)]
+        return bx, by
+    return ax + abx * t, ay + aby * t
+
+
+def closest_on_simplex(simplex: list[tuple[float, float]]) -> tuple[float, float] | None:
+    """
+    Reduces :param simplex: to the feature closest to the origin.
+    :return: the point of the simplex closest to the origin, None if the simplex contains the origin
+    """
+    if len(simplex) == 1: return simplex[0]
+    if len(simplex) == 2: return closest_on_segment(simplex)
+
+    (cx, cy), (bx, by), (ax, ay) = simplex
+    c1 = (bx - ax) * -ay - (by - ay) * -ax
+    c2 = (cx - bx) * -by - (cy - by) * -bx
+    c3 = (ax - cx) * -cy - (ay - cy) * -cx
+    if (c1 >= 0 and c2 >= 0 and c3 >= 0) or (c1 <= 0 and c2 <= 0 and c3 <= 0):
+        return None
+
+    best, best_sqr, best_simplex = None, math.inf, None
+    for edge in ([(bx, by), (ax, ay)], [(cx, cy), (ax, ay)], [(cx, cy), (bx, by)]):
+        x, y = closest_on_segment(edge)
+        if x * x + y * y < best_sqr:
+            best, best_sqr, best_simplex = (x, y), x * x + y * y, edge
+    simplex[:] = best_simplex
+    return best
+
+
+def closest_distance(s1: ColliderBase, s2: ColliderBase, max_iterations: int = 32, tolerance: float = 1e-5) -> tuple[float, Vector2]:
+    """
+    GJK distance query.
+    :return: (distance between the shapes, closest point of the Minkowski difference s1 - s2 to the origin).
+    Distance is 0 when the shapes overlap
+    """
+    support1, support2 = s1._support, s2._support
+    dx, dy = _start_direction(s1, s2)
+    ax, ay = support1(dx, dy)
+    bx, by = support2(-dx, -dy)
+    vx, vy = ax - bx, ay - by
+    simplex = [(vx, vy)]
+
+    for _ in range(max_iterations):
+        mag = math.hypot(vx, vy)
+        if mag <= tolerance: break
+        ax, ay = support1(-vx, -vy)
+        bx, by = support2(vx, vy)
+        wx, wy = ax - bx, ay - by
+        if vx * vx + vy * vy - (vx * wx + vy * wy) <= tolerance * mag: break
+
+        simplex.append((wx, wy))
+        v = closest_on_simplex(simplex)
+        if v is None: return 0.0, Vector2.zero()
+        vx, vy = v
+    return math.hypot(vx, vy), Vector2._unchecked(vx, vy)
+
+
+def edge_normal(a: tuple[float, float], b: tuple[float, float]) -> tuple[float, float, float] | None:
+    """
+    :return: (normal of edge ab pointing away from the origin as x, y, distance of the edge from the origin), None if a == b
+    """
+    ex, ey = b[0] - a[0], b[1] - a[1]
+    length = math.hypot(ex, ey)
+    if length == 0: return None
+    nx, ny = ey / length, -ex / length
+    dist = nx * a[0] + ny * a[1]
+    if dist < 0: return -nx, -ny, -dist
+    return nx, ny, dist
+
+
+def epa_supports(support1: SupportFunc, support2: SupportFunc, dx: float, dy: float, simplex: list[tuple[float, float]],
+                 max_iterations: int = 32, tolerance: float = 1e-4) -> tuple[float, float, float]:
+    """
+    epa on two support functions (see ColliderBase._support), (:param dx:, :param dy:) is the direction between the centers
+    :return: (contact normal x, y, pointing from the first shape towards the second, penetration depth)
+    """
+    if len(simplex) < 3:
+        # gjk stopped with the origin on the simplex, the shapes are only touching
+        length = math.hypot(dx, dy)
+        return dx / length, dy / length, 0.0
+
+    polytope = list(simplex)
+    nx, ny, depth = 1.0, 0.0, 0.0
+    for _ in range(max_iterations):
+        best, index = None, 0
+        for i in range(len(polytope)):
+            edge = edge_normal(polytope[i], polytope[(i + 1) % len(polytope)])
+            if edge is not None and (best is None or edge[2] < best[2]):
+                best, index = edge, i + 1
+        if best is None: break
+
+        nx, ny, depth = best
+        ax, ay = support1(nx, ny)
+        bx, by = support2(-nx, -ny)
+        px, py = ax - bx, ay - by
+        if px * nx + py * ny - depth < tolerance: break
+        polytope.insert(index, (px, py))
+    return nx, ny, depth
+
+
+def epa(s1: ColliderBase, s2: ColliderBase, simplex: list[Vector2],
+        max_iterations: int = 32, tolerance: float = 1e-4) -> tuple[Vector2, float]:
+    """
+    Expanding Polytope Algorithm. Grows the simplex gjk stopped on towards the edge of the Minkowski difference s1 - s2
+    closest to the origin, which is the shortest way to pull the shapes apart.
+    :param simplex: simplex returned by gjk for a colliding pair
+    :return: (contact normal, pointing from s1 towards s2, penetration depth)
+    """
+    dx, dy = _start_direction(s1, s2)
+    nx, ny, depth = epa_supports(s1._support, s2._support, dx, dy, [(p.x, p.y) for p in simplex], max_iterations, tolerance)
+    return Vector2._unchecked(nx, ny), depth
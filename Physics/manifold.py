@@ -0,0 +1,126 @@
+from __future__ import annotations
+from MiniGames.Utils.vector2 import Vector2
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+
+MATCH_DISTANCE = 0.05  # Contact points closer than this on consecutive ticks are treated as the same point
+
+
+class ContactPoint:
+    __slots__ = ("point", "depth", "normal_impulse", "tangent_impulse")
+
+    def __init__(self, point: Vector2, depth: float):
+        self.point = point
+        self.depth = depth
+        self.normal_impulse = 0.0  # Impulses the solver applied at this point, kept across ticks for warm starting
+        self.tangent_impulse = 0.0
+
+    def __repr__(self):
+        return f"ContactPoint({self.point}, depth: {self.depth})"
+
+
+class Manifold:
+    """
+    Where and how deep two colliders overlap: one normal (from the first collider towards the second)
+    and one or two contact points (two when flat faces rest on each other).
+    """
+    __slots__ = ("normal", "depth", "points")
+
+    def __init__(self, normal: Vector2, depth: float, points: list[ContactPoint]):
+        self.normal = normal
+        self.depth = depth
+        self.points = points
+
+    def __repr__(self):
+        return f"Manifold(normal: {self.normal}, depth: {self.depth}, points: {self.points})"
+
+    def carry_impulses(self, old: Manifold):
+        """
+        Copies the accumulated impulses of the points of :param old: (the manifold of the same pair on the previous tick)
+        to the points of this one that are at the same place
+        """
+        max_sqr = MATCH_DISTANCE * MATCH_DISTANCE
+        for cp in self.points:
+            for old_cp in old.points:
+                if (cp.point - old_cp.point).sqr_mag <= max_sqr:
+                    cp.normal_impulse = old_cp.normal_impulse
+                    cp.tangent_impulse = old_cp.tangent_impulse
+                    break
+
+
+def best_edge(verts: list[tuple[float, float]], nx: float, ny: float) -> tuple[tuple[float, float], tuple[float, float], tuple[float, float]]:
+    """
+    :return: (furthest vertex along the normal, start of the edge, end of the edge)
+    for the edge next to the furthest vertex that is most perpendicular to the normal
+    """
+    count = len(verts)
+    index = max(range(count), key=lambda i: verts[i][0] * nx + verts[i][1] * ny)
+    v, prev, nxt = verts[index], verts[index - 1], verts[(index + 1) % count]
+    lx, ly = v[0] - nxt[0], v[1] - nxt[1]
+    rx, ry = v[0] - prev[0], v[1] - prev[1]
+    l_len, r_len = (lx * lx + ly * ly) ** .5 or 1, (rx * rx + ry * ry) ** .5 or 1
+    if abs(rx * nx + ry * ny) / r_len <= abs(lx * nx + ly * ny) / l_len:
+        return v, prev, v
+    return v, v, nxt
+
+
+def clip_segment(p1: tuple[float, float], p2: tuple[float, float], nx: float, ny: float, offset: float) -> list[tuple[float, float]]:
+    """
+    :return: the part of segment p1 p2 on the side of the line (n . p = offset) the normal points to
+    """
+    d1 = p1[0] * nx + p1[1] * ny - offset
+    d2 = p2[0] * nx + p2[1] * ny - offset
+    points = []
+    if d1 >= 0: points.append(p1)
+    if d2 >= 0: points.append(p2)
+    if d1 * d2 < 0:
+        t = d1 / (d1 - d2)
+        points.append((p1[0] + (p2[0] - p1[0]) * t, p1[1] + (p2[1] - p1[1]) * t))
+    return points
+
+
+def build_manifold(col1: ColliderBaseAnot, col2: ColliderBaseAnot, normal: Vector2, depth: float) -> Manifold:
+    """
+    Contact points for a colliding pair, from the normal and depth found by epa.
+    Two polygons get their incident edge clipped against the reference edge (up to two points),
+    anything else gets a single point, the deepest point of the round shape (or of :param col1:)
+    """
+    geo1, geo2 = col1._packed_geometry(), col2._packed_geometry()
+    polygons = geo1 is not None and geo2 is not None and len(geo1[0]) > 1 and len(geo2[0]) > 1 and not geo1[1] and not geo2[1]
+    if not polygons:
+        if geo2 is not None and len(geo2[0]) == 1 and not (geo1 is not None and len(geo1[0]) == 1):
+            point = col2.furthest_point(-normal)
+        else:
+            point = col1.furthest_point(normal)
+        return Manifold(normal, depth, [ContactPoint(point, depth)])
+
+    nx, ny = normal.x, normal.y
+    max1, a1, b1 = best_edge(geo1[0], nx, ny)
+    max2, a2, b2 = best_edge(geo2[0], -nx, -ny)
+    e1x, e1y = b1[0] - a1[0], b1[1] - a1[1]
+    e2x, e2y = b2[0] - a2[0], b2[1] - a2[1]
+    len1, len2 = (e1x * e1x + e1y * e1y) ** .5 or 1, (e2x * e2x + e2y * e2y) ** .5 or 1
+
+    # Reference edge is the one most perpendicular to the normal, its normal m points out of its shape
+    if abs(e1x * nx + e1y * ny) / len1 <= abs(e2x * nx + e2y * ny) / len2:
+        ref_max, ra, rb, ia, ib, mx, my = max1, a1, b1, a2, b2, nx, ny
+        rx, ry = e1x / len1, e1y / len1
+    else:
+        ref_max, ra, rb, ia, ib, mx, my = max2, a2, b2, a1, b1, -nx, -ny
+        rx, ry = e2x / len2, e2y / len2
+
+    clipped = clip_segment(ia, ib, rx, ry, rx * ra[0] + ry * ra[1])
+    if len(clipped) == 2:
+        clipped = clip_segment(clipped[0], clipped[1], -rx, -ry, -(rx * rb[0] + ry * rb[1]))
+
+    face = mx * ref_max[0] + my * ref_max[1]
+    points = []
+    for x, y in clipped:
+        point_depth = face - (mx * x + my * y)
+        if point_depth >= 0:
+            points.append(ContactPoint(Vector2(x, y), point_depth))
+    if not points:
+        points.append(ContactPoint(col1.furthest_point(normal), depth))
+    return Manifold(normal, depth, points)
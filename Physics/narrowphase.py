@@ -0,0 +1,138 @@
+from __future__ import annotations
+from MiniGames.Utils.vector2 import Vector2
+from MiniGames.Physics.gjk_implementation import gjk
+from MiniGames.Physics.box_collider import BoxCollider
+from MiniGames.Physics.circle_collider import CircleCollider
+import math
+import typing
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+
+
+class PairHit:
+    """
+    Result of the narrow phase for a pair that collides. Closed form tests give the contact normal
+    (from the first collider towards the second) and depth, GJK gives the simplex EPA needs to compute them.
+    """
+    __slots__ = ("normal", "depth", "simplex")
+
+    def __init__(self, normal: Vector2 | None, depth: float, simplex: list[Vector2] | None = None):
+        self.normal = normal
+        self.depth = depth
+        self.simplex = simplex
+
+    def __repr__(self):
+        return f"PairHit(normal: {self.normal}, depth: {self.depth})"
+
+    def flipped(self) -> PairHit:
+        """
+        :return: same hit, seen from the second collider
+        """
+        if self.normal is None: return PairHit(None, self.depth, [-p for p in self.simplex])
+        return PairHit(-self.normal, self.depth)
+
+
+PairTest = typing.Callable[["ColliderBaseAnot", "ColliderBaseAnot"], typing.Optional[PairHit]]
+_TESTS: dict[tuple[type, type], PairTest] = {}
+
+
+def gjk_test(col1: ColliderBaseAnot, col2: ColliderBaseAnot) -> PairHit | None:
+    """
+    Test for pairs without a closed form one
+    """
+    hit, _, _, simplex = gjk(col1, col2)
+    return PairHit(None, 0.0, simplex) if hit else None
+
+
+def register_test(type1: type, type2: type, test: PairTest):
+    """
+    Makes :param test: the narrow phase of every pair of colliders of exactly these types (subclasses keep using GJK),
+    in both orders. :param test: is called with a :param type1: and a :param type2: collider, in that order.
+    """
+    _TESTS[(type1, type2)] = test
+    if type1 is not type2:
+        _TESTS[(type2, type1)] = lambda col1, col2: _flip(test(col2, col1))
+
+
+def find_test(type1: type, type2: type) -> PairTest | None:
+    """
+    :return: closed form test for colliders of these types, None if they need GJK
+    """
+    return _TESTS.get((type1, type2))
+
+
+def collide(col1: ColliderBaseAnot, col2: ColliderBaseAnot) -> PairHit | None:
+    """
+    :return: how the colliders collide, None if they don't
+    """
+    test = _TESTS.get((type(col1), type(col2)), gjk_test)
+    return test(col1, col2)
+
+
+def _flip(hit: PairHit | None) -> PairHit | None:
+    return None if hit is None else hit.flipped()
+
+
+def circle_circle(col1: CircleCollider, col2: CircleCollider) -> PairHit | None:
+    c1, c2 = col1._circle(), col2._circle()
+    if c1 is None or c2 is None: return gjk_test(col1, col2)
+
+    dx, dy = c2[0] - c1[0], c2[1] - c1[1]
+    radii = c1[2] + c2[2]
+    sqr_dist = dx * dx + dy * dy
+    if sqr_dist > radii * radii: return None
+    dist = math.sqrt(sqr_dist)
+    if dist == 0: return PairHit(Vector2.right(), radii)
+    return PairHit(Vector2._unchecked(dx / dist, dy / dist), radii - dist)
+
+
+def box_circle(box: BoxCollider, circle: CircleCollider) -> PairHit | None:
+    c = circle._circle()
+    if c is None: return gjk_test(box, circle)
+    px, py, radius = c
+    cx, cy, cos, sin, hx, hy = box._oriented_box()
+
+    # Center of the circle in the space of the box
+    dx, dy = px - cx, py - cy
+    lx, ly = dx * cos + dy * sin, dy * cos - dx * sin
+    qx, qy = min(max(lx, -hx), hx), min(max(ly, -hy), hy)
+
+    if qx != lx or qy != ly:
+        ex, ey = lx - qx, ly - qy
+        sqr_dist = ex * ex + ey * ey
+        if sqr_dist > radius * radius: return None
+        dist = math.sqrt(sqr_dist)
+        nx, ny, depth = ex / dist, ey / dist, radius - dist
+    elif hx - abs(lx) <= hy - abs(ly):
+        # Center inside the box, pushed out through the closest side
+        nx, ny, depth = math.copysign(1, lx), 0.0, radius + hx - abs(lx)
+    else:
+        nx, ny, depth = 0.0, math.copysign(1, ly), radius + hy - abs(ly)
+    return PairHit(Vector2._unchecked(nx * cos - ny * sin, nx * sin + ny * cos), depth)
+
+
+def box_box(col1: BoxCollider, col2: BoxCollider) -> PairHit | None:
+    """
+    Separating axis test, the only axes to try are the 2 axes of each box
+    """
+    c1x, c1y, cos1, sin1, w1, h1 = col1._oriented_box()
+    c2x, c2y, cos2, sin2, w2, h2 = col2._oriented_box()
+    dx, dy = c2x - c1x, c2y - c1y
+
+    best, bx, by = math.inf, 1.0, 0.0
+    for ax, ay in ((cos1, sin1), (-sin1, cos1), (cos2, sin2), (-sin2, cos2)):
+        r1 = w1 * abs(cos1 * ax + sin1 * ay) + h1 * abs(cos1 * ay - sin1 * ax)
+        r2 = w2 * abs(cos2 * ax + sin2 * ay) + h2 * abs(cos2 * ay - sin2 * ax)
+        dist = dx * ax + dy * ay
+        overlap = r1 + r2 - abs(dist)
+        if overlap < 0: return None
+        if overlap < best:
+            best, bx, by = overlap, (ax if dist >= 0 else -ax), (ay if dist >= 0 else -ay)
+    return PairHit(Vector2._unchecked(bx, by), best)
+
+
+register_test(CircleCollider, CircleCollider, circle_circle)
+register_test(BoxCollider, CircleCollider, box_circle)
+register_test(BoxCollider, BoxCollider, box_box)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+from MiniGames.Physics.gjk_implementation import gjk_supports, epa_supports
+from MiniGames.Physics.narrowphase import PairHit, PairTest
+from MiniGames.Utils.vector2 import Vector2
+from multiprocessing import shared_memory, resource_tracker
+import multiprocessing
+import numpy as np
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+
+MIN_PARALLEL_PAIRS = 64  # Below this, sending the pairs to the pool costs more than testing them here
+CHUNKS_PER_PROCESS = 4
+GJK_MAX_ITERATIONS = 64
+
+
+class _SharedBlock:
+    """
+    Shared memory segment holding one array, reallocated (twice as big) when it gets too small.
+    Workers attach to it by name, so a new name tells them to reattach.
+    """
+
+    def __init__(self, dtype: type, columns: int):
+        self.__dtype = np.dtype(dtype)
+        self.__columns = columns
+        self.__shm: shared_memory.SharedMemory | None = None
+
+    def array(self, rows: int) -> np.ndarray:
+        nbytes = max(rows, 1) * self.__columns * self.__dtype.itemsize
+        if self.__shm is None or self.__shm.size < nbytes:
+            self.close()
+            self.__shm = shared_memory.SharedMemory(create=True, size=2 * nbytes)
+        return np.ndarray((rows, self.__columns), self.__dtype, buffer=self.__shm.buf)
+
+    @property
+    def name(self) -> str:
+        return self.__shm.name
+
+    @property
+    def spec(self) -> tuple[str, str, int]:
+        return self.__shm.name, self.__dtype.str, self.__columns
+
+    def close(self):
+        if self.__shm is None: return
+        self.__shm.close()
+        self.__shm.unlink()
+        self.__shm = None
+
+
+# ---- Worker side, only plain floats from here, no collider objects cross the process boundary ----
+
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+def _attach(spec: tuple[str, str, int], rows: int) -> np.ndarray:
+    name, dtype, columns = spec
+    shm = _attached.get(name)
+    if shm is None:
+        shm = shared_memory.SharedMemory(name=name)
+        _attached[name] = shm
+    return np.ndarray((rows, columns), np.dtype(dtype), buffer=shm.buf)
+
+
+def _support(verts: list, start: int, count: int, radius: float, dx: float, dy: float) -> tuple[float, float]:
+    best, bx, by = -math.inf, 0.0, 0.0
+    for k in range(start, start + count):
+        x, y = verts[k]
+        dot = x * dx + y * dy
+        if dot > best:
+            best, bx, by = dot, x, y
+    if radius:
+        length = math.hypot(dx, dy)
+        bx += radius * dx / length
+        by += radius * dy / length
+    return bx, by
+
+
+def _collide(verts: list, shape1: tuple, shape2: tuple) -> tuple[float, float, float] | None:
+    """
+    gjk then epa on packed shapes (start, count, radius, center x, center y)
+    :return: (contact normal x, y, from the first shape towards the second, depth), None if they don't collide
+    """
+    s1, n1, r1, cx1, cy1 = shape1
+    s2, n2, r2, cx2, cy2 = shape2
+    if n1 == 1 and n2 == 1:  # Two circles, see narrowphase.circle_circle
+        (x1, y1), (x2, y2) = verts[s1], verts[s2]
+        dx, dy = x2 - x1, y2 - y1
+        dist = math.hypot(dx, dy)
+        if dist > r1 + r2: return None
+        if dist == 0: return 1.0, 0.0, r1 + r2
+        return dx / dist, dy / dist, r1 + r2 - dist
+    dx, dy = cx2 - cx1, cy2 - cy1
+    if dx == 0 and dy == 0: dx = 1.0
+    support1 = lambda x, y: _support(verts, s1, n1, r1, x, y)
+    support2 = lambda x, y: _support(verts, s2, n2, r2, x, y)
+    hit, _, _, _, simplex = gjk_supports(support1, support2, dx, dy, GJK_MAX_ITERATIONS)
+    if not hit: return None
+    return epa_supports(support1, support2, dx, dy, simplex)
+
+
+def _test_chunk(task: tuple) -> np.ndarray:
+    """
+    :return: a row (pair index, contact normal x, y, depth) for every pair of the chunk that collides
+    """
+    verts_spec, n_verts, shapes_spec, n_shapes, pairs_spec, n_pairs, lo, hi = task
+    verts = _attach(verts_spec, n_verts).tolist()
+    shapes = [(int(start), int(count), radius, cx, cy) for start, count, radius, cx, cy in _attach(shapes_spec, n_shapes).tolist()]
+    pairs = _attach(pairs_spec, n_pairs)[lo:hi].tolist()
+    hits = []
+    for k, (i, j) in enumerate(pairs):
+        hit = _collide(verts, shapes[i], shapes[j])
+        if hit is not None: hits.append((lo + k, *hit))
+    for name in list(_attached):
+        if name not in (verts_spec[0], shapes_spec[0], pairs_spec[0]):
+            _attached.pop(name).close()
+    return np.array(hits, dtype=np.float64).reshape(-1, 4)
+
+
+# ---- Main process side ----
+
+class ParallelNarrowPhase:
+    """
+    Runs GJK and EPA for a tick's candidate pairs on a pool of processes (threads can't, they all wait on the GIL).
+    Geometry of every collider in the pairs is packed into shared memory once per tick, workers test a chunk of pairs each
+    and send back the indices of the pairs that collide with their contact normal and depth, so only manifolds are left to build.
+    Colliders that can't be packed (see ColliderBase._packed_geometry) are tested in this process.
+    Workers are forked, so it must be created while no other thread runs (see PhysicsSystem.start_physics_loop).
+    """
+
+    def __init__(self, processes: int):
+        self.__processes = processes
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        resource_tracker.ensure_running()  # Workers must share it, or each of them reports the segments it attached to as leaked
+        self.__pool = multiprocessing.get_context(method).Pool(processes)
+        self.__verts = _SharedBlock(np.float64, 2)
+        self.__shapes = _SharedBlock(np.float64, 5)  # start, count, radius, center x, center y
+        self.__pairs = _SharedBlock(np.int32, 2)
+
+    @property
+    def processes(self) -> int:
+        return self.__processes
+
+    def test(self, pairs: list[tuple[ColliderBaseAnot, ColliderBaseAnot]], test_here: PairTest) -> tuple[list[PairHit | None], int]:
+        """
+        :param test_here: test for the pairs that aren't sent to the pool
+        :return: (for every pair in :param pairs:, how its colliders collide, None if they don't; number of pairs tested in the pool)
+        """
+        if len(pairs) < MIN_PARALLEL_PAIRS:
+            return [test_here(col1, col2) for col1, col2 in pairs], 0
+
+        slots: dict[ColliderBaseAnot, int | None] = {}
+        verts: list[tuple[float, float]] = []
+        shapes: list[tuple[float, float, float, float, float]] = []
+
+        def slot_of(col: ColliderBaseAnot) -> int | None:
+            if col in slots: return slots[col]
+            geometry = col._packed_geometry()
+            if geometry is None:
+                slots[col] = None
+                return None
+            points, radius = geometry
+            cx, cy = col._center()
+            slots[col] = len(shapes)
+            shapes.append((len(verts), len(points), radius, cx, cy))
+            verts.extend(points)
+            return slots[col]
+
+        hits: list[PairHit | None] = [None] * len(pairs)
+        packed, packed_index = [], []
+        for index, (col1, col2) in enumerate(pairs):
+            s1, s2 = slot_of(col1), slot_of(col2)
+            if s1 is None or s2 is None:
+                hits[index] = test_here(col1, col2)
+            else:
+                packed.append((s1, s2))
+                packed_index.append(index)
+        if not packed: return hits, 0
+
+        self.__verts.array(len(verts))[:] = verts
+        self.__shapes.array(len(shapes))[:] = shapes
+        self.__pairs.array(len(packed))[:] = packed
+
+        n = len(packed)
+        step = max(1, math.ceil(n / (self.__processes * CHUNKS_PER_PROCESS)))
+        tasks = [(self.__verts.spec, len(verts), self.__shapes.spec, len(shapes), self.__pairs.spec, n, lo, min(lo + step, n))
+                 for lo in range(0, n, step)]
+        for chunk in self.__pool.map(_test_chunk, tasks):
+            for k, nx, ny, depth in chunk.tolist():
+                hits[packed_index[int(k)]] = PairHit(Vector2._unchecked(nx, ny), depth)
+        return hits, n
+
+    def close(self):
+        # Not terminate(), it stops workers with SIGTERM, which SDL catches in processes forked after pygame.init
+        self.__pool.close()
+        self.__pool.join()
+        self.__verts.close()
+        self.__shapes.close()
+        self.__pairs.close()
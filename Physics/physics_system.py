@@ -1,8 +1,25 @@
 from __future__ import annotations
-from MiniGames.Physics.gjk_implementation import are_colliding
+from MiniGames.Physics.gjk_implementation import gjk, epa, are_colliding, closest_distance, separated_along
+from MiniGames.Physics.manifold import build_manifold
+from MiniGames.Physics.narrowphase import PairHit, find_test
+from MiniGames.Physics.aabb_tree import AABBTree
+from MiniGames.Physics.contacts import Contact, ContactTable, pair_key
+from MiniGames.Physics.body_store import BodyStore
+from MiniGames.Physics.contact_solver import ContactSolver, RESTITUTION_THRESHOLD
+from MiniGames.Physics.ccd import swept_bounds, time_of_impact
+from MiniGames.Physics.collision_events import CollisionEvents, COLLISION_ENTER, COLLISION_STAY, COLLISION_EXIT, TRIGGER_ENTER, TRIGGER_STAY, TRIGGER_EXIT
+from MiniGames.Physics.parallel_narrowphase import ParallelNarrowPhase
+from MiniGames.Physics.profiler import PhysicsProfiler, FIXED_UPDATE, BROADPHASE, NARROWPHASE, EVENTS, SOLVER, INTEGRATION, PAIRS, GJK_CALLS, HITS
+from MiniGames.Physics.queries import RaycastHit, raycast_collider, _QueryPoint, _QueryCircle, _QueryBox
+from MiniGames.Utils.type_checker import types_check, type_check_num
+from MiniGames.Utils.vector2 import Vector2
+from MiniGames.Physics.broadphase import AllPairsBroadPhase, SpatialHashBroadPhase, SweepAndPruneBroadPhase
 from MiniGames.Utils.settings_and_info import Info, Settings
 from MiniGames.Utils import settings_and_info as others
 from MiniGames.Utils.decorators import inner_method
+import numpy as np
+import collections
+import math
 import threading
 import time
 from typing import TYPE_CHECKING
@@ -10,219 +27,608 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from MiniGames.Physics.rigidbody import RigidBody as RigidBodyAnot
     from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+    from MiniGames.Pipeline.transform import Transform as TransformAnot
 
 
 class PhysicsSystem:
     @inner_method
     def __init__(self):
         self._rbs: list[RigidBodyAnot] = []
+        self.bodies = BodyStore()
+        self.solver = ContactSolver(self.bodies)
         self._cols: list[ColliderBaseAnot] = []
 
         self._to_add_col: list[ColliderBaseAnot] = []
         self._to_rem_col: list[ColliderBaseAnot] = []
         self._looping_col = False
 
-        self._to_add_rbs: list[RigidBodyAnot] = []
-        self._to_rem_rbs: list[RigidBodyAnot] = []
-        self._looping_rbs = False
+        self.contacts = ContactTable()
+        self.events = CollisionEvents()
 
-        self.col_start: set[int] = set()
-        self.col_stay: set[int] = set()
+        self.__tree = AABBTree()
+        self.__tree_leaves = {}
+        self.__tree_lock = threading.Lock()
+        self.__moved_cols: set[ColliderBaseAnot] = set()
+        self.__moved_static: set[ColliderBaseAnot] = set()  # Colliders without a rigidbody that moved since the last tick
+
+        self.__broadphase_name = None
+        self.__broadphase = None
+        self.__sync_broadphase()
 
         self.__col_iter = None
+        self.__collision_det_func = self.single_thread_col_det
+        self.__narrowphase: ParallelNarrowPhase | None = None
 
         self.__is_psy_loop_running = False
+        self.__psy_thread: threading.Thread | None = None
+
+        self.profiler = PhysicsProfiler(Settings.profile_window)
+        self.__profiler: PhysicsProfiler | None = None  # self.profiler during steps taken with Settings.profile_physics on
+
+        self.__positions: np.ndarray | None = None  # Back buffer, body positions after the last step (physics thread only)
+        self.__render_state: tuple | None = None  # Front buffer, see __publish_render_state
+        self.__interpolated: set[RigidBodyAnot] = set()  # Bodies drawn at an interpolated position (main thread only)
+        self.__render_moved: collections.deque[TransformAnot] = collections.deque()  # Moved off the main thread, see _render_moved
 
     def add_rb(self, obj: RigidBodyAnot):
-        if not self.__is_psy_loop_running:
+        index = obj._body_index
+        if not self.bodies.active[index]:
+            self.bodies.active[index] = True
             self._rbs.append(obj)
-            self.start_physics_loop()
-            return
 
-        if not self._looping_rbs:
-            if obj not in self._rbs:
-                self._rbs.append(obj)
-        else:
-            if obj not in self._rbs and obj not in self._to_add_rbs:
-                self._to_add_rbs.append(obj)
+        if Info.is_loop_running and not self.__is_psy_loop_running:
+            self.start_physics_loop()
 
     def rem_rb(self, obj: RigidBodyAnot):
-        if not self._looping_rbs:
-            if obj in self._rbs:
-                self._rbs.remove(obj)
-        else:
-            if obj in self._rbs or obj in self._to_add_rbs and obj not in self._to_rem_rbs:
-                self._to_rem_rbs.append(obj)
+        index = obj._body_index
+        if not self.bodies.active[index]: return
+        self.bodies.active[index] = False
+        self._rbs.remove(obj)
 
     def add_col(self, obj):
-        if not self.__is_psy_loop_running:
-            self._cols.append(obj)
-            self.physics_loop()
-            return
-
         if not self._looping_col:
             if obj not in self._cols:
-                self._cols.append(obj)
+                self.__append_col(obj)
         else:
             if obj not in self._cols and obj not in self._to_add_col:
                 self._to_add_col.append(obj)
 
+        if Info.is_loop_running and not self.__is_psy_loop_running:
+            self.start_physics_loop()
+
     def rem_col(self, obj):
         if not self._looping_col:
             if obj in self._cols:
-                self._cols.remove(obj)
+                self.__pop_col(obj)
+            else:
+                obj._release_col_id()
         else:
-            if obj in self._cols or obj in self._to_add_col and obj not in self._to_rem_rbs:
-                self._to_rem_col.append(obj)
+            if obj in self._cols or obj in self._to_add_col:
+                if obj not in self._to_rem_col: self._to_rem_col.append(obj)
+            else:
+                obj._release_col_id()
+
+    def __append_col(self, obj: ColliderBaseAnot):
+        self._cols.append(obj)
+        self.__broadphase.add(obj)
+        with self.__tree_lock:
+            self.__tree_leaves[obj] = self.__tree.insert(obj, obj.bounds)
+            if obj.gameobject.rigid_body is None: self.__moved_static.add(obj)
+
+    def __pop_col(self, obj: ColliderBaseAnot):
+        self._cols.remove(obj)
+        self.__broadphase.remove(obj)
+        with self.__tree_lock:
+            self.__tree.remove(self.__tree_leaves.pop(obj))
+            self.__moved_cols.discard(obj)
+        obj._release_col_id()  # Only now, the broadphase could still yield it while it was queued
 
     def __remove_colliders(self):
         if not self._to_rem_col: return
 
         for r in self._to_rem_col:
-            self._cols.remove(r)
+            self.__pop_col(r)
         self._to_rem_col.clear()
 
+    def __sync_broadphase(self):
+        name = Settings.broadphase
+        if name == "spatial_hash":
+            cell_size = Settings.spatial_hash_cell_size
+            if self.__broadphase_name == name and self.__broadphase.cell_size == cell_size: return
+            broadphase = SpatialHashBroadPhase(cell_size)
+        elif name == "sweep_and_prune":
+            if self.__broadphase_name == name: return
+            broadphase = SweepAndPruneBroadPhase()
+        else:
+            if self.__broadphase_name == name: return
+            broadphase = AllPairsBroadPhase()
+
+        for col in self._cols:
+            broadphase.add(col)
+        self.__broadphase = broadphase
+        self.__broadphase_name = name
+
     def loop_colliders(self):
         self._looping_col = True
-        col_len = len(self._cols)
-        for i in range(col_len - 1):
-            for j in range(i + 1, col_len):
-                yield self._cols[i], self._cols[j]
-
-        if not self._to_add_col:
-            self.__remove_colliders()
-            return
+        self.__sync_broadphase()
+        awake = self.bodies.awake
+        with self.__tree_lock:
+            moved_static, self.__moved_static = self.__moved_static, set()
+        for col1, col2 in self.__broadphase.pairs(self._cols):
+            r1, r2 = col1.gameobject.rigid_body, col2.gameobject.rigid_body
+            # Every body of the pair is asleep, and colliders without one (static) didn't move:
+            # nothing between them can have changed since the bodies fell asleep
+            if r1 is None:
+                if r2 is None or awake[r2._body_index] or col1 in moved_static: yield col1, col2
+            elif r2 is None:
+                if awake[r1._body_index] or col2 in moved_static: yield col1, col2
+            elif awake[r1._body_index] or awake[r2._body_index]:
+                yield col1, col2
 
         while self._to_add_col:
             new_loop = list(self._to_add_col)
             self._to_add_col.clear()
 
-            for i in self._cols:
-                for j in new_loop:
-                    yield i, j
-
-            col_len = len(new_loop)
-            for i in range(col_len - 1):
-                coli = new_loop[i]
-                self._cols.append(coli)
-                for j in range(i + 1, col_len):
-                    yield coli, new_loop[j]
-            self._cols.append(new_loop[-1])
+            for col in new_loop:
+                yield from self.__broadphase.pairs_with(col, self._cols)
+                self.__append_col(col)
 
         self.__remove_colliders()
         self._looping_col = False
 
-    def loop_rbs(self):
-        self._looping_rbs = True
-        for r in self._rbs:
-            yield r
-        self._looping_rbs = False
-
-    def get_collision_id(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot):
-        return (1 << col1._col_id) | (1 << col2._col_id)
-
-    def collide_rbs(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot):
-        r1 = col1.gameobject.rigid_body
-        r2 = col2.gameobject.rigid_body
-        if r1 and r2: r1._collide_with(r2)
+    def __close_stale_contacts(self):
+        """
+        Contacts that weren't found colliding this tick have ended, even if the narrow phase never saw them
+        (broadphase culls pairs whose bounds don't overlap, and removed colliders aren't looped at all).
+        """
+        for contact in self.contacts.pop_stale(keep=self.__is_sleeping_contact):
+            self.__call_exit(contact.col1, contact.col2)
+
+    def __is_sleeping_contact(self, contact: Contact) -> bool:
+        """
+        Pairs loop_colliders skipped: at least one body, and every body asleep
+        """
+        r1, r2 = contact.col1.gameobject.rigid_body, contact.col2.gameobject.rigid_body
+        if r1 is None and r2 is None: return False
+        return (r1 is None or r1.is_sleeping) and (r2 is None or r2.is_sleeping)
+
+    def _update_sleeping(self):
+        touching = []
+        for contact in self.contacts:
+            col1, col2 = contact.col1, contact.col2
+            if col1.is_trigger or col2.is_trigger: continue
+            r1, r2 = col1.gameobject.rigid_body, col2.gameobject.rigid_body
+            if r1 is not None and r2 is not None:
+                touching.append((r1._body_index, r2._body_index))
+        self.bodies.update_sleeping(Info.fixedDeltaTime, Settings.sleep_velocity, Settings.time_to_sleep, touching)
+
+    @property
+    def awake_bodies_count(self) -> int:
+        return self.bodies.awake_count
+
+    @property
+    def sleeping_bodies_count(self) -> int:
+        return self.bodies.sleeping_count
+
+    def _mark_collider_moved(self, col: ColliderBaseAnot):
+        with self.__tree_lock:  # __refit_tree swaps the set out, an add without the lock could land on the old one
+            self.__moved_cols.add(col)
+            if col.gameobject.rigid_body is None: self.__moved_static.add(col)
+
+    def __refit_tree(self):
+        """
+        Must be called with __tree_lock held.
+        Leaves are fat, so most colliders that moved since the last query don't need to be reinserted.
+        """
+        if not self.__moved_cols: return
+        moved, self.__moved_cols = self.__moved_cols, set()
+        for col in moved:
+            leaf = self.__tree_leaves.get(col)
+            if leaf is not None:
+                self.__tree.move(leaf, col.bounds)
+
+    def raycast(self, origin: Vector2, direction: Vector2, max_distance: float = math.inf) -> RaycastHit | None:
+        """
+        :return: first collider hit by the ray, None if nothing was hit
+        """
+        types_check("origin", origin, Vector2)
+        types_check("direction", direction, Vector2)
+        type_check_num("max_distance", max_distance)
+        direction = direction.normalized()
+        if direction.sqr_mag == 0: raise ValueError("direction can't be a zero vector")
+
+        best = None
+        with self.__tree_lock:
+            self.__refit_tree()
+            for t_enter, col in self.__tree.raycast(origin.x, origin.y, direction.x, direction.y, max_distance):
+                if best is not None and t_enter > best.distance: break
+                hit = raycast_collider(col, origin, direction, t_enter, max_distance if best is None else best.distance)
+                if hit is not None and (best is None or hit.distance < best.distance):
+                    best = hit
+        return best
+
+    def __overlap(self, shape: _QueryCircle | _QueryBox) -> list[ColliderBaseAnot]:
+        bounds = shape.bounds
+        with self.__tree_lock:
+            self.__refit_tree()
+            candidates = [col for col in self.__tree.query(bounds) if col.bounds.overlaps(bounds)]
+        return [col for col in candidates if are_colliding(col, shape)]
+
+    def overlap_circle(self, center: Vector2, radius: float) -> list[ColliderBaseAnot]:
+        types_check("center", center, Vector2)
+        type_check_num("radius", radius)
+        return self.__overlap(_QueryCircle(center, radius))
+
+    def overlap_box(self, center: Vector2, size: Vector2, rotation: float = 0) -> list[ColliderBaseAnot]:
+        types_check("center", center, Vector2)
+        types_check("size", size, Vector2)
+        type_check_num("rotation", rotation)
+        return self.__overlap(_QueryBox(center, size, rotation))
+
+    def query_nearest(self, point: Vector2, max_distance: float = math.inf) -> ColliderBaseAnot | None:
+        """
+        :return: collider closest to :param point: (0 distance if the point is inside it), None if there is none within :param max_distance:
+        """
+        types_check("point", point, Vector2)
+        type_check_num("max_distance", max_distance)
+        query = _QueryPoint(point)
+        with self.__tree_lock:
+            self.__refit_tree()
+            col, _ = self.__tree.nearest(point.x, point.y, max_distance, lambda c: closest_distance(c, query)[0])
+        return col
+
+    def get_collision_id(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot) -> int:
+        return pair_key(col1, col2)
+
+    def __update_manifold(self, contact: Contact, col1: ColliderBaseAnot, hit: PairHit):
+        """
+        Caches the manifold of the hit on the contact, in the contact's order of colliders.
+        Runs EPA first if the hit was found by GJK, which doesn't give a normal
+        """
+        first, second = contact.col1, contact.col2
+        if first is not col1: hit = hit.flipped()
+
+        if hit.normal is None:
+            normal, depth = epa(first, second, hit.simplex)
+        else:
+            normal, depth = hit.normal, hit.depth
+        manifold = build_manifold(first, second, normal, depth)
+        if contact.manifold is not None: manifold.carry_impulses(contact.manifold)
+        contact.manifold = manifold
 
-    def process_collision(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot):
+    def process_collision(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot, hit: PairHit):
         cid = self.get_collision_id(col1, col2)
+        contact = self.contacts.find(cid, col1, col2)
 
-        if cid in self.col_start or cid in self.col_stay:
-            self.col_stay.add(cid)
-            self.col_start.discard(cid)
+        if contact is not None:
+            contact.generation = self.contacts.generation
             if col1.is_trigger or col2.is_trigger:
-                col1.gameobject._call_on_monos_on_tri_stay(col2)
-                col2.gameobject._call_on_monos_on_tri_stay(col1)
+                self.events.push(TRIGGER_STAY, col1, col2)
             else:
-                self.collide_rbs(col1, col2)
-                col1.gameobject._call_on_monos_on_col_stay(col2)
-                col2.gameobject._call_on_monos_on_col_stay(col1)
+                self.__update_manifold(contact, col1, hit)
+                self.events.push(COLLISION_STAY, col1, col2)
         else:
-            self.col_start.add(cid)
+            contact = self.contacts.add(cid, col1, col2)
             if col1.is_trigger or col2.is_trigger:
-                col1.gameobject._call_on_monos_on_tri_enter(col2)
-                col2.gameobject._call_on_monos_on_tri_enter(col1)
+                self.events.push(TRIGGER_ENTER, col1, col2)
             else:
-                self.collide_rbs(col1, col2)
-                col1.gameobject._call_on_monos_on_col_enter(col2)
-                col2.gameobject._call_on_monos_on_col_enter(col1)
+                self.__update_manifold(contact, col1, hit)
+                self.events.push(COLLISION_ENTER, col1, col2)
 
     def process_collision_2(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot):
         cid = self.get_collision_id(col1, col2)
-        if cid not in self.col_stay: return
+        if self.contacts.find(cid, col1, col2) is None: return
 
-        self.col_stay.remove(cid)
-        if col1.is_trigger or col2.is_trigger:
-            col1.gameobject._call_on_monos_on_tri_exit(col2)
-            col2.gameobject._call_on_monos_on_tri_exit(col1)
-        else:
-            col1.gameobject._call_on_monos_on_col_exit(col2)
-            col2.gameobject._call_on_monos_on_col_exit(col1)
+        self.contacts.pop(cid)
+        self.__call_exit(col1, col2)
+
+    def __call_exit(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot):
+        self.events.push(TRIGGER_EXIT if col1.is_trigger or col2.is_trigger else COLLISION_EXIT, col1, col2)
 
     def start_physics_loop(self):
-        if not self._rbs and not self._cols:
-            self.__is_psy_loop_running = False
-            return
+        if self.__is_psy_loop_running: return
+        if not self._rbs and not self._cols: return
 
         if Settings.collision_threads_count == 1:
             self.__collision_det_func = self.single_thread_col_det
             print(f"Collision Detection Thread Count: {Settings.collision_threads_count}")
         else:
-            self.__collision_det_func = self.multi_thread_col_det
-            print(f"Collision Detection Thread Count: {Settings.collision_threads_count}")
-
-        threading.Thread(target=self.physics_loop).start()
+            self.__collision_det_func = self.multi_process_col_det
+            self.__open_narrowphase(Settings.collision_threads_count)
+            print(f"Collision Detection Process Count: {Settings.collision_threads_count}")
 
-    def multi_thread_col_det(self):
-        thrds = []
-        for i in range(Settings.collision_threads_count - 1):
-            thrd = threading.Thread(target=self.one_thread_of_multi)
-            thrd.start()
-            thrds.append(thrd)
-        self.one_thread_of_multi()
-        for t in thrds:
-            t.join()
-
-    def one_thread_of_multi(self):
-        while True:
-            try:
-                while True:
-                    try:
-                        col1, col2 = self.__col_iter.__next__()
-                        break
-                    except ValueError:
-                        pass
-
-                if are_colliding(col1, col2):
-                    self.process_collision(col1, col2)
-                else:
-                    self.process_collision_2(col1, col2)
-            except StopIteration:
-                break
+        self.__is_psy_loop_running = True
+        self.__psy_thread = threading.Thread(target=self.physics_loop, daemon=True)
+        self.__psy_thread.start()
+
+    def _join_physics_loop(self):
+        """
+        Main thread, once the game stopped: waits for the physics loop to finish its step and close the process pool,
+        so gameobjects aren't destroyed in the middle of a step, and the pool isn't left to the interpreter shutdown
+        """
+        thread = self.__psy_thread
+        if thread is None or thread is threading.current_thread(): return
+        thread.join()
+        self.__psy_thread = None
+
+    def multi_process_col_det(self):
+        if self.__narrowphase is None: return self.single_thread_col_det()  # Stepped without the physics loop
+
+        pairs = list(self.__col_iter)
+        hits, pooled = self.__narrowphase.test(pairs, self.__test_pair)
+        profiler = self.__profiler
+        if profiler is not None:
+            profiler.count(GJK_CALLS, pooled)  # The pool tests every pair it's sent, __test_pair counts the others
+            profiler.count(HITS, len(hits) - hits.count(None))
+        for (col1, col2), hit in zip(pairs, hits):
+            if hit is not None:
+                self.process_collision(col1, col2, hit)
+            else:
+                self.process_collision_2(col1, col2)
+
+    def __open_narrowphase(self, processes: int):
+        """
+        Main thread, before the physics thread starts: the pool forks its workers, and forking a process
+        while other threads run can deadlock the children (and warns from Python 3.12)
+        """
+        if self.__narrowphase is not None and self.__narrowphase.processes == processes: return
+        self.__close_narrowphase()
+        self.__narrowphase = ParallelNarrowPhase(processes)
+
+    def __close_narrowphase(self):
+        if self.__narrowphase is None: return
+        self.__narrowphase.close()
+        self.__narrowphase = None
+
+    def __test_pair(self, col1: ColliderBaseAnot, col2: ColliderBaseAnot) -> PairHit | None:
+        """
+        Closed form test if the types of the colliders have one (see narrowphase.register_test), GJK otherwise.
+        Pairs that GJK found apart in the previous tick are first tested along the axis that separated them,
+        which rejects most of them with a single support point
+        :return: how the colliders collide, None if they don't
+        """
+        test = find_test(type(col1), type(col2))
+        if test is not None: return test(col1, col2)
+
+        contacts = self.contacts
+        key = pair_key(col1, col2)
+        sign = -1 if col1._col_id > col2._col_id else 1
+        axis = contacts.separating_axis(key)
+        if axis is not None and separated_along(col1, col2, axis[0] * sign, axis[1] * sign):
+            contacts.cache_separating_axis(key, *axis)
+            return None
+
+        if self.__profiler is not None: self.__profiler.count(GJK_CALLS)
+        hit, direction, _, simplex = gjk(col1, col2)  # Touching pairs need 3 support points either way, nothing to warm start
+        if hit: return PairHit(None, 0.0, simplex)
+        contacts.cache_separating_axis(key, direction.x * sign, direction.y * sign)
+        return None
 
     def single_thread_col_det(self):
+        profiler = self.__profiler
         while True:
             try:
                 col1, col2 = self.__col_iter.__next__()
-                if are_colliding(col1, col2):
-                    self.process_collision(col1, col2)
+                hit = self.__test_pair(col1, col2)
+                if hit is not None:
+                    if profiler is not None: profiler.count(HITS)
+                    self.process_collision(col1, col2, hit)
                 else:
                     self.process_collision_2(col1, col2)
             except StopIteration:
                 break
 
-    def physics_loop(self):
-        self.__is_psy_loop_running = True
-        while Info.is_loop_running:
-            now = time.perf_counter()
+    def __profiled_pairs(self, pairs, profiler: PhysicsProfiler):
+        """
+        The broadphase yields pairs while the narrow phase tests them, time spent getting the next pair is broadphase,
+        the rest narrow phase
+        """
+        for pair in pairs:
+            profiler.lap(BROADPHASE)
+            profiler.count(PAIRS)
+            yield pair
+            profiler.lap(NARROWPHASE)
+        profiler.lap(BROADPHASE)
+
+    def _detect_collisions(self):
+        """
+        Collision callbacks are buffered while pairs are tested, and only called once every pair has been,
+        so user code never runs in the middle of the narrow phase
+        """
+        profiler = self.__profiler
+        self.contacts.next_generation()
+        self.__col_iter = self.loop_colliders()
+        if profiler is not None: self.__col_iter = self.__profiled_pairs(self.__col_iter, profiler)
+        self.__collision_det_func()
+        self.__close_stale_contacts()
+        if profiler is not None: profiler.lap(NARROWPHASE)
+        self.events.dispatch()
+        if profiler is not None: profiler.lap(EVENTS)
+
+    def _integrate_bodies(self):
+        """
+        Velocities are integrated first, so the contact solver sees (and cancels) this step's gravity and forces
+        before positions are integrated.
+        """
+        dt = Info.fixedDeltaTime
+        gravity = Settings.gravity
+        profiler = self.__profiler
+        self.bodies.integrate_velocities(dt, gravity.x, gravity.y)
+        if profiler is not None: profiler.lap(INTEGRATION)
+        self.solver.solve(self.contacts, dt, Settings.solver_iterations, Settings.position_correction, Settings.penetration_slop)
+        if profiler is not None: profiler.lap(SOLVER)
+        moved = self.bodies.integrate_positions(dt)
+        self.__sweep_continuous(moved)
+        self.bodies.write_back(moved)
+        if profiler is not None: profiler.lap(INTEGRATION)
+
+    def __sweep_continuous(self, moved: np.ndarray):
+        """
+        Continuous collision detection for the bodies that moved and are RigidBody.continuous.
+        Their transforms are still where the step started, so each collider is swept from there to the integrated
+        position (against colliders in the tree whose bounds overlap its swept bounds), and the body is moved back
+        to the first time of impact, losing the velocity that pushes into what it hit (minus the bounce).
+        Normal contacts take over from the next step, when the shapes overlap.
+        """
+        store = self.bodies
+        rows = moved[store.continuous[moved]]
+        if not len(rows): return
+
+        rows = set(rows.tolist())
+        shapes: dict[int, list[ColliderBaseAnot]] = {}
+        for col in self._cols:
+            rb = col.gameobject.rigid_body
+            if rb is not None and rb._body_index in rows and not col.is_trigger:
+                shapes.setdefault(rb._body_index, []).append(col)
+
+        masks = others.__layer_masks__
+        with self.__tree_lock:
+            self.__refit_tree()
+            for i, cols in shapes.items():
+                body = store.bodies[i]
+                start = body.transform.position
+                mx, my = store.pos[i, 0] - start.x, store.pos[i, 1] - start.y
+                if mx == 0 and my == 0: continue
+
+                first = None
+                for col in cols:
+                    swept, mask = swept_bounds(col.bounds, mx, my), masks[col.layer]
+                    for other in self.__tree.query(swept):
+                        if other.is_trigger or not mask & other._layer_bit: continue
+                        rb = other.gameobject.rigid_body
+                        if rb is body or not swept.overlaps(other.bounds): continue
+                        ox = oy = 0.0
+                        if rb is not None and store.active[rb._body_index]:
+                            pos = rb.transform.position
+                            ox, oy = store.pos[rb._body_index, 0] - pos.x, store.pos[rb._body_index, 1] - pos.y
+                        hit = time_of_impact(col, other, mx - ox, my - oy)
+                        if hit is not None and (first is None or hit[0] < first[0]):
+                            first = hit + (rb,)
+                if first is None: continue
+
+                t, nx, ny, rb = first
+                store.pos[i] = (start.x + mx * t, start.y + my * t)
+                vx, vy = store.vel[i].tolist()
+                ovx, ovy = store.vel[rb._body_index].tolist() if rb is not None and store.active[rb._body_index] else (0.0, 0.0)
+                approach = (vx - ovx) * nx + (vy - ovy) * ny
+                if approach > 0:
+                    bounce = max(store.restitution[i], store.restitution[rb._body_index] if rb is not None else 0.0)
+                    if approach < RESTITUTION_THRESHOLD: bounce = 0.0
+                    store.vel[i] = (vx - (1 + bounce) * approach * nx, vy - (1 + bounce) * approach * ny)
+
+    def step(self, dt: float):
+        """
+        Advances the simulation by :param dt: seconds.
+        With Settings.profile_physics on, the step is recorded by self.profiler (see Info.physics_profile).
+        Holds the lock of the body store, so bodies added from the main thread can't grow it in the middle of the step
+        """
+        others.__fixedDeltaTime__ = dt
+        profiler = self.__profiler = self.profiler if Settings.profile_physics else None
+        if profiler is not None:
+            profiler.window = Settings.profile_window
+            profiler.start_tick()
+        with self.bodies.lock:
             Info.instance._call_physics_update()
+            if profiler is not None: profiler.lap(FIXED_UPDATE)
+            self._detect_collisions()
+            self._integrate_bodies()
+            self._update_sleeping()
+            self.__publish_render_state()
+        if profiler is not None: profiler.end_tick()
+
+    def __publish_render_state(self):
+        """
+        Physics thread. Renderers must not read transforms while this thread writes them, so every step hands
+        the main thread its own copy of what moved: positions of those bodies before and after the step, and when it ended.
+        Positions are copied into a new back buffer, and published (made the front buffer) by replacing a single reference,
+        so neither thread ever waits for the other, and a frame never sees half of a step.
+        """
+        store = self.bodies
+        previous, current = self.__positions, store.pos.copy()
+        if previous is None:
+            previous = current
+        elif len(previous) != len(current):  # Store grew
+            grown = current.copy()
+            grown[:len(previous)] = previous
+            previous = grown
+        self.__positions = current
+
+        rows = np.flatnonzero(store.active & np.any(previous != current, axis=1))
+        bodies = store.bodies
+        self.__render_state = (previous[rows], current[rows], [bodies[i] for i in rows.tolist()], time.perf_counter())
+
+    @property
+    def render_alpha(self) -> float:
+        """
+        :return: How far (0 to 1) real time is from the end of the last published step to the end of the next one
+        """
+        state = self.__render_state
+        if state is None: return 0.0
+        return self.__alpha(state[3])
+
+    @staticmethod
+    def __alpha(tick_time: float) -> float:
+        return min(max((time.perf_counter() - tick_time) * Settings.physics_rate, 0.0), 1.0)
+
+    def _render_moved(self, trans: TransformAnot):
+        """
+        Any thread but the main one, :param trans: was moved there, its renderers are recalculated by _sync_render_state
+        """
+        self.__render_moved.append(trans)
+
+    def _sync_render_state(self):
+        """
+        Main thread, once per frame before anything is drawn. Bodies that moved in the last step are drawn
+        between where they were before and after it, by the alpha of the step (see Info.physics_alpha),
+        the others where physics left them. Transforms moved off the main thread (see _render_moved) are recalculated first.
+        """
+        moved = self.__render_moved
+        if moved:
+            recalculate = set()
+            while moved: recalculate.add(moved.popleft())
+            for trans in recalculate: trans._call_render_pos_changed(children=False)  # Children were handed over too
+
+        state = self.__render_state
+        if state is None: return
+        previous, current, bodies, tick_time = state
+        alpha = self.__alpha(tick_time)  # Of the state read above, render_alpha could read a newer one
+
+        drawn = set()
+        for body, (x, y) in zip(bodies, (previous + (current - previous) * alpha).tolist()):
+            if body is None: continue  # Removed while the step was being published
+            body.transform._set_render_position(x, y)
+            drawn.add(body)
+        for body in self.__interpolated - drawn:
+            body.transform._clear_render_position()
+        self.__interpolated = drawn
 
-            self.__col_iter = self.loop_colliders()
-            self.__collision_det_func()
-
-            for rb in self.loop_rbs():
-                rb.physics_update()
+    def physics_loop(self):
+        """
+        Fixed timestep loop: real time is accumulated and consumed in steps of exactly 1 / Settings.physics_rate,
+        so results don't depend on how fast the machine is. If the steps take longer than the time they simulate,
+        at most Settings.max_physics_substeps are taken per iteration and the rest of the time is dropped,
+        instead of falling further behind on every iteration. Between steps the loop sleeps.
+        """
+        self.__is_psy_loop_running = True
+        accumulator = 0.0
+        previous = time.perf_counter()
+        try:
+            while Info.is_loop_running:
+                step = 1 / Settings.physics_rate
+                now = time.perf_counter()
+                accumulator += now - previous
+                previous = now
+
+                substeps = 0
+                while accumulator >= step:
+                    if substeps == Settings.max_physics_substeps:
+                        accumulator %= step
+                        break
+                    self.step(step)
+                    accumulator -= step
+                    substeps += 1
 
-            others.__fixedDeltaTime__ = time.perf_counter() - now
+                time.sleep(max(0.0, step - accumulator - (time.perf_counter() - previous)))
+        finally:
+            self.__close_narrowphase()
+            self.__is_psy_loop_running = False
@@ -0,0 +1,156 @@
+from __future__ import annotations
+from MiniGames.Utils.type_checker import type_check, types_check
+from typing import TYPE_CHECKING
+from MiniGames.Physics.collider_base import ColliderBase
+from MiniGames.Physics.aabb import AABB
+from MiniGames.Utils.vector2 import Vector2
+from MiniGames.Utils.settings_and_info import Settings
+from MiniGames.Renderers.collider_renderer import ColliderRenderer
+from MiniGames.Renderers.shapes import ShapePolygon
+import math
+
+if TYPE_CHECKING:
+    from MiniGames.Pipeline.gameobject import GameObject
+
+
+def convex_hull(points: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """
+    Andrew's monotone chain.
+    :return: vertices of the convex hull of :param points:, counterclockwise, without collinear points
+    """
+    pts = sorted(set(points))
+    if len(pts) < 3: return pts
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower, upper = [], []
+    for p in pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0: lower.pop()
+        lower.append(p)
+    for p in reversed(pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0: upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+
+class PolygonCollider(ColliderBase):
+    """
+    Any convex shape. Vertices are given in the space of the gameobject, the collider uses their convex hull.
+    """
+
+    def __init__(self, go: GameObject):
+        super(PolygonCollider, self).__init__(go)
+        self.__hull: tuple[float, ...] = ()  # x0, y0, x1, y1... of the hull, counterclockwise
+        self.__centroid = Vector2.zero()
+        self.__world: tuple[list[float], list[float], float, float] | None = None  # xs, ys, center x, center y
+        self.__last = 0  # Index of the vertex the last support point was, where the next search starts
+        self.__shape = ShapePolygon([], Settings.colliders_thickness)
+        self.__renderer = ColliderRenderer(self, self.__shape, self.transform)
+        go._set_to("hidden_rend", self.__renderer)
+        self.vertices = [Vector2(-0.5, -0.5), Vector2(0.5, -0.5), Vector2(0.5, 0.5), Vector2(-0.5, 0.5)]
+
+    @property
+    def vertices(self) -> list[Vector2]:
+        """
+        Vertices of the convex hull, counterclockwise
+        """
+        hull = self.__hull
+        return [Vector2(hull[k], hull[k + 1]) for k in range(0, len(hull), 2)]
+
+    @vertices.setter
+    def vertices(self, value: list[Vector2]):
+        type_check("vertices", value, list)
+        for point in value: types_check("vertex", point, Vector2)
+        hull = convex_hull([(p.x, p.y) for p in value])
+        if len(hull) < 3: raise ValueError("Vertices of a polygon collider must enclose an area")
+
+        self.__hull = tuple(c for p in hull for c in p)
+        self.__centroid = self.__area_centroid(hull)
+        self.__last = 0
+        self.__shape.points = self.vertices
+        self._invalidate_bounds()
+
+    @staticmethod
+    def __area_centroid(hull: list[tuple[float, float]]) -> Vector2:
+        area = cx = cy = 0.0
+        for (x1, y1), (x2, y2) in zip(hull, hull[1:] + hull[:1]):
+            cross = x1 * y2 - x2 * y1
+            area += cross
+            cx += (x1 + x2) * cross
+            cy += (y1 + y2) * cross
+        return Vector2(cx / (3 * area), cy / (3 * area))
+
+    def remove(self) -> None:
+        self.__renderer._detach()
+        self.gameobject._remove_from("hidden_rend", self.__renderer)
+        super(PolygonCollider, self).remove()
+
+    def _invalidate_bounds(self):
+        self.__world = None
+        super(PolygonCollider, self)._invalidate_bounds()
+
+    def __world_vertices(self) -> tuple[list[float], list[float], float, float]:
+        world = self.__world
+        if world is not None: return world
+
+        trans = self.transform
+        theta = math.radians(trans.rotation)
+        cos, sin = math.cos(theta), math.sin(theta)
+        scale, pos, hull = trans.lossy_scale, trans.position, self.__hull
+        sx, sy, px, py = scale.x, scale.y, pos.x, pos.y
+        xs, ys = [], []
+        for k in range(0, len(hull), 2):
+            x, y = hull[k] * sx, hull[k + 1] * sy
+            xs.append(px + cos * x - sin * y)
+            ys.append(py + sin * x + cos * y)
+        c = self.__centroid
+        x, y = c.x * sx, c.y * sy
+        world = self.__world = (xs, ys, px + cos * x - sin * y, py + sin * x + cos * y)
+        return world
+
+    def get_center_offset(self) -> Vector2:
+        return self.__centroid
+
+    def get_center(self) -> Vector2:
+        _, _, cx, cy = self.__world_vertices()
+        return Vector2._unchecked(cx, cy)
+
+    def _center(self) -> tuple[float, float]:
+        _, _, cx, cy = self.__world_vertices()
+        return cx, cy
+
+    def _compute_bounds(self) -> AABB:
+        xs, ys, _, _ = self.__world_vertices()
+        return AABB(min(xs), min(ys), max(xs), max(ys))
+
+    def _packed_geometry(self) -> tuple[list[tuple[float, float]], float]:
+        xs, ys, _, _ = self.__world_vertices()
+        return list(zip(xs, ys)), 0.0
+
+    def _support(self, dx: float, dy: float) -> tuple[float, float]:
+        """
+        Hill climbing: dot products with the direction rise then fall around a convex polygon,
+        so walking towards the larger neighbour from the last support point reaches the furthest vertex.
+        GJK asks for directions close to the previous ones, which usually takes a step or two.
+        """
+        xs, ys, _, _ = self.__world_vertices()
+        n = len(xs)
+        i = self.__last
+        best = xs[i] * dx + ys[i] * dy
+        step, j = 1, (i + 1) % n
+        dot = xs[j] * dx + ys[j] * dy
+        if dot <= best:
+            step, j = -1, i - 1 if i else n - 1
+            dot = xs[j] * dx + ys[j] * dy
+        while dot > best:
+            i, best = j, dot
+            j = (i + step) % n
+            dot = xs[j] * dx + ys[j] * dy
+        self.__last = i
+        return xs[i], ys[i]
+
+    def furthest_point(self, direction: Vector2) -> Vector2:
+        types_check("direction", direction, Vector2)
+        x, y = self._support(direction.x, direction.y)
+        return Vector2._unchecked(x, y)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+import collections
+import csv
+import json
+import math
+import time
+
+PHASES = ("fixed_update", "broadphase", "narrowphase", "events", "solver", "integration", "other")
+FIXED_UPDATE, BROADPHASE, NARROWPHASE, EVENTS, SOLVER, INTEGRATION, OTHER = range(len(PHASES))
+COUNTERS = ("pairs", "gjk_calls", "hits")
+PAIRS, GJK_CALLS, HITS = range(len(COUNTERS))
+PERCENTILES = (50, 90, 99)
+
+
+class PhysicsProfiler:
+    """
+    Where the time of physics ticks goes. Every tick is split into consecutive laps: the time since the previous lap
+    is added to the phase the lap names, so phases add up to the whole tick.
+    Only the last :param window: ticks are kept, percentiles are rolling over them.
+    The physics system only calls it while Settings.profile_physics is on.
+    """
+
+    def __init__(self, window: int = 300):
+        self.__ticks: collections.deque[tuple] = collections.deque(maxlen=window)  # (step time, *phase times, *counters)
+        self.__times = [0.0] * len(PHASES)
+        self.__counts = [0] * len(COUNTERS)
+        self.__start = self.__last = 0.0
+
+    def __len__(self):
+        return len(self.__ticks)
+
+    @property
+    def window(self) -> int:
+        return self.__ticks.maxlen
+
+    @window.setter
+    def window(self, value: int):
+        if value == self.__ticks.maxlen: return
+        self.__ticks = collections.deque(self.__ticks, maxlen=value)
+
+    def start_tick(self):
+        self.__times = [0.0] * len(PHASES)
+        self.__counts = [0] * len(COUNTERS)
+        self.__start = self.__last = time.perf_counter()
+
+    def lap(self, phase: int):
+        """
+        :param phase: one of the phase constants of this module, what the tick was doing since the previous lap
+        """
+        now = time.perf_counter()
+        self.__times[phase] += now - self.__last
+        self.__last = now
+
+    def count(self, counter: int, amount: int = 1):
+        """
+        :param counter: one of the counter constants of this module
+        """
+        self.__counts[counter] += amount
+
+    def end_tick(self):
+        self.lap(OTHER)
+        self.__ticks.append((self.__last - self.__start, *self.__times, *self.__counts))
+
+    def clear(self):
+        self.__ticks.clear()
+
+    def __column(self, name: str) -> list[float]:
+        if name == "step": index = 0
+        elif name in PHASES: index = 1 + PHASES.index(name)
+        elif name in COUNTERS: index = 1 + len(PHASES) + COUNTERS.index(name)
+        else: raise ValueError(f"Invalid profiler stat \'{name}\', expected step, one of {', '.join(PHASES + COUNTERS)}")
+        return [tick[index] for tick in list(self.__ticks)]  # Copied first, the physics thread may be appending
+
+    def percentile(self, name: str, p: float) -> float:
+        """
+        :param name: "step", a phase or a counter
+        :param p: 0 to 100
+        :return: nearest rank percentile over the window (seconds for step and phases), 0 if no tick was profiled
+        """
+        if not 0 <= p <= 100: raise ValueError("p must be between 0 and 100")
+        return _nearest_rank(sorted(self.__column(name)), p)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        :return: {"step" / phase / counter: {"p50": .., "p90": .., "p99": .., "max": ..}} over the window
+        """
+        stats = {}
+        for name in ("step",) + PHASES + COUNTERS:
+            values = sorted(self.__column(name))
+            stat = {f"p{p}": _nearest_rank(values, p) for p in PERCENTILES}
+            stat["max"] = values[-1] if values else 0
+            stats[name] = stat
+        return stats
+
+    def dump(self, path: str):
+        """
+        Writes every tick of the window to :param path:, a .csv file (a row per tick) or a .json one (ticks and stats)
+        """
+        header, ticks = ("step",) + PHASES + COUNTERS, list(self.__ticks)
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(header)
+                writer.writerows(ticks)
+        elif path.endswith(".json"):
+            with open(path, "w") as file:
+                json.dump({"ticks": [dict(zip(header, tick)) for tick in ticks], "stats": self.stats()}, file, indent=2)
+        else:
+            raise ValueError(f"Can't dump the profiler to \'{path}\', expected a .csv or .json file")
+
+
+def _nearest_rank(values: list[float], p: float) -> float:
+    if not values: return 0
+    return values[max(math.ceil(p / 100 * len(values)) - 1, 0)]
@@ -0,0 +1,131 @@
+from __future__ import annotations
+from MiniGames.Utils.vector2 import Vector2
+from MiniGames.Physics.gjk_implementation import closest_distance
+from MiniGames.Physics.aabb import AABB
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MiniGames.Physics.collider_base import ColliderBase as ColliderBaseAnot
+
+RAYCAST_TOLERANCE = 1e-3
+RAYCAST_MAX_STEPS = 64
+
+
+class RaycastHit:
+    def __init__(self, collider: ColliderBaseAnot, point: Vector2, normal: Vector2, distance: float):
+        self.__collider = collider
+        self.__point = point
+        self.__normal = normal
+        self.__distance = distance
+
+    def __repr__(self):
+        return f"RaycastHit({self.__collider.gameobject.name}, point: {self.__point}, distance: {self.__distance})"
+
+    @property
+    def collider(self) -> ColliderBaseAnot:
+        return self.__collider
+
+    @property
+    def point(self) -> Vector2:
+        return self.__point
+
+    @property
+    def normal(self) -> Vector2:
+        return self.__normal
+
+    @property
+    def distance(self) -> float:
+        return self.__distance
+
+
+# Query shapes only implement what GJK needs (get_center, furthest_point and their float versions),
+# so they can be tested against any collider without creating a GameObject
+
+
+class _QueryPoint:
+    def __init__(self, point: Vector2):
+        self.__point = point
+
+    def get_center(self) -> Vector2:
+        return self.__point
+
+    def furthest_point(self, direction: Vector2) -> Vector2:
+        return self.__point
+
+    def _center(self) -> tuple[float, float]:
+        return self.__point.x, self.__point.y
+
+    def _support(self, dx: float, dy: float) -> tuple[float, float]:
+        return self.__point.x, self.__point.y
+
+
+class _QueryCircle:
+    def __init__(self, center: Vector2, radius: float):
+        self.__center = center
+        self.__radius = radius
+
+    @property
+    def bounds(self) -> AABB:
+        c, r = self.__center, self.__radius
+        return AABB(c.x - r, c.y - r, c.x + r, c.y + r)
+
+    def get_center(self) -> Vector2:
+        return self.__center
+
+    def furthest_point(self, direction: Vector2) -> Vector2:
+        return self.__center + direction.normalized() * self.__radius
+
+    def _center(self) -> tuple[float, float]:
+        return self.__center.x, self.__center.y
+
+    def _support(self, dx: float, dy: float) -> tuple[float, float]:
+        c, length = self.__center, math.hypot(dx, dy)
+        if length == 0: return c.x, c.y
+        return c.x + dx * self.__radius / length, c.y + dy * self.__radius / length
+
+
+class _QueryBox:
+    def __init__(self, center: Vector2, size: Vector2, rotation: float):
+        self.__center = center
+        half = size / 2
+        self.__corners = [Vector2(sx * half.x, sy * half.y).rotate(rotation) + center
+                          for sx, sy in ((1, 1), (-1, 1), (-1, -1), (1, -1))]
+        self.__packed = [(p.x, p.y) for p in self.__corners]
+
+    @property
+    def bounds(self) -> AABB:
+        xs = [p.x for p in self.__corners]
+        ys = [p.y for p in self.__corners]
+        return AABB(min(xs), min(ys), max(xs), max(ys))
+
+    def get_center(self) -> Vector2:
+        return self.__center
+
+    def furthest_point(self, direction: Vector2) -> Vector2:
+        return max(self.__corners, key=direction.dot)
+
+    def _center(self) -> tuple[float, float]:
+        return self.__center.x, self.__center.y
+
+    def _support(self, dx: float, dy: float) -> tuple[float, float]:
+        return max(self.__packed, key=lambda p: p[0] * dx + p[1] * dy)
+
+
+def raycast_collider(col: ColliderBaseAnot, origin: Vector2, direction: Vector2, t_start: float, t_end: float) -> RaycastHit | None:
+    """
+    Sphere tracing: steps along the ray by the GJK distance between the collider and the current point,
+    which can never step over a convex shape.
+    :param direction: must be normalized
+    """
+    t = t_start
+    for _ in range(RAYCAST_MAX_STEPS):
+        point = origin + direction * t
+        dist, v = closest_distance(col, _QueryPoint(point))
+        if dist <= RAYCAST_TOLERANCE:
+            # v is (point on collider - point on ray), so the surface normal points the other way
+            normal = -direction if v.sqr_mag == 0 else (-v).normalized()
+            return RaycastHit(col, point, normal, t)
+        t += dist
+        if t > t_end: return None
+    return None
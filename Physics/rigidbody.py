@@ -9,20 +9,20 @@ if TYPE_CHECKING:
 
 
 class RigidBody(MonoBehaviour):
+    """
+    State of the body (velocity, mass, forces...) lives in a row of PhysicsSystem.bodies,
+    so that all bodies can be integrated together. Properties of this class read and write that row.
+    """
     def __init__(self, gameobject: GameObject):
         super(RigidBody, self).__init__(gameobject)
-        self.__gravity_scale = 1
-        self.__mass = 1
-        self.__vel = Vector2()
-        self.__acc = Vector2()
-
-    def _collide_with(self, other: RigidBody):
-        m1, m2 = self.__mass, other.__mass
-        u1, u2 = self.__vel, other.__vel
-        rep = 1 / (m1 + m2)
-        dif = m1 - m2
-        self.__vel = (dif * u1 + 2 * m2 * u2) * rep
-        other.__vel = (2 * m1 * u1 - dif * u2) * rep
+        pos = self.transform.position
+        self.__store = Info.physics.bodies
+        self.__index = self.__store.add(self, pos.x, pos.y)
+        self.transform._bind_body(self.__store, self.__index)
+
+    @property
+    def _body_index(self) -> int:
+        return self.__index
 
     def _on_game_start_mono(self):
         pass
@@ -35,46 +35,107 @@ class RigidBody(MonoBehaviour):
         Info.instance._rem_from_rbs(self)
         self.__enabled = False
 
+    def remove(self):
+        super(RigidBody, self).remove()
+        self.transform._unbind_body()
+        self.__store.remove(self.__index)
+
     @property
     def gravity_scale(self) -> float:
-        return self.__gravity_scale
+        return float(self.__store.gravity_scale[self.__index])
 
     @gravity_scale.setter
     def gravity_scale(self, value: float):
         type_check_num("gravity_scale", value)
-        t = type(value)
-        if t is not float and t is not int:
-            raise ValueError(f"Invalid type for gravity_scale, expected 'float' got \'{t.__qualname__}\'")
-        self.__gravity_scale = float(value)
+        self.__store.gravity_scale[self.__index] = value
+
+    @property
+    def restitution(self) -> float:
+        """
+        Bounciness, 0 (the default) stops on impact, 1 bounces back with the same speed
+        """
+        return float(self.__store.restitution[self.__index])
+
+    @restitution.setter
+    def restitution(self, value: float):
+        type_check_num("restitution", value)
+        if not 0 <= value <= 1: raise ValueError("Restitution must be between 0 and 1")
+        self.__store.restitution[self.__index] = value
+
+    @property
+    def friction(self) -> float:
+        return float(self.__store.friction[self.__index])
+
+    @friction.setter
+    def friction(self, value: float):
+        type_check_num("friction", value)
+        if value < 0: raise ValueError("Friction can't be negative")
+        self.__store.friction[self.__index] = value
 
     @property
     def mass(self) -> float:
-        return self.__mass
+        return float(self.__store.mass[self.__index])
 
     @mass.setter
     def mass(self, value: float):
         type_check_num("mass", value)
         if value <= 0: raise ValueError("Mass can't be negative or zero")
-        self.__mass = value
+        self.__store.set_mass(self.__index, value)
 
     @property
     def velocity(self) -> Vector2:
-        return self.__vel
+        x, y = self.__store.vel[self.__index].tolist()
+        return Vector2(x, y)
 
     @velocity.setter
     def velocity(self, value: Vector2):
         types_check("velocity", value, Vector2)
-        if type(value) is not Vector2: raise ValueError("Velocity must be a Vector")
-        self.__vel = value
+        self.__store.vel[self.__index] = (value.x, value.y)
+        self.__store.wake(self.__index)
 
     def add_force(self, force: Vector2):
+        """
+        Forces add up, and are applied (then cleared) in the next physics tick. Gravity is applied separately.
+        """
         types_check("force", force, Vector2)
-        self.__acc = force / self.__mass
+        self.__store.force[self.__index] += (force.x, force.y)
+        self.__store.wake(self.__index)
 
-    def physics_update(self):
-        if self.__gravity_scale != 0: self.add_force(Settings.gravity * self.__gravity_scale)
-        self.__vel += self.__acc * Info.fixedDeltaTime
-        posDelta = self.__vel * Info.fixedDeltaTime
-        pos = self.transform.position
-        new_val = pos + posDelta
-        self.transform.position = new_val
+    @property
+    def is_sleeping(self) -> bool:
+        """
+        Sleeping bodies aren't integrated, and pairs whose bodies are all asleep aren't tested for collisions
+        (colliders without a rigidbody count as asleep, until they move).
+        A body wakes up when a force is added, its velocity or position is set, or an awake body touching it moves.
+        """
+        return not bool(self.__store.awake[self.__index])
+
+    @property
+    def can_sleep(self) -> bool:
+        return bool(self.__store.can_sleep[self.__index])
+
+    @can_sleep.setter
+    def can_sleep(self, value: bool):
+        type_check("can_sleep", value, bool)
+        self.__store.can_sleep[self.__index] = value
+        if not value: self.__store.wake(self.__index)
+
+    @property
+    def continuous(self) -> bool:
+        """
+        Continuous collision detection. A body moving further than its own size in one physics step can pass
+        through thin colliders, continuous bodies are instead stopped where they first touch a collider on the way.
+        Off by default, it costs a few distance queries per step, so only turn it on for fast bodies (bullets).
+        """
+        return bool(self.__store.continuous[self.__index])
+
+    @continuous.setter
+    def continuous(self, value: bool):
+        type_check("continuous", value, bool)
+        self.__store.continuous[self.__index] = value
+
+    def sleep(self):
+        self.__store.sleep(self.__index)
+
+    def wake_up(self):
+        self.__store.wake(self.__index)
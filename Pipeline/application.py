@@ -5,6 +5,8 @@ from MiniGames.Utils.input import Input
 from MiniGames.Physics.physics_system import PhysicsSystem
 from MiniGames.Pipeline.camera import Camera
 from MiniGames.Pipeline.storages import AppStorage
+from MiniGames.Pipeline.scheduler import Scheduler
+from MiniGames.Pipeline.archetypes import ComponentWorld
 from MiniGames.Utils import decorators
 import os
 import time
@@ -13,6 +15,7 @@ from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from MiniGames.Physics.rigidbody import RigidBody
+    from MiniGames.Physics.collider_base import ColliderBase
     from MiniGames.Pipeline.gameobject import GameObject
 
 
@@ -31,6 +34,8 @@ class Application:
         self.__camera = Camera(Vector2.zero())
 
         self.__Storage = AppStorage()
+        self.__world = ComponentWorld()
+        self.__scheduler = Scheduler(self.__world)
         self.__phy_sym = PhysicsSystem()
         print("Done")
 
@@ -48,14 +53,16 @@ class Application:
 
         try:
             self.__is_loop_running = True
-            # self.__phy_sym.start_physics_loop()
+            self.__phy_sym.start_physics_loop()
             self._render_loop()
         except KeyboardInterrupt:
             stop_game()
 
     def _call_physics_update(self):
-        for go in self.__Storage.loop_gos():
-            go._call_physics_update()
+        self.__scheduler.run_fixed()
+
+    def _update_game_objects(self):
+        self.__scheduler.run_frame()
 
     def _render_loop(self):
         while self.__is_loop_running:
@@ -67,22 +74,49 @@ class Application:
 
             others.Info._update_time()
             self.__camera.clear_screen()
+            self.__phy_sym._sync_render_state()
 
-            for go in self.__Storage.loop_gos():
-                go._go_update()
-
+            self._update_game_objects()
             self.__camera.update()
             Camera._wait_in_frame()
             others.__deltaTime__ = time.perf_counter() - now
 
+        self.__phy_sym._join_physics_loop()
         for go in self.__Storage.loop_gos():
             go.destroy()
 
     def _add_to_active_game_objects(self, go: GameObject):
         self.__Storage.add_to_gos(go)
+        self.__Storage.index_go(go, go.name, go.tag)
 
     def _rem_from_active_game_objects(self, go: GameObject):
         self.__Storage.rem_from_gos(go)
+        self.__Storage.unindex_go(go, go.name, go.tag)
+
+    def _reindex_game_object(self, go: GameObject, old_name: str, old_tag: str):
+        self.__Storage.unindex_go(go, old_name, old_tag)
+        self.__Storage.index_go(go, go.name, go.tag)
+
+    def _find_by_name(self, name: str) -> Iterable[GameObject]:
+        return self.__Storage.find_by_name(name)
+
+    def _find_by_tag(self, tag: str) -> Iterable[GameObject]:
+        return self.__Storage.find_by_tag(tag)
+
+    def _add_to_scheduler(self, code: str, obj):
+        self.__scheduler.register(code, obj)
+
+    def _rem_from_scheduler(self, code: str, obj):
+        self.__scheduler.unregister(code, obj)
+
+    def _add_to_components(self, comp):
+        self.__Storage.add_component(comp)
+
+    def _rem_from_components(self, comp):
+        self.__Storage.rem_component(comp)
+
+    def _find_objects_of_type(self, _t: type) -> list:
+        return self.__Storage.find_objects_of_type(_t)
 
     def _add_to_rbs(self, rb: RigidBody):
         self.__phy_sym.add_rb(rb)
@@ -96,6 +130,9 @@ class Application:
     def _rem_from_active_colliders(self, go: GameObject):
         self.__phy_sym.rem_col(go)
 
+    def _mark_collider_moved(self, col: ColliderBase):
+        self.__phy_sym._mark_collider_moved(col)
+
 
 def init():
     decorators.__IS_HIDDEN__ = False
@@ -109,6 +146,15 @@ def run():
     others.Info.instance.run()
 
 
+def find_objects_of_type(_t: type) -> list:
+    """
+    :return: every component of the active gameobjects that is a :param _t: (subclasses included)
+    """
+    if others.Info.instance is None: raise BrokenPipeError("Too early to find objects. Must call \"App.init\" first")
+    if not isinstance(_t, type): raise TypeError(f"Invalid type for '_t': Expected a class got '{type(_t).__qualname__}'")
+    return others.Info.instance._find_objects_of_type(_t)
+
+
 def resources_path():
     return path.join(path.dirname(path.dirname(path.realpath(__file__))), "Resources")
 
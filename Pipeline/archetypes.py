@@ -0,0 +1,243 @@
+from __future__ import annotations
+from MiniGames.Pipeline.monobehaviour import MonoBehaviour
+from MiniGames.Utils.type_checker import type_check
+from MiniGames.Utils.decorators import inner_method
+import numpy as np
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    from MiniGames.Pipeline.gameobject import GameObject as GameObjectAnot
+
+
+class DataComponent(MonoBehaviour):
+    """
+    MonoBehaviour whose data lives in the archetype tables of the ComponentWorld (see Info.components) while it's enabled,
+    so Systems can process every component of a type with a few NumPy operations, instead of an update per component.
+    Subclasses declare their fields with their defaults, which also give the dtype and shape of the column,
+    and get a property per field:
+
+        class Velocity(DataComponent):
+            fields = {"velocity": (0.0, 0.0), "damping": 0.0}
+
+    A gameobject can have one DataComponent of each type. Tables are keyed by exact types, subclasses get their own columns.
+    """
+    fields: dict[str, typing.Any] = {}
+    _data_fields: dict[str, tuple[typing.Any, np.dtype, tuple]] = {}  # name: (default, dtype, shape), inherited fields included
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        declared = cls.__dict__.get("fields", {})
+        type_check("fields", declared, dict)
+        data_fields = dict(cls._data_fields)
+        for name, default in declared.items():
+            type_check("field name", name, str)
+            if not name.isidentifier(): raise ValueError(f"Invalid field name \'{name}\', must be an identifier")
+            array = np.asarray(default)
+            if array.dtype == object: raise ValueError(f"Field \'{name}\' must default to a number, bool, or a sequence of them")
+            data_fields[name] = (array.tolist(), array.dtype, array.shape)
+            setattr(cls, name, cls.__field_property(name, array.dtype, array.shape))
+        cls._data_fields = data_fields
+
+    @staticmethod
+    def __field_property(name: str, dtype: np.dtype, shape: tuple) -> property:
+        scalar = not shape
+
+        def getter(self: DataComponent):
+            table = self.__table
+            value = self.__values[name] if table is None else table._row_of(type(self), name, self.__row).tolist()
+            return value if scalar else tuple(value)
+
+        def setter(self: DataComponent, value):
+            table = self.__table
+            if table is None:
+                self.__values[name] = np.asarray(value, dtype=dtype).reshape(shape).tolist()
+            else:
+                table._set_row(type(self), name, self.__row, value)
+
+        return property(getter, setter)
+
+    @inner_method
+    def __init__(self, gameobject: GameObjectAnot):
+        super(DataComponent, self).__init__(gameobject)
+        if any(type(comp) is type(self) for comp in gameobject.get_all_components(type(self))):
+            raise ValueError(f"Gameobject {gameobject.name} already has a {type(self).__qualname__}")
+        self.__values = {name: default for name, (default, _, _) in self._data_fields.items()}  # While not in a table
+        self.__table: ArchetypeTable | None = None
+        self.__row = 0
+
+    def _enable_mono(self):
+        super(DataComponent, self)._enable_mono()
+        self.gameobject._set_to("data", self)
+
+    def _disable_mono(self):
+        super(DataComponent, self)._disable_mono()
+        self.gameobject._remove_from("data", self)
+
+
+class ArchetypeTable:
+    """
+    Every gameobject whose enabled DataComponents are exactly :param types:, a row each.
+    Columns are NumPy arrays, one per field of every type, and grow by doubling.
+    """
+
+    def __init__(self, types: frozenset[type], capacity: int = 64):
+        self.types = types
+        self.count = 0
+        self.gameobjects: list[GameObjectAnot] = []
+        self.components: dict[type, list[DataComponent]] = {t: [] for t in types}
+        self.__columns: dict[tuple[type, str], np.ndarray] = {}
+        for t in types:
+            for name, (_, dtype, shape) in t._data_fields.items():
+                self.__columns[(t, name)] = np.zeros((capacity, *shape), dtype=dtype)
+
+    def __len__(self):
+        return self.count
+
+    def column(self, component: type, field: str) -> np.ndarray:
+        """
+        :return: view of the values of :param field: of every :param component: in the table, writing to it writes the fields
+        """
+        return self.__columns[(component, field)][:self.count]
+
+    def _row_of(self, component: type, field: str, row: int) -> np.ndarray:
+        return self.__columns[(component, field)][row]
+
+    def _set_row(self, component: type, field: str, row: int, value):
+        self.__columns[(component, field)][row] = value
+
+    def __grow(self):
+        for key, column in self.__columns.items():
+            grown = np.zeros((len(column) * 2, *column.shape[1:]), dtype=column.dtype)
+            grown[:len(column)] = column
+            self.__columns[key] = grown
+
+    def _append(self, go: GameObjectAnot, components: dict[type, DataComponent], values: dict[type, dict[str, typing.Any]]) -> int:
+        """
+        :param values: field values of every component, by type
+        :return: row of :param go:
+        """
+        if self.__columns and self.count == len(next(iter(self.__columns.values()))): self.__grow()
+        row = self.count
+        self.count += 1
+        self.gameobjects.append(go)
+        for t, comp in components.items():
+            self.components[t].append(comp)
+            comp._DataComponent__table, comp._DataComponent__row = self, row
+            for name, value in values[t].items():
+                self.__columns[(t, name)][row] = value
+        return row
+
+    def _remove(self, row: int) -> tuple[GameObjectAnot | None, dict[type, dict[str, typing.Any]]]:
+        """
+        Moves the last row into :param row:
+        :return: (gameobject that was moved into row, None if it was the last one, field values of the removed row by type)
+        """
+        last = self.count - 1
+        values = {}
+        for t, comps in self.components.items():
+            values[t] = {name: self.__columns[(t, name)][row].tolist() for name in t._data_fields}
+            removed = comps[row]
+            removed._DataComponent__table = None
+            if row != last:
+                for name in t._data_fields:
+                    column = self.__columns[(t, name)]
+                    column[row] = column[last]
+                comps[row] = comps[last]
+                comps[row]._DataComponent__row = row
+            comps.pop()
+
+        moved = None
+        if row != last:
+            moved = self.gameobjects[row] = self.gameobjects[last]
+        self.gameobjects.pop()
+        self.count = last
+        return moved, values
+
+
+class System:
+    """
+    Runs every frame, between update and late_update, once per archetype table holding all of its components
+    (see ComponentWorld.add_system).
+    """
+    components: tuple[type, ...] = ()
+
+    def update(self, table: ArchetypeTable): raise NotImplementedError()
+
+
+class ComponentWorld:
+    """
+    Archetype tables of the enabled DataComponents of active gameobjects. Components are added and removed from any thread,
+    the changes are applied on the main thread, when systems run next (like DeferredSet).
+    """
+    @inner_method
+    def __init__(self):
+        self.__tables: dict[frozenset[type], ArchetypeTable] = {}
+        self.__where: dict[GameObjectAnot, tuple[ArchetypeTable, int]] = {}
+        self.__systems: list[System] = []
+        self.__changes: list[tuple[DataComponent, bool]] = []
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__where)
+
+    def add(self, comp: DataComponent):
+        with self.__lock:
+            self.__changes.append((comp, True))
+
+    def remove(self, comp: DataComponent):
+        with self.__lock:
+            self.__changes.append((comp, False))
+
+    def __apply_changes(self):
+        if not self.__changes: return
+        with self.__lock:
+            changes, self.__changes = self.__changes, []
+        for comp, add in changes:
+            attached = comp._DataComponent__table is not None
+            if add != attached: self.__move(comp.gameobject, comp, add)
+
+    def __move(self, go: GameObjectAnot, comp: DataComponent, add: bool):
+        """
+        Moves :param go: to the table of its archetype with (or without) :param comp:
+        """
+        components, values = {}, {}
+        if go in self.__where:
+            table, row = self.__where.pop(go)
+            components = {t: table.components[t][row] for t in table.types}
+            moved, values = table._remove(row)
+            if moved is not None: self.__where[moved] = (table, row)
+
+        if add:
+            components[type(comp)] = comp
+            values[type(comp)] = comp._DataComponent__values
+        else:
+            components.pop(type(comp))
+            comp._DataComponent__values = values.pop(type(comp))
+        if not components: return
+
+        types = frozenset(components)
+        table = self.__tables.get(types)
+        if table is None:
+            table = self.__tables[types] = ArchetypeTable(types)
+        self.__where[go] = (table, table._append(go, components, values))
+
+    def query(self, *components: type) -> list[ArchetypeTable]:
+        """
+        :return: tables that hold all of :param components: (and possibly others), and aren't empty
+        """
+        self.__apply_changes()
+        wanted = frozenset(components)
+        return [table for table in self.__tables.values() if table.count and wanted <= table.types]
+
+    def add_system(self, system: System):
+        if system not in self.__systems: self.__systems.append(system)
+
+    def remove_system(self, system: System):
+        if system in self.__systems: self.__systems.remove(system)
+
+    def run_systems(self):
+        self.__apply_changes()  # Even without systems, so changes don't pile up and len stays right
+        for system in self.__systems:
+            for table in self.query(*system.components):
+                system.update(table)
@@ -6,10 +6,12 @@ import pygame  # Only for rendering purposes
 from MiniGames.Utils import color as mod_color
 from MiniGames.Utils import settings_and_info as mod_sai
 from MiniGames.Utils import vector2 as mod_vec
+from MiniGames.Physics import aabb as mod_aabb
 from MiniGames.Utils.decorators import inner_method
 if typing.TYPE_CHECKING:
     from MiniGames.Utils.vector2 import Vector2 as VectorAn
     from MiniGames.Utils.color import Color as ColorAnot
+    from MiniGames.Physics.aabb import AABB as AABBAnot
 
 
 class Camera:
@@ -46,6 +48,21 @@ class Camera:
     def screen_size() -> tuple[int, int]:
         return Camera.__active.__screen.get_size()
 
+    @staticmethod
+    def world_bounds() -> AABBAnot:
+        """
+        :return: The part of the world (in units) that is currently visible on screen
+        """
+        cam = Camera.__active
+        scale = mod_sai.Settings.space_scale
+        hw, hh = mod_sai.Settings.half_screen_width / scale.x, mod_sai.Settings.half_screen_height / scale.y
+        return mod_aabb.AABB(cam.__pos.x - hw, cam.__pos.y - hh, cam.__pos.x + hw, cam.__pos.y + hh)
+
+    @staticmethod
+    def is_visible(bounds: AABBAnot) -> bool:
+        types_check("bounds", bounds, mod_aabb.AABB)
+        return Camera.world_bounds().overlaps(bounds)
+
     @staticmethod
     def put(obj, pos: VectorAn):
         Camera.__active.__screen.blit(obj, Camera.trans_point(pos))
@@ -5,8 +5,10 @@ from MiniGames.Pipeline import monobehaviour as mod_mono
 from MiniGames.Pipeline.transform import Transform
 from MiniGames.Pipeline.coroutines import WaitFor
 from MiniGames.Pipeline.storages import GameObjectsStorage
+from MiniGames.Pipeline.scheduler import SCHEDULED_CODES
 from MiniGames.Physics.collider_base import ColliderBase
 from MiniGames.Physics.rigidbody import RigidBody
+from MiniGames.Physics.collision_events import EVENT_CODES
 from MiniGames.Utils.settings_and_info import Info, Settings
 from MiniGames.Utils.exceptions import InvalidComponentException
 from MiniGames.Utils.exceptions import MultiRigidbodyException
@@ -18,13 +20,17 @@ if typing.TYPE_CHECKING:
     from MiniGames.Pipeline.monobehaviour import MonoBehaviour as MonoAnot
 
 
+UNTAGGED = "Untagged"
+
+
 class GameObject:
     def __init__(self, name: str):
         type_check("name", name, str)
         if not Info.has_been_init():
             raise BrokenPipeError("Too early to create a Game Object. Must call \"App.init\" first")
         self.__rb = None
-        self.name = name
+        self.__name = name
+        self.__tag = UNTAGGED
         self.__transform = Transform(self)
         self.__is_active = False
         self.__activate_on_start = True
@@ -32,6 +38,8 @@ class GameObject:
         self.__Storage = GameObjectsStorage()
         decorators.__IS_HIDDEN__ = True
         self.__activate_when_parent_does = True
+        self._collision_listeners = 0  # Bit e is set while a MonoBehaviour listens to collision event e, see collision_events
+        self.__listed = True  # In the active gameobjects of the application, what it has to call is in the scheduler
         Info.instance._add_to_active_game_objects(self)
         if Info.is_loop_running:
             self._on_go_start()
@@ -40,6 +48,52 @@ class GameObject:
     def gameobject(self) -> GameObject:
         return self
 
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @name.setter
+    def name(self, value: str):
+        type_check("name", value, str)
+        old = self.__name
+        self.__name = value
+        if self.__listed: Info.instance._reindex_game_object(self, old, self.__tag)
+
+    @property
+    def tag(self) -> str:
+        return self.__tag
+
+    @tag.setter
+    def tag(self, value: str):
+        type_check("tag", value, str)
+        old = self.__tag
+        self.__tag = value
+        if self.__listed: Info.instance._reindex_game_object(self, self.__name, old)
+
+    @staticmethod
+    def find(name: str) -> GameObject | None:
+        """
+        :return: an active gameobject named :param name:, None if there is none
+        """
+        type_check("name", name, str)
+        return next(iter(Info.instance._find_by_name(name)), None)
+
+    @staticmethod
+    def find_with_tag(tag: str) -> GameObject | None:
+        """
+        :return: an active gameobject tagged :param tag:, None if there is none
+        """
+        type_check("tag", tag, str)
+        return next(iter(Info.instance._find_by_tag(tag)), None)
+
+    @staticmethod
+    def find_all_with_tag(tag: str) -> list[GameObject]:
+        """
+        :return: every active gameobject tagged :param tag:
+        """
+        type_check("tag", tag, str)
+        return list(Info.instance._find_by_tag(tag))
+
     @property
     def transform(self) -> Transform:
         return self.__transform
@@ -58,40 +112,82 @@ class GameObject:
 
     def _set_to(self, code: str, mono: MonoAnot or ColliderBase or RendererBaseAnot):
         self.__Storage.add_to(code, mono)
+        if self.__listed and code in SCHEDULED_CODES: Info.instance._add_to_scheduler(code, mono)
+        if code in EVENT_CODES: self.__refresh_collision_listeners()
 
     def _remove_from(self, code: str, mono: MonoAnot):
         self.__Storage.rem_from(code, mono)
+        if code in SCHEDULED_CODES: Info.instance._rem_from_scheduler(code, mono)
+        if code in EVENT_CODES: self.__refresh_collision_listeners()
 
     def _add_to_multiple(self, mono: MonoAnot, *codes):
         for code in codes:
-            self.__Storage.add_to(code, mono)
+            self._set_to(code, mono)
 
     def _remove_from_multiple(self, mono: MonoAnot, *codes):
         for code in codes:
-            self.__Storage.rem_from(code, mono)
+            self._remove_from(code, mono)
+
+    def __refresh_collision_listeners(self):
+        storage, listeners = self.__Storage, 0
+        for event, code in enumerate(EVENT_CODES):
+            if getattr(storage, code): listeners |= 1 << event
+        self._collision_listeners = listeners
+
+    def __set_listed(self, listed: bool):
+        """
+        Inactive gameobjects keep their monos, renderers and coroutines, out of the scheduler
+        """
+        if listed == self.__listed: return
+        app, storage = Info.instance, self.__Storage
+        self.__listed = listed
+        if listed:
+            app._add_to_active_game_objects(self)
+            for comps in storage.components.values():
+                for comp in comps: app._add_to_components(comp)
+            for code in SCHEDULED_CODES[:-1]:
+                for obj in storage.loop(code): app._add_to_scheduler(code, obj)
+            if storage.cour: app._add_to_scheduler("cour", self)
+        else:
+            app._rem_from_active_game_objects(self)
+            for comps in storage.components.values():
+                for comp in comps: app._rem_from_components(comp)
+            for code in SCHEDULED_CODES[:-1]:
+                for obj in storage.loop(code): app._rem_from_scheduler(code, obj)
+            app._rem_from_scheduler("cour", self)
+
+    def __is_active_now(self) -> bool:
+        """
+        Whether it's active, or will be when the game starts
+        """
+        return self.__is_active if Info.is_loop_running else self.__activate_on_start
+
+    def __set_active(self, value: bool):
+        if Info.is_loop_running:
+            if not value: self._call_on_monos("on_disabled")
+            self.__is_active = value
+            if value: self._call_on_monos("on_enabled")
+        else:
+            self.__activate_on_start = value
+        self.__set_listed(value)
 
     def _parent_activated(self):
-        self.__is_active = self.__activate_when_parent_does
-        self._call_on_monos("on_enabled")
+        if not self.__activate_when_parent_does: return  # Deactivated itself, its children stay inactive with it
+        self.__set_active(True)
         for child in self.__transform:
             child.gameobject._parent_activated()
 
     def _parent_deactivated(self):
-        self.__activate_when_parent_does = bool(self.__is_active)
-        self.__is_active = False
-        self._call_on_monos("on_disabled")
+        self.__activate_when_parent_does = self.__is_active_now()
+        if not self.__activate_when_parent_does: return  # Its children were deactivated with it
+        self.__set_active(False)
         for child in self.__transform:
-            child.gameobject._parent_activated()
-
-    def _go_update(self):
-        for mono in self.__Storage.loop("u"): mono.update()
-        for mono in self.__Storage.loop("lu"): mono.late_update()
-        for rend in self.__Storage.loop("r"): rend._render()
-        self.__Storage.handle_courotines()
-        if not Settings.draw_colliders: return
+            child.gameobject._parent_deactivated()
 
-        for rend in self.__Storage.loop("hidden_rend"):
-            rend._render()
+    def _run_coroutines(self):
+        storage = self.__Storage
+        if storage.handle_courotines() and not storage.cour:
+            Info.instance._rem_from_scheduler("cour", self)
 
     def _call_on_monos(self, to_call: str):
         if not self.__is_active: return
@@ -111,20 +207,25 @@ class GameObject:
             go.on_collision_stay(other)
 
     def _call_on_monos_on_tri_enter(self, other: ColliderBase):
-        for go in self.__Storage.loop("ocs"):
+        for go in self.__Storage.loop("oti"):
             go.on_trigger_enter(other)
 
     def _call_on_monos_on_tri_exit(self, other: ColliderBase):
-        for go in self.__Storage.loop("ocs"):
+        for go in self.__Storage.loop("oto"):
             go.on_trigger_exit(other)
 
     def _call_on_monos_on_tri_stay(self, other: ColliderBase):
-        for go in self.__Storage.loop("ocs"):
+        for go in self.__Storage.loop("ots"):
             go.on_trigger_stay(other)
 
-    def _call_physics_update(self):
-        for mono in self.__Storage.loop("fu"):
-            mono.fixed_update()
+    def _dispatch_collision_events(self, events: list[tuple[int, ColliderBase]]):
+        """
+        :param events: (event, other collider) pairs buffered by CollisionEvents for this gameobject
+        """
+        calls = (self._call_on_monos_on_col_enter, self._call_on_monos_on_col_stay, self._call_on_monos_on_col_exit,
+                 self._call_on_monos_on_tri_enter, self._call_on_monos_on_tri_stay, self._call_on_monos_on_tri_exit)
+        for event, other in events:
+            calls[event](other)
 
     @property
     def rigid_body(self) -> RigidBody:
@@ -136,29 +237,29 @@ class GameObject:
 
     @is_active.setter
     def is_active(self, value: bool):
+        """
+        Inactive gameobjects, and their children, are out of the scheduler and can't be found, before the game starts too
+        """
         type_check("is_active", value, bool)
-        if Info.is_loop_running:
-            if value:
-                Info.instance._add_to_active_game_objects(self)
-                self._call_on_monos("on_enabled")
-            else:
-                Info.instance._rem_from_active_game_objects(self)
-                self._call_on_monos("on_disabled")
-            self.__is_active = value
-        else:
-            self.__activate_on_start = value
+        self.__activate_when_parent_does = value
+        parent = self.__transform.parent
+        if parent is not None and not parent.gameobject.__is_active_now(): return  # Applied when the parent activates
+        if value == self.__is_active_now(): return
+        self.__set_active(value)
 
-        if value:
-            for child in self.__transform:
+        for child in self.__transform:
+            if value:
                 child.gameobject._parent_activated()
-        else:
-            for child in self.__transform:
+            else:
                 child.gameobject._parent_deactivated()
 
     def get_component(self, _t: type):
-        self.__Storage.get_component(_t)
+        """
+        :return: first component added that is a :param _t: (subclasses included), None if there is none
+        """
+        return self.__Storage.get_component(_t)
 
-    def get_all_components(self, _t: type):
+    def get_all_components(self, _t: type) -> list:
         return self.__Storage.get_all_components(_t)
 
     def add_component(self, _type: type) -> MonoAnot or RendererBaseAnot:
@@ -166,8 +267,10 @@ class GameObject:
             raise InvalidComponentException(f"The given class ({_type}) doesn't inherit from MonoBehaviour")
 
         decorators.__IS_HIDDEN__ = False
-        comp = _type(self)
-        decorators.__IS_HIDDEN__ = True
+        try:
+            comp = _type(self)
+        finally:
+            decorators.__IS_HIDDEN__ = True
 
         if _type is RigidBody:
             if self.__rb is not None:
@@ -176,6 +279,8 @@ class GameObject:
             self.__rb = comp
             Info.instance._add_to_rbs(comp)
 
+        self.__Storage.add_component(comp)
+        if self.__listed: Info.instance._add_to_components(comp)
         if not issubclass(_type, ColliderBase):
             self.__Storage.add_to_all(comp)
             if Info.has_been_runned: comp._on_game_start_mono()
@@ -183,19 +288,27 @@ class GameObject:
             Info.instance._add_to_active_colliders(comp)
         return comp
 
+    def _remove_component(self, comp: MonoAnot or ColliderBase):
+        self.__Storage.rem_component(comp)
+        self.__Storage.rem_from_all(comp)
+        Info.instance._rem_from_components(comp)
+
     def destroy(self):
         if not self.__is_active: return
-        Info.instance.RemFrGameObjects(self)
+        self.__set_listed(False)
         self.__is_active = False
         for mono in self.__Storage.loop_all():
             if not mono.enabled: continue
             mono.remove()
             mono._call("on_destroy")
+        for col in self.__Storage.get_all_components(ColliderBase):
+            col.remove()
         del self
 
     def start_coroutine(self, iter: typing.Generator[WaitFor, None, None]):
         try:
             self.__Storage.add_cour(iter, iter.__next__())
+            if self.__listed: Info.instance._add_to_scheduler("cour", self)
         except StopIteration:
             pass
 
@@ -40,10 +40,10 @@ class MonoBehaviour:
         if hasattr(self, "fixed_update"): self.__gameobject._set_to("fu", self)
         if hasattr(self, "on_collision_enter"): self.__gameobject._set_to("oci", self)
         if hasattr(self, "on_collision_exit"): self.__gameobject._set_to("oco", self)
-        if hasattr(self, "on_collision_stay"): self.__gameobject._set_to("oco", self)
+        if hasattr(self, "on_collision_stay"): self.__gameobject._set_to("ocs", self)
         if hasattr(self, "on_trigger_enter"): self.__gameobject._set_to("oti", self)
         if hasattr(self, "on_trigger_exit"): self.__gameobject._set_to("oto", self)
-        if hasattr(self, "on_trigger_stay"): self.__gameobject._set_to("oto", self)
+        if hasattr(self, "on_trigger_stay"): self.__gameobject._set_to("ots", self)
         self.__enabled = True
         self._call("on_enable")
 
@@ -86,5 +86,6 @@ class MonoBehaviour:
 
     def remove(self):
         self._disable_mono()
+        self.__gameobject._remove_component(self)
         self._call("on_remove")
         del self
@@ -0,0 +1,58 @@
+from __future__ import annotations
+from MiniGames.Pipeline.storages import DeferredSet
+from MiniGames.Pipeline.archetypes import ComponentWorld
+from MiniGames.Utils.settings_and_info import Settings
+from MiniGames.Utils.decorators import inner_method
+import typing
+
+if typing.TYPE_CHECKING:
+    from MiniGames.Pipeline.gameobject import GameObject
+    from MiniGames.Pipeline.monobehaviour import MonoBehaviour
+    from MiniGames.Renderers.renderer_base import RendererBase
+
+# Storage codes of what the scheduler calls, "data" goes to the ComponentWorld, "cour" holds gameobjects with running coroutines
+SCHEDULED_CODES = ("u", "lu", "fu", "r", "hidden_rend", "data", "cour")
+
+
+class Scheduler:
+    """
+    Engine wide registries of every update, late_update and fixed_update, renderer and coroutine of the active gameobjects.
+    Every phase is one loop over everything registered for it, so every update runs before any late_update,
+    and every late_update before anything is drawn, Systems of :param world: run between update and late_update.
+    Registries are changed from any thread, the changes are applied when the phase starts next (see DeferredSet),
+    or every frame for hidden renderers, whether colliders are drawn or not.
+    fixed_update changes wait for the next physics step, DeferredSet keeps at most one per live MonoBehaviour meanwhile.
+    """
+    @inner_method
+    def __init__(self, world: ComponentWorld):
+        self.__world = world
+        self.__u = DeferredSet()
+        self.__lu = DeferredSet()
+        self.__fu = DeferredSet()  # Looped by the physics thread, the others by the main thread
+        self.__r = DeferredSet()
+        self.__hidden_rend = DeferredSet()
+        self.__cour = DeferredSet()
+        self.__registries = {"u": self.__u, "lu": self.__lu, "fu": self.__fu, "r": self.__r,
+                             "hidden_rend": self.__hidden_rend, "data": world, "cour": self.__cour}
+
+    def count(self, code: str) -> int:
+        return len(self.__registries[code])
+
+    def register(self, code: str, obj: MonoBehaviour or RendererBase or GameObject):
+        self.__registries[code].add(obj)
+
+    def unregister(self, code: str, obj: MonoBehaviour or RendererBase or GameObject):
+        self.__registries[code].remove(obj)
+
+    def run_frame(self):
+        for mono in self.__u.loop(): mono.update()
+        self.__world.run_systems()
+        for mono in self.__lu.loop(): mono.late_update()
+        for go in self.__cour.loop(): go._run_coroutines()
+        for rend in self.__r.loop(): rend._render()
+        hidden = self.__hidden_rend.loop()  # Applies its changes even while colliders aren't drawn
+        if not Settings.draw_colliders: return
+        for rend in hidden: rend._render()
+
+    def run_fixed(self):
+        for mono in self.__fu.loop(): mono.fixed_update()
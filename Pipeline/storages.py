@@ -1,5 +1,5 @@
 from __future__ import annotations
-import typing, collections
+import typing, collections, threading
 from MiniGames.Utils.settings_and_info import Info
 from MiniGames.Utils.decorators import inner_method
 if typing.TYPE_CHECKING:
@@ -10,44 +10,35 @@ if typing.TYPE_CHECKING:
 
 
 class GameObjectsStorage:
+    """
+    Callback codes ("u", "lu", "fu", "r"...) are tuples of what gets called for them, the ones the scheduler calls
+    are also registered in it (see Scheduler). Adding or removing replaces the tuple, so a loop that is running
+    keeps going over the old one (and is safe from the other thread), and changes are seen from the next loop on.
+    """
     @inner_method
     def __init__(self):
-        self.all_monos: dict[str: list[MonoBehaviour]] = {}
+        self.all_monos: dict[type, list[MonoBehaviour]] = {}
+        self.components: dict[type, list] = {}  # Every component (colliders too) by exact type
+        self.__components_of: dict[type, tuple] = {}  # Components that are instances of a type, built when it's first looked up
 
         self.cour: dict[typing.Generator[WaitFor, None, None], WaitFor] = {}
-        self.hidden_rend: set[MonoBehaviour] = set()
-        self.u: set[MonoBehaviour] = set()
-        self.lu: set[MonoBehaviour] = set()
-        self.fu: set[MonoBehaviour] = set()
-        self.oci: set[MonoBehaviour] = set()
-        self.oco: set[MonoBehaviour] = set()
-        self.ocs: set[MonoBehaviour] = set()
-        self.oti: set[MonoBehaviour] = set()
-        self.oto: set[MonoBehaviour] = set()
-        self.ots: set[MonoBehaviour] = set()
-        self.r: set[RendererBase] = set()
+        self.hidden_rend: tuple[RendererBase, ...] = ()
+        self.u: tuple[MonoBehaviour, ...] = ()
+        self.lu: tuple[MonoBehaviour, ...] = ()
+        self.fu: tuple[MonoBehaviour, ...] = ()
+        self.oci: tuple[MonoBehaviour, ...] = ()
+        self.oco: tuple[MonoBehaviour, ...] = ()
+        self.ocs: tuple[MonoBehaviour, ...] = ()
+        self.oti: tuple[MonoBehaviour, ...] = ()
+        self.oto: tuple[MonoBehaviour, ...] = ()
+        self.ots: tuple[MonoBehaviour, ...] = ()
+        self.r: tuple[RendererBase, ...] = ()
+        self.data: tuple[MonoBehaviour, ...] = ()  # Enabled DataComponents
         self.to_add: dict[str: list[MonoBehaviour]] = {}
         self.rem_fr: dict[str: list[MonoBehaviour]] = {}
 
-    def loop(self, code: str) -> collections.Iterable[MonoBehaviour]:
-        self.to_add[code] = []
-        self.rem_fr[code] = []
-
-        for i in self.__dict__[code]:
-            yield i
-
-        while self.to_add[code]:
-            new_looper = list(self.to_add[code])
-            self.to_add[code].clear()
-            for i in new_looper:
-                self.__dict__[code].add(i)
-                yield i
-
-        for ob in self.rem_fr[code]:
-            self.__dict__[code].discard(ob)
-
-        self.rem_fr.pop(code)
-        self.to_add.pop(code)
+    def loop(self, code: str) -> tuple:
+        return self.__dict__[code]
 
     def loop_all(self) -> collections.Iterable[MonoBehaviour]:
         self.to_add["all"] = []
@@ -61,35 +52,34 @@ class GameObjectsStorage:
             new_looper = list(self.to_add["all"])
             self.to_add["all"].clear()
             for i in new_looper:
-                qName = type(i).__qualname__
-                if qName in self.all_monos:
-                    if i not in self.all_monos[qName]:
-                        self.all_monos[qName].append(i)
+                _t = type(i)
+                if _t in self.all_monos:
+                    if i not in self.all_monos[_t]:
+                        self.all_monos[_t].append(i)
                         yield i
                 else:
-                    self.all_monos[qName] = [i, ]
+                    self.all_monos[_t] = [i, ]
                     yield i
 
         for ob in self.rem_fr["all"]:
-            qname = type(ob).__qualname__
-            if qname in self.all_monos and ob in self.all_monos[qname]:
-                self.all_monos[qname].remove(ob)
+            _t = type(ob)
+            if _t in self.all_monos and ob in self.all_monos[_t]:
+                self.all_monos[_t].remove(ob)
         self.rem_fr.pop("all")
         self.to_add.pop("all")
 
     def add_to(self, code: str, obj):
-        if code not in self.to_add:
-            self.__dict__[code].add(obj)
-        else:
-            self.to_add[code].append(obj)
+        items = self.__dict__[code]
+        if obj not in items:
+            self.__dict__[code] = items + (obj,)
 
     def add_to_all(self, obj):
         if "all" not in self.to_add:
-            qname = type(obj).__qualname__
-            if qname in self.all_monos:
-                self.all_monos[qname].append(obj)
+            _t = type(obj)
+            if _t in self.all_monos:
+                self.all_monos[_t].append(obj)
             else:
-                self.all_monos[qname] = [obj]
+                self.all_monos[_t] = [obj]
         else:
             self.to_add["all"].append(obj)
 
@@ -97,16 +87,15 @@ class GameObjectsStorage:
         self.cour[iter] = i
 
     def rem_from(self, code, obj):
-        if code not in self.rem_fr:
-            self.__dict__[code].discard(obj)
-        else:
-            self.rem_fr[code].append(obj)
+        items = self.__dict__[code]
+        if obj in items:
+            self.__dict__[code] = tuple(i for i in items if i is not obj)
 
     def remove_from_all(self, obj):
         if "all" not in self.rem_fr:
-            qname = type(obj).__qualname__
-            if qname in self.all_monos:
-                self.all_monos[qname].remove(obj)
+            _t = type(obj)
+            if _t in self.all_monos:
+                self.all_monos[_t].remove(obj)
         else:
             self.rem_fr["all"].append(obj)
 
@@ -116,18 +105,38 @@ class GameObjectsStorage:
         except ValueError:
             pass
 
-    def get_component(self, _t: type):
-        if _t.__qualname__ in self.all_monos:
-            return self.all_monos[_t.__qualname__][0]
-        return None
+    def add_component(self, comp):
+        self.components.setdefault(type(comp), []).append(comp)
+        self.__components_of.clear()
 
-    def get_all_components(self, _t: type):
-        if _t.__class__ in self.all_monos:
-            return self.all_monos[_t.__class__]
-        return None
+    def rem_component(self, comp):
+        comps = self.components.get(type(comp))
+        if comps is None or comp not in comps: return
+        comps.remove(comp)
+        if not comps: self.components.pop(type(comp))
+        self.__components_of.clear()
 
-    def handle_courotines(self):
-        if len(self.cour) == 0: return
+    def __instances_of(self, _t: type) -> tuple:
+        found = self.__components_of.get(_t)
+        if found is None:
+            found = self.__components_of[_t] = tuple(c for comp_t, comps in self.components.items() if issubclass(comp_t, _t) for c in comps)
+        return found
+
+    def get_component(self, _t: type):
+        """
+        :return: first component added that is a :param _t: (subclasses included), None if there is none
+        """
+        found = self.__instances_of(_t)
+        return found[0] if found else None
+
+    def get_all_components(self, _t: type) -> list:
+        return list(self.__instances_of(_t))
+
+    def handle_courotines(self) -> bool:
+        """
+        :return: whether a coroutine ended
+        """
+        if len(self.cour) == 0: return False
         to_pop = []
         for itr in self.cour:
             try:
@@ -138,6 +147,50 @@ class GameObjectsStorage:
                 to_pop.append(itr)
         for p in to_pop:
             self.cour.pop(p)
+        return bool(to_pop)
+
+
+class DeferredSet:
+    """
+    Ordered set looped by a single thread and changed from any. Changes are queued,
+    and applied when the next loop starts, so they never happen in the middle of one.
+    Only the changes that differ from the set are kept, one per item: adding then removing an item that isn't in the set
+    leaves nothing queued, so the queue stays bounded even if the set isn't looped for a long time (or ever).
+    """
+    @inner_method
+    def __init__(self):
+        self.__items: dict = {}
+        self.__changes: dict[typing.Any, bool] = {}  # item: add it or remove it
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__items)
+
+    def add(self, obj):
+        with self.__lock:
+            if obj in self.__items:
+                self.__changes.pop(obj, None)
+            else:
+                self.__changes[obj] = True
+
+    def remove(self, obj):
+        with self.__lock:
+            if obj in self.__items:
+                self.__changes[obj] = False
+            else:
+                self.__changes.pop(obj, None)
+
+    def loop(self) -> typing.Iterable:
+        if self.__changes:
+            with self.__lock:  # Items only change with the lock held, add and remove compare against them
+                items = self.__items
+                for obj, add in self.__changes.items():
+                    if add:
+                        items[obj] = None
+                    else:
+                        del items[obj]
+                self.__changes = {}
+        return self.__items
 
 
 class AppStorage:
@@ -147,6 +200,49 @@ class AppStorage:
         self._to_add_gos = []
         self._to_rem_gos = []
         self._looping_gos = False
+        self._by_name: dict[str, dict[GameObject, None]] = {}  # Active gameobjects by name, dicts are ordered sets
+        self._by_tag: dict[str, dict[GameObject, None]] = {}  # Active gameobjects by tag
+        self._components: dict[type, dict] = {}  # Components of the active gameobjects by exact type, dicts are ordered sets
+        self._components_of: dict[type, dict] = {}  # Components that are instances of a type, kept up to date once looked up
+
+    def index_go(self, go: GameObject, name: str, tag: str):
+        self._by_name.setdefault(name, {})[go] = None
+        self._by_tag.setdefault(tag, {})[go] = None
+
+    def unindex_go(self, go: GameObject, name: str, tag: str):
+        for index, key in ((self._by_name, name), (self._by_tag, tag)):
+            gos = index.get(key)
+            if gos is None: continue
+            gos.pop(go, None)
+            if not gos: index.pop(key)
+
+    def find_by_name(self, name: str) -> typing.Iterable[GameObject]:
+        return self._by_name.get(name, ())
+
+    def find_by_tag(self, tag: str) -> typing.Iterable[GameObject]:
+        return self._by_tag.get(tag, ())
+
+    def add_component(self, comp):
+        _t = type(comp)
+        self._components.setdefault(_t, {})[comp] = None
+        for of_t, comps in self._components_of.items():
+            if issubclass(_t, of_t): comps[comp] = None
+
+    def rem_component(self, comp):
+        comps = self._components.get(type(comp))
+        if comps is None or comp not in comps: return
+        comps.pop(comp)
+        for comps in self._components_of.values():
+            comps.pop(comp, None)
+
+    def find_objects_of_type(self, _t: type) -> list:
+        found = self._components_of.get(_t)
+        if found is None:
+            found = {}
+            for comp_t, comps in list(self._components.items()):
+                if issubclass(comp_t, _t): found.update(comps)
+            self._components_of[_t] = found
+        return list(found)
 
     def loop_gos(self) -> typing.Iterable[GameObject]:
         self._looping_gos = True
@@ -187,6 +283,7 @@ class LayeredStorage:
         self.__inner = {}
         self.__all_layers = []
         self.__exclude = set()
+        self.__exclude_masks: dict[int, int] = {}  # bit j of __exclude_masks[i] is set, if layers i and j are excluded
 
     def add_obj(self, layer: int, obj):
         if layer in self.__inner:
@@ -222,10 +319,17 @@ class LayeredStorage:
         self.__exclude.discard(layer)
 
     def exclude_double(self, layer1: int, layer2: int):
-        self.__exclude.add(get_double_id(layer1, layer2))
+        masks = self.__exclude_masks
+        masks[layer1] = masks.get(layer1, 0) | (1 << layer2)
+        masks[layer2] = masks.get(layer2, 0) | (1 << layer1)
 
     def include_double(self, layer1: int, layer2: int):
-        self.__exclude.discard(get_double_id(layer1, layer2))
+        masks = self.__exclude_masks
+        masks[layer1] = masks.get(layer1, 0) & ~(1 << layer2)
+        masks[layer2] = masks.get(layer2, 0) & ~(1 << layer1)
+
+    def is_double_excluded(self, layer1: int, layer2: int) -> bool:
+        return bool(self.__exclude_masks.get(layer1, 0) & (1 << layer2))
 
     def loop_single(self):
         for lyr in self.__all_layers:
@@ -234,20 +338,18 @@ class LayeredStorage:
                 yield item
 
     def loop_double(self):
+        masks = self.__exclude_masks
         for index, layer1 in enumerate(self.__all_layers):
+            mask = masks.get(layer1, 0)
             for layer2 in self.__all_layers[index + 1:]:
-                if get_double_id(layer1, layer2) in self.__exclude: continue
+                if mask & (1 << layer2): continue
 
                 for obj1 in self.__inner[layer1]:
                     for obj2 in self.__inner[layer2]:
                         yield obj1, obj2
 
-            if get_double_id(layer1, layer1) in self.__exclude: continue
+            if mask & (1 << layer1): continue
             layer_objs = self.__inner[layer1]
             for i, obj1 in enumerate(layer_objs):
                 for obj2 in layer_objs[i + 1:]:
                     yield obj1, obj2
-
-
-def get_double_id(lyr1: int, lyr2: int):
-    return str((1 << lyr1) | (1 << lyr2))
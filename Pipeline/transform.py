@@ -2,14 +2,16 @@ from __future__ import annotations
 from MiniGames.Utils.type_checker import type_check, types_check, type_check_num
 import collections
 import math
+import threading
 import typing
 from MiniGames.Utils.exceptions import InvalidHierarchyException
-from MiniGames.Utils.settings_and_info import Settings
+from MiniGames.Utils.settings_and_info import Settings, Info
 from MiniGames.Utils.vector2 import Vector2
 from MiniGames.Utils import decorators
 from MiniGames.Pipeline.monobehaviour import MonoBehaviour
 if typing.TYPE_CHECKING:
     from MiniGames.Pipeline.gameobject import GameObject as GameObjectAnot
+    from MiniGames.Physics.body_store import BodyStore as BodyStoreAnot
 
 
 class Transform(MonoBehaviour):
@@ -24,6 +26,11 @@ class Transform(MonoBehaviour):
         self.__on_pos_changed: list[typing.Callable[[], None]] = []
         self.__on_sca_changed: list[typing.Callable[[], None]] = []
         self.__on_rot_changed: list[typing.Callable[[], None]] = []
+        self.__on_render_pos_changed: list[typing.Callable[[], None]] = []  # Renderers, only ever called from the main thread
+        self.__render_pos: Vector2 | None = None  # Interpolated physics position, see PhysicsSystem._sync_render_state
+        self.__body_store: BodyStoreAnot | None = None  # Row of the RigidBody of the gameobject, see _bind_body
+        self.__body_index = 0
+        self.__body_xy: tuple[float, float] | None = None  # Store position __loc_uPos was last read from
 
         self.__parent: Transform = None
         self.__children: list[Transform] = []
@@ -33,10 +40,11 @@ class Transform(MonoBehaviour):
             yield i
 
     def __str__(self):
-        return f"Transform(pos: {self.__loc_uPos}, scale: {self.__loc_sca}, rot: {self.__loc_rot})"
+        return f"Transform(pos: {self.local_position}, scale: {self.__loc_sca}, rot: {self.__loc_rot})"
 
     def _add_to_on_pos_change(self, func: typing.Callable[[], None]):
         self.__on_pos_changed.append(func)
+        self.__update_body_notify()
 
     def _add_to_on_scale_change(self, func: typing.Callable[[], None]):
         self.__on_sca_changed.append(func)
@@ -44,12 +52,51 @@ class Transform(MonoBehaviour):
     def _add_to_on_rot_change(self, func: typing.Callable[[], None]):
         self.__on_rot_changed.append(func)
 
-    def _call_pos_changed(self):
+    def _add_to_on_render_pos_change(self, func: typing.Callable[[], None]):
+        self.__on_render_pos_changed.append(func)
+
+    def _rem_from_on_render_pos_change(self, func: typing.Callable[[], None]):
+        if func in self.__on_render_pos_changed: self.__on_render_pos_changed.remove(func)
+
+    def _rem_from_on_pos_change(self, func: typing.Callable[[], None]):
+        if func in self.__on_pos_changed: self.__on_pos_changed.remove(func)
+        self.__update_body_notify()
+
+    def _rem_from_on_scale_change(self, func: typing.Callable[[], None]):
+        if func in self.__on_sca_changed: self.__on_sca_changed.remove(func)
+
+    def _rem_from_on_rot_change(self, func: typing.Callable[[], None]):
+        if func in self.__on_rot_changed: self.__on_rot_changed.remove(func)
+
+    def _call_pos_changed(self, render: bool = True):
+        """
+        :param render: False when the physics thread moved the transform, renderers then follow the published
+        render state instead (see PhysicsSystem._sync_render_state), on the main thread.
+        Renderers are only ever recalculated on the main thread, moves from other threads (e.g. fixed_update)
+        are handed to it through PhysicsSystem._render_moved
+        """
         for func in self.__on_pos_changed:
             func()
+        if render and self.__body_store is not None:
+            self.__push_to_body()
+        if render:
+            self.__render_pos = None
+            if threading.current_thread() is threading.main_thread():
+                for func in self.__on_render_pos_changed:
+                    func()
+            elif self.__on_render_pos_changed:
+                Info.physics._render_moved(self)
+
+        for trans in self.__children:
+            trans._call_pos_changed(render)
+
+    def _call_render_pos_changed(self, children: bool = True):
+        for func in self.__on_render_pos_changed:
+            func()
+        if not children: return
 
         for trans in self.__children:
-            trans._call_pos_changed()
+            trans._call_render_pos_changed()
 
     def _call_scale_changed(self):
         for func in self.__on_sca_changed:
@@ -73,10 +120,64 @@ class Transform(MonoBehaviour):
     def _add_child(self, child: Transform):
         if child not in self.__children:
             self.__children.append(child)
+            self.__update_body_notify()
 
     def _remove_child(self, child: Transform):
         if child in self.__children:
             self.__children.remove(child)
+            self.__update_body_notify()
+
+    def _bind_body(self, store: BodyStoreAnot, index: int):
+        """
+        Physics then writes the position of the body to :param store: (row :param index:) without telling the transform,
+        which reads it back when asked. Only transforms that are listened to are told (see BodyStore.write_back)
+        """
+        self.__body_store, self.__body_index = store, index
+        self.__push_to_body()
+        self.__update_body_notify()
+
+    def _unbind_body(self):
+        self.__pull_body_position()
+        self.__body_store = None
+        self.__body_xy = None
+
+    def __update_body_notify(self):
+        store = self.__body_store
+        if store is None: return
+        store.notify[self.__body_index] = self.__parent is not None or bool(self.__children) or bool(self.__on_pos_changed)
+
+    def __pull_body_position(self):
+        """
+        Root transforms of bodies read their position from the store, children are told when it changes (see _body_moved)
+        """
+        store = self.__body_store
+        if store is None or self.__parent is not None: return
+        xy = tuple(store.synced[self.__body_index].tolist())
+        if xy == self.__body_xy: return
+        self.__body_xy = xy
+        self.__loc_uPos = Vector2._unchecked(*xy)._fix_self()
+
+    def __push_to_body(self):
+        """
+        The transform was moved outside of physics, the body continues from there
+        """
+        pos, index = self.position, self.__body_index
+        store = self.__body_store
+        store.pos[index] = store.synced[index] = (pos.x, pos.y)
+        self.__body_xy = tuple(store.synced[index].tolist()) if self.__parent is None else None
+        store.wake(index)
+
+    def _body_moved(self):
+        """
+        Physics thread, called by BodyStore.write_back when the body moved and something listens to this transform.
+        Renderers aren't told, they follow the published render state.
+        """
+        if self.__parent is not None:
+            x, y = self.__body_store.synced[self.__body_index].tolist()
+            new_pos = Vector2._unchecked(x, y) - self.__parent.position
+            new_pos.rotate_self(-self.__parent.rotation)
+            self.__loc_uPos = (new_pos / self.__parent.lossy_scale)._fix_self()
+        self._call_pos_changed(render=False)
 
     def _enable_mono(self):
         pass
@@ -101,6 +202,7 @@ class Transform(MonoBehaviour):
 
         if trans is None:
             self.__parent = trans
+            self.__update_body_notify()
             self.local_rotation = global_rot
             self.local_scale = global_sca
             self.local_position = global_pos
@@ -110,6 +212,7 @@ class Transform(MonoBehaviour):
             raise InvalidHierarchyException(
                 f"{trans.gameobject.name} can't be parent of {self.gameobject.name}, because, its a child (or sub-child)")
         self.__parent = trans
+        self.__update_body_notify()
         self.rotation = global_rot
         self.local_scale = global_sca / self.parent.lossy_scale
         self.position = global_pos
@@ -130,11 +233,29 @@ class Transform(MonoBehaviour):
 
     @property
     def global_pos_in_pixels(self) -> Vector2:
-        return __U2P__Point__(self.position)
+        """
+        Where the transform is drawn, on screen. For bodies moved by physics, that's between the last two physics steps
+        """
+        return __U2P__Point__(self._render_position)
+
+    @property
+    def _render_position(self) -> Vector2:
+        if self.__render_pos is not None: return self.__render_pos
+        if self.__parent is None: return self.local_position
+        return (self.__loc_uPos * self.__parent.lossy_scale).rotate(self.parent.rotation) + self.__parent._render_position
+
+    def _set_render_position(self, x: float, y: float):
+        self.__render_pos = Vector2._unchecked(x, y)
+        self._call_render_pos_changed()
+
+    def _clear_render_position(self):
+        if self.__render_pos is None: return
+        self.__render_pos = None
+        self._call_render_pos_changed()
 
     @property
     def position(self) -> Vector2:
-        if self.__parent is None: return self.__loc_uPos
+        if self.__parent is None: return self.local_position
         return (self.__loc_uPos * self.__parent.lossy_scale).rotate(self.parent.rotation) + self.__parent.position
 
     @position.setter
@@ -199,12 +320,13 @@ class Transform(MonoBehaviour):
 
     @property
     def local_position(self) -> Vector2:
+        if self.__body_store is not None: self.__pull_body_position()
         return self.__loc_uPos
 
     @local_position.setter
     def local_position(self, value: Vector2):
         types_check("local_position", value, Vector2)
-        if self.__loc_uPos == value: return
+        if self.local_position == value: return
 
         self.__loc_uPos = value._fix_self()
         self.__loc_pPos = __U2P__Point__(value)._fix_self()
@@ -2,6 +2,7 @@ from __future__ import annotations
 from MiniGames.Utils.type_checker import type_check, types_check
 
 from MiniGames.Utils.settings_and_info import Settings
+from MiniGames.Pipeline.camera import Camera
 
 import typing
 from MiniGames.Utils.decorators import inner_method
@@ -21,10 +22,15 @@ class ColliderRenderer:
         self.__shape._set_renderer(self)
         self.__collider = collider
 
-        self.transform._add_to_on_pos_change(self.__shape._recalculate_pos)
+        self.transform._add_to_on_render_pos_change(self.__shape._recalculate_pos)
         self.transform._add_to_on_scale_change(self.__shape._recalculate_scale)
         self.transform._add_to_on_rot_change(self.__shape._recalculate_rot)
 
+    def _detach(self):
+        self.transform._rem_from_on_render_pos_change(self.__shape._recalculate_pos)
+        self.transform._rem_from_on_scale_change(self.__shape._recalculate_scale)
+        self.transform._rem_from_on_rot_change(self.__shape._recalculate_rot)
+
     @property
     def transform(self):
         return self.__transform
@@ -34,6 +40,7 @@ class ColliderRenderer:
         return Settings.colliders_color
 
     def _render(self):
+        if not Camera.is_visible(self.__collider.bounds): return
         self.__shape._render()
 
     @property
@@ -12,7 +12,7 @@ class PointRenderer(RendererBase):
         super(PointRenderer, self).__init__(gameobject)
         self.__pPos = Vector2()
 
-    def _recalculate_pos(self): self.__pPos = __U2P__Point__(self.transform.position)
+    def _recalculate_pos(self): self.__pPos = __U2P__Point__(self.transform._render_position)
     def _recalculate_rot(self): pass
     def _recalculate_scale(self): pass
 
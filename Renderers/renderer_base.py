@@ -12,7 +12,7 @@ class RendererBase(MonoBehaviour):
         super(RendererBase, self).__init__(gameobject)
         self.__color = Color.white()
 
-        self.transform._add_to_on_pos_change(self._recalculate_pos)
+        self.transform._add_to_on_render_pos_change(self._recalculate_pos)
         self.transform._add_to_on_scale_change(self._recalculate_scale)
         self.transform._add_to_on_rot_change(self._recalculate_rot)
 
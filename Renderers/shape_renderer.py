@@ -47,4 +47,4 @@ class ShapeRenderer(RendererBase):
 
     @property
     def _absolute_center(self) -> Vector2Anot:
-        return __U2P__Point__(self.transform.position)
+        return __U2P__Point__(self.transform._render_position)
@@ -232,3 +232,37 @@ class ShapeBox(ShapeBase):
     def redii_br(self, value: int):
         type_check("redii_br", value, int)
         self.__redii_br = value
+
+
+class ShapePolygon(ShapeBase):
+    def __init__(self, points: list[Vector2], edge_size: int = 5):
+        super(ShapePolygon, self).__init__(edge_size)
+        self.__points = points
+        self.__py_points = None  # Recalculated on the next render after the transform changes
+
+    @property
+    def points(self) -> list[Vector2]:
+        return self.__points
+
+    @points.setter
+    def points(self, value: list[Vector2]):
+        type_check("points", value, list)
+        for point in value: types_check("point", point, Vector2)
+        self.__points = value
+        self.__py_points = None
+
+    def _recalculate_pos(self):
+        self.__py_points = None
+
+    def _recalculate_scale(self):
+        self.__py_points = None
+
+    def _recalculate_rot(self):
+        self.__py_points = None
+
+    def _render(self):
+        if self.__py_points is None:
+            trans = self._rend.transform
+            rot, scale, pos = trans.rotation, trans.lossy_scale, trans._render_position
+            self.__py_points = [__U2P__Point__((point * scale).rotate(rot) + pos) for point in self.__points]
+        Camera._draw_polygon(self.__py_points, self._rend.color, self.edge_size)
@@ -63,7 +63,7 @@ class TextRenderer(RendererBase):
             return
 
         rect = self.__surf.get_rect().center
-        p = __U2P__Point__(self.transform.position)
+        p = __U2P__Point__(self.transform._render_position)
         self.__pPos = Vector2(p.x - rect[0], p.y - rect[1])
 
     def _recalculate_rot(self):
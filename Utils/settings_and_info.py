@@ -10,6 +10,8 @@ from MiniGames.Utils import decorators
 if TYPE_CHECKING:
     from MiniGames.Utils.vector2 import Vector2 as Vector2Anot
     from MiniGames.Pipeline.application import Application as ApplicationAnot
+    from MiniGames.Physics.physics_system import PhysicsSystem as PhysicsSystemAnot
+    from MiniGames.Pipeline.archetypes import ComponentWorld as ComponentWorldAnot
 
 
 class SettingsClass:
@@ -61,14 +63,65 @@ class SettingsClass:
 
     @property
     def collision_threads_count(self) -> int:
+        """
+        More than 1 runs the narrow phase on a pool of that many processes.
+        The pool is created when the physics loop starts, changes while it runs apply the next time it starts
+        """
         return __collision_threads__
 
     @collision_threads_count.setter
     def collision_threads_count(self, value: int):
         type_check("collision_threads_count", value, int)
+        if value <= 0: raise ValueError("collision_threads_count can't be negative or zero")
         global __collision_threads__
         __collision_threads__ = value
 
+    @property
+    def broadphase(self) -> str:
+        return __broadphase__
+
+    @broadphase.setter
+    def broadphase(self, value: str):
+        type_check("broadphase", value, str)
+        if value not in __broadphases__:
+            raise ValueError(f"Invalid broadphase \'{value}\', expected one of {', '.join(__broadphases__)}")
+        global __broadphase__
+        __broadphase__ = value
+
+    @property
+    def spatial_hash_cell_size(self) -> float:
+        return __spatial_hash_cell_size__
+
+    @spatial_hash_cell_size.setter
+    def spatial_hash_cell_size(self, value: float):
+        type_check_num("spatial_hash_cell_size", value)
+        if value <= 0: raise ValueError("spatial_hash_cell_size can't be negative or zero")
+        global __spatial_hash_cell_size__
+        __spatial_hash_cell_size__ = value
+
+    def set_layers_collision(self, layer1: int, layer2: int, collide: bool):
+        """
+        Sets whether colliders on :param layer1: can collide with colliders on :param layer2:
+        """
+        type_check("layer1", layer1, int)
+        type_check("layer2", layer2, int)
+        type_check("collide", collide, bool)
+        check_layer("layer1", layer1)
+        check_layer("layer2", layer2)
+        if collide:
+            __layer_masks__[layer1] |= 1 << layer2
+            __layer_masks__[layer2] |= 1 << layer1
+        else:
+            __layer_masks__[layer1] &= ~(1 << layer2)
+            __layer_masks__[layer2] &= ~(1 << layer1)
+
+    def get_layers_collision(self, layer1: int, layer2: int) -> bool:
+        type_check("layer1", layer1, int)
+        type_check("layer2", layer2, int)
+        check_layer("layer1", layer1)
+        check_layer("layer2", layer2)
+        return bool(__layer_masks__[layer1] & (1 << layer2))
+
     @property
     def half_screen_width(self):
         return __HSW__
@@ -210,6 +263,128 @@ class SettingsClass:
         global __frame_rate__
         __frame_rate__ = value
 
+    @property
+    def physics_rate(self) -> int:
+        """
+        Physics steps per second, every step advances the simulation by exactly 1 / physics_rate seconds
+        """
+        return __physics_rate__
+
+    @physics_rate.setter
+    def physics_rate(self, value: int):
+        type_check("physics_rate", value, int)
+        if value <= 0: raise ValueError("physics_rate can't be negative or zero")
+        global __physics_rate__
+        __physics_rate__ = value
+
+    @property
+    def max_physics_substeps(self) -> int:
+        """
+        Most steps the physics loop takes to catch up with real time, time it can't catch up with is dropped
+        """
+        return __max_physics_substeps__
+
+    @max_physics_substeps.setter
+    def max_physics_substeps(self, value: int):
+        type_check("max_physics_substeps", value, int)
+        if value <= 0: raise ValueError("max_physics_substeps can't be negative or zero")
+        global __max_physics_substeps__
+        __max_physics_substeps__ = value
+
+    @property
+    def solver_iterations(self) -> int:
+        """
+        Iterations of the contact solver per physics step, more makes stacks stiffer and costs more
+        """
+        return __solver_iterations__
+
+    @solver_iterations.setter
+    def solver_iterations(self, value: int):
+        type_check("solver_iterations", value, int)
+        if value <= 0: raise ValueError("solver_iterations can't be negative or zero")
+        global __solver_iterations__
+        __solver_iterations__ = value
+
+    @property
+    def position_correction(self) -> float:
+        """
+        Fraction (0 to 1) of the penetration between colliders that is fixed every physics step
+        """
+        return __position_correction__
+
+    @position_correction.setter
+    def position_correction(self, value: float):
+        type_check_num("position_correction", value)
+        if not 0 <= value <= 1: raise ValueError("position_correction must be between 0 and 1")
+        global __position_correction__
+        __position_correction__ = value
+
+    @property
+    def penetration_slop(self) -> float:
+        """
+        Penetration (in units) that is allowed to remain, so resting contacts don't flicker between touching and not
+        """
+        return __penetration_slop__
+
+    @penetration_slop.setter
+    def penetration_slop(self, value: float):
+        type_check_num("penetration_slop", value)
+        if value < 0: raise ValueError("penetration_slop can't be negative")
+        global __penetration_slop__
+        __penetration_slop__ = value
+
+    @property
+    def sleep_velocity(self) -> float:
+        """
+        RigidBodies slower than this (units per second) for time_to_sleep seconds fall asleep
+        """
+        return __sleep_velocity__
+
+    @sleep_velocity.setter
+    def sleep_velocity(self, value: float):
+        type_check_num("sleep_velocity", value)
+        if value < 0: raise ValueError("sleep_velocity can't be negative")
+        global __sleep_velocity__
+        __sleep_velocity__ = value
+
+    @property
+    def time_to_sleep(self) -> float:
+        return __time_to_sleep__
+
+    @time_to_sleep.setter
+    def time_to_sleep(self, value: float):
+        type_check_num("time_to_sleep", value)
+        if value < 0: raise ValueError("time_to_sleep can't be negative")
+        global __time_to_sleep__
+        __time_to_sleep__ = value
+
+    @property
+    def profile_physics(self) -> bool:
+        """
+        Records how long every phase of every physics step takes, see Info.physics_profile
+        """
+        return __profile_physics__
+
+    @profile_physics.setter
+    def profile_physics(self, value: bool):
+        type_check("profile_physics", value, bool)
+        global __profile_physics__
+        __profile_physics__ = value
+
+    @property
+    def profile_window(self) -> int:
+        """
+        Number of the latest physics steps the profiler keeps
+        """
+        return __profile_window__
+
+    @profile_window.setter
+    def profile_window(self, value: int):
+        type_check("profile_window", value, int)
+        if value <= 0: raise ValueError("profile_window can't be negative or zero")
+        global __profile_window__
+        __profile_window__ = value
+
     @property
     def draw_grid(self) -> bool:
         return __draw_grid__
@@ -221,6 +396,11 @@ class SettingsClass:
         __draw_grid__ = value
 
 
+def check_layer(name: str, layer: int):
+    if not 0 <= layer < LAYERS_COUNT:
+        raise ValueError(f"Invalid value for \'{name}\': layers go from 0 to {LAYERS_COUNT - 1}, got {layer}")
+
+
 class InfoClass:
     @decorators.inner_method
     def __init__(self): pass
@@ -228,12 +408,45 @@ class InfoClass:
     @property
     def instance(self) -> ApplicationAnot: return __instance__
 
+    @property
+    def physics(self) -> PhysicsSystemAnot:
+        """
+        :return: The physics system, for spatial queries (raycast, overlap_circle, overlap_box, query_nearest)
+        """
+        return __instance__._Application__phy_sym
+
+    @property
+    def components(self) -> ComponentWorldAnot:
+        """
+        :return: The archetype tables of DataComponents, to add Systems to and query
+        """
+        return __instance__._Application__world
+
     @property
     def fixedDeltaTime(self) -> float: return __fixedDeltaTime__
 
     @property
     def deltaTime(self) -> float: return __deltaTime__
 
+    @property
+    def physics_alpha(self) -> float:
+        """
+        :return: How far (0 to 1) real time is between the last physics step and the next one, for interpolating rendered positions
+        """
+        if __instance__ is None: return 0.0
+        return __instance__._Application__phy_sym.render_alpha
+
+    @property
+    def physics_profile(self) -> dict[str, dict[str, float]]:
+        """
+        Only recorded while Settings.profile_physics is on. Info.physics.profiler.dump writes it to a csv or json file.
+        :return: {"step", a phase or a counter: {"p50", "p90", "p99", "max": value}} over the last Settings.profile_window steps.
+        Phases (seconds): fixed_update, broadphase, narrowphase, events, solver, integration, other.
+        Counters (per step): pairs (from the broadphase), gjk_calls, hits
+        """
+        if __instance__ is None: return {}
+        return __instance__._Application__phy_sym.profiler.stats()
+
     @property
     def time(self) -> float: return __time__
 
@@ -254,11 +467,25 @@ class InfoClass:
 
 __gravity__ = mod_v2.Vector2(0, -9.8)
 __frame_rate__ = 60
+__physics_rate__ = 60
+__max_physics_substeps__ = 5
+__solver_iterations__ = 8
+__position_correction__ = 0.2
+__penetration_slop__ = 0.01
+__sleep_velocity__ = 0.05
+__time_to_sleep__ = 0.5
+__profile_physics__ = False
+__profile_window__ = 300
 __HSW__ = 0  # HalfScreenWidth
 __HSH__ = 0  # HalfScreenHeight
 __space_scale__ = mod_v2.Vector2(100, 100)  # How many pixels equal one unit
 __draw_grid__ = True
 __collision_threads__ = 1
+__broadphases__ = ("all_pairs", "spatial_hash", "sweep_and_prune")
+__broadphase__ = "spatial_hash"
+__spatial_hash_cell_size__ = 2  # In units, should be around the size of a typical collider
+LAYERS_COUNT = 32
+__layer_masks__ = [(1 << LAYERS_COUNT) - 1] * LAYERS_COUNT  # bit j of __layer_masks__[i] is set, if layers i and j collide
 __draw_colliders__ = True
 __colliders_color__ = Color.collider_green()
 __colliders_thickness__ = 1
@@ -22,6 +22,9 @@ class Vector2:
         yield self.__X
         yield self.__Y
 
+    def __call__(self) -> tuple[float, float]:
+        return self.__X, self.__Y
+
     def __repr__(self):
         return self.__str__()
 
@@ -184,6 +187,17 @@ class Vector2:
         y = (random.random() * (y_max - y_min)) + y_min
         return Vector2(round(x / step) * step, round(y / step) * step)
 
+    @staticmethod
+    def _unchecked(x: float, y: float) -> Vector2:
+        """
+        Same as Vector2(x, y) without the type checks, for engine hot paths that already hold floats
+        """
+        vec = Vector2.__new__(Vector2)
+        vec.__X = round(x, 5)
+        vec.__Y = round(y, 5)
+        vec.__allow_modification = True
+        return vec
+
     @staticmethod
     def zero():
         return Vector2(0, 0)
@@ -213,7 +227,7 @@ class Vector2:
         types_check("u", u, Vector2)
         types_check("v", v, Vector2)
         types_check("w", w, Vector2)
-        return v * u.dot(w) - w * u.dot(v)
+        return v * u.dot(w) - u * v.dot(w)
 
     @staticmethod
     def direction_vector(angle: float):
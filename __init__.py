@@ -9,10 +9,12 @@ from MiniGames.Utils.settings_and_info import Settings, Info
 from MiniGames.Utils.vector2 import Vector2
 from MiniGames.Physics.collider_base import ColliderBase
 from MiniGames.Pipeline.monobehaviour import MonoBehaviour
+from MiniGames.Pipeline.archetypes import DataComponent, System
 from MiniGames.Physics.rigidbody import RigidBody
-from MiniGames.Renderers.shapes import ShapeCircle, ShapeArrow, ShapeBox, ShapeBase
+from MiniGames.Renderers.shapes import ShapeCircle, ShapeArrow, ShapeBox, ShapePolygon, ShapeBase
 from MiniGames.Physics.box_collider import BoxCollider
 from MiniGames.Physics.circle_collider import CircleCollider
+from MiniGames.Physics.polygon_collider import PolygonCollider
 from MiniGames.Utils.resources import Resources
 from MiniGames.Renderers.line_renderer import LineRenderer
 from MiniGames.Renderers.point_renderer import PointRenderer